@@ -3,12 +3,30 @@ from .algorithms import (
     depth_first_search,
     dijkstra,
     dijkstra_to,
+    a_star,
+    shortest_path,
+    iter_nearest,
+    nearest_k,
+    distance_table,
+    parallel_single_source,
     bellman_ford,
     floyd_warshall,
+    floyd_warshall_matrix,
+    johnson,
     kruskal,
     prim_jarnik
 )
-from .exceptions import VertexError, EdgeError
-from .basegraph import BaseGraph
+from .heuristics import euclidean_heuristic, haversine_heuristic
+from .disjointset import DisjointSet
+from .exceptions import VertexError, EdgeError, NegativeCycleError
+from .basegraph import BaseGraph, JournalEntry
+from .csr import CSRGraph, EdgeAttribute
 from .graph import Graph
 from .digraph import Digraph
+from .overlay import GraphOverlay
+from .io import read_edgelist
+from .assignment import Assignment, solve_assignment
+from .contraction import ContractionHierarchy
+from .landmarks import Landmarks
+from .cache import CacheInfo, PathCache
+from .matrix import PathMatrix
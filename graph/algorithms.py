@@ -1,13 +1,63 @@
-from typing import Callable, Hashable
+from typing import (Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional,
+                    Sequence, Tuple, Union)
 
+from array import array
 from collections import deque
+from heapq import heapify, heappop, heappush
+from itertools import count, islice
 from random import choice
 from math import inf
 
 from .basegraph import BaseGraph
+from .csr import CSRGraph
+from .disjointset import DisjointSet
+from .exceptions import VertexError, EdgeError, NegativeCycleError
+from .matrix import PathMatrix, _floyd_warshall_strips
+from .parallel import _WEIGHT, _map, _snapshot
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it's only needed by the vectorized methods
+    np = None
 
-def breath_first_search(graph: BaseGraph, start_vertex: Hashable):
+
+AnyGraph = Union[BaseGraph, CSRGraph]
+
+# a vertex or a position (vertex u, vertex v, percentage) along the edge from u to v
+Endpoint = Union[Hashable, Tuple[Hashable, Hashable, float]]
+
+
+def _weighted_successors(graph: AnyGraph, weight: Callable[[dict], float]
+                         ) -> Callable[[Hashable], Iterable[Tuple[Hashable, float]]]:
+    """Returns a function that lists the heads and weights of the out-edges of a vertex.
+
+    The vertex isn't validated, it must be in the graph.
+    """
+    if isinstance(graph, CSRGraph):
+        return lambda u: graph.weighted_successors(u, weight)
+
+    edges = graph.edges
+    empty = {}
+    return lambda u: ((v, weight(d)) for v, d in edges.get(u, empty).items())
+
+
+def _weighted_predecessors(graph: AnyGraph, weight: Callable[[dict], float]
+                           ) -> Callable[[Hashable], Iterable[Tuple[Hashable, float]]]:
+    """Returns a function that lists the tails and weights of the in-edges of a vertex.
+
+    The vertex isn't validated, it must be in the graph.
+    """
+    if isinstance(graph, CSRGraph):
+        return lambda v: graph.weighted_predecessors(v, weight)
+    if not graph.is_directed():
+        return _weighted_successors(graph, weight)
+
+    in_edges = graph.in_edges
+    empty = {}
+    return lambda v: ((u, weight(d)) for u, d in in_edges.get(v, empty).items())
+
+
+def breath_first_search(graph: AnyGraph, start_vertex: Hashable):
     frontier = deque([start_vertex])
     discovered = {start_vertex}
     parents = {start_vertex: None}
@@ -23,7 +73,7 @@ def breath_first_search(graph: BaseGraph, start_vertex: Hashable):
     return discovered, parents
 
 
-def depth_first_search(graph: BaseGraph, start_vertex: Hashable):
+def depth_first_search(graph: AnyGraph, start_vertex: Hashable):
     frontier = deque([start_vertex])
     discovered = set()
     parents = {start_vertex: None}
@@ -39,42 +89,240 @@ def depth_first_search(graph: BaseGraph, start_vertex: Hashable):
     return discovered, parents
 
 
-def dijkstra(graph: BaseGraph, start_vertex: Hashable, weight: Callable[[dict], int]):
-    vertices = set(graph.vertices)
-    distance = {}
-    parents = {}
-    for v in vertices:
-        distance[v] = inf
-        parents[v] = None
+def _settle(successors: Callable[[Hashable], Iterable[Tuple[Hashable, float]]],
+            distance: Dict[Hashable, float], parents: Dict[Hashable, Hashable],
+            sources: Iterable[Hashable],
+            potential: Callable[[Hashable], float] = None) -> Iterator[Hashable]:
+    """Yields each vertex as it's settled by Dijkstra's algorithm, closest first.
 
-    distance[start_vertex] = 0
+    A binary heap with lazy deletion is used, so the search costs O((V + E) log V). The given
+    distance and parents dictionaries are updated in place, the distance of each source must be
+    set beforehand and vertices without a distance are treated as unreached. The caller may stop
+    iterating at any time, e.g. once the wanted vertex is settled.
 
-    while vertices:
-        u = min(vertices, key=lambda x: distance[x])
-        vertices.remove(u)
-        for v in graph.neighbours(u):
-            temp_distance = distance[u] + weight(graph.edges[u][v])
+    When a potential (a consistent lower bound of the distance to the goal) is given, the
+    vertices are settled by their distance plus potential instead, which is A*.
+    """
+    if potential is None:
+        potential = _no_potential
+
+    counter = count()  # tie-breaker, the vertices don't need to be comparable
+    heap = [(distance[s] + potential(s), next(counter), s) for s in sources]
+    heapify(heap)
+    settled = set()
+
+    while heap:
+        _, _, u = heappop(heap)
+        if u in settled:
+            continue
+
+        settled.add(u)
+        yield u
+
+        d = distance[u]
+        for v, w in successors(u):
+            temp_distance = d + w
+            if temp_distance < distance.get(v, inf):
+                distance[v] = temp_distance
+                parents[v] = u
+                heappush(heap, (temp_distance + potential(v), next(counter), v))
+
+
+def _settle_ids(graph: CSRGraph, weight: Callable[[dict], float], distance: List[float],
+                parents: List[int], sources: Iterable[int],
+                potential: Callable[[int], float] = None) -> Iterator[int]:
+    """Yields each vertex id as it's settled, like ``_settle`` but over the arrays of the
+    snapshot, so the vertices aren't looked up nor their out-edges copied. The distance and
+    parents (-1 if none) lists are by vertex id and unreached vertices have an inf distance.
+    """
+    if potential is None:
+        potential = _no_potential
+
+    offsets, targets, edge_data = graph.offsets, graph.targets, graph.edge_data
+    # noinspection PyProtectedMember
+    weights = graph._stored_weights(weight)
+
+    counter = count()  # tie-breaker, like in _settle, so both settle in the same order
+    heap = [(distance[s] + potential(s), next(counter), s) for s in sources]
+    heapify(heap)
+    settled = [False] * graph.order()
+
+    while heap:
+        _, _, u = heappop(heap)
+        if settled[u]:
+            continue
+
+        settled[u] = True
+        yield u
+
+        d = distance[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            temp_distance = d + (weight(edge_data[k]) if weights is None else weights[k])
             if temp_distance < distance[v]:
                 distance[v] = temp_distance
                 parents[v] = u
+                heappush(heap, (temp_distance + potential(v), next(counter), v))
 
-    return distance, parents
 
+def _no_potential(_: Hashable) -> float:
+    return 0
 
-def dijkstra_to(graph: BaseGraph, start_vertex: Hashable, end_vertex: Hashable,
-                weight: Callable[[dict], int]):
-    vertices = set(graph.vertices)
-    distance = {}
-    parents = {}
-    for v in vertices:
-        distance[v] = inf
-        parents[v] = None
 
+def dijkstra(graph: AnyGraph, start_vertex: Hashable, weight: Callable[[dict], int],
+             stats: dict = None, max_distance: float = None, targets: Iterable[Hashable] = None):
+    """Finds the shortest paths from a vertex to every other vertex with Dijkstra's algorithm.
+
+    The search can stop early, once it's past a radius (e.g. for isochrones or the drivers
+    within range) or once a set of targets is settled, in which case only the vertices settled
+    by then are in the result.
+
+    Args:
+        graph: The graph.
+        start_vertex: The vertex where the paths start.
+        weight: The function that will extract the weight value of the edge's data.
+        stats: A dictionary that will receive the number of settled vertices.
+        max_distance: The distance past which the search stops.
+        targets: The vertices after which the search stops, once all of them are settled.
+
+    Returns:
+        A tuple composed of the distance and the parent of each vertex (inf and None if
+        unreachable), or, if the search stopped early, of each settled vertex.
+    """
+    if isinstance(graph, CSRGraph):
+        return _dijkstra_snapshot(graph, start_vertex, weight, stats, max_distance, targets)
+
+    if max_distance is None and targets is None:
+        distance = dict.fromkeys(graph.vertices, inf)
+        parents = dict.fromkeys(distance)
+    else:
+        distance, parents = {}, {start_vertex: None}
     distance[start_vertex] = 0
 
-    while vertices:
-        u = min(vertices, key=lambda x: distance[x])
-        vertices.remove(u)
+    remaining = None if targets is None else set(targets)
+    settled = {}
+    for u in _settle(_weighted_successors(graph, weight), distance, parents, [start_vertex]):
+        if max_distance is not None and distance[u] > max_distance:
+            break
+        settled[u] = distance[u]
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+
+    if stats is not None:
+        stats['settled'] = len(settled)
+
+    if max_distance is None and targets is None:
+        return distance, parents
+
+    return settled, {v: parents[v] for v in settled}
+
+
+def _dijkstra_snapshot(graph: CSRGraph, start_vertex: Hashable, weight: Callable[[dict], float],
+                       stats: Optional[dict], max_distance: Optional[float],
+                       targets: Optional[Iterable[Hashable]]):
+    """Runs ``dijkstra`` over the vertex ids of the snapshot, translating them back to the
+    vertices only for the result."""
+    labels = graph.labels
+    source = graph.index(start_vertex)
+    distance, parents = [inf] * graph.order(), [-1] * graph.order()
+    distance[source] = 0
+
+    remaining = None if targets is None else set(targets)
+    settled = []
+    for u in _settle_ids(graph, weight, distance, parents, [source]):
+        if max_distance is not None and distance[u] > max_distance:
+            break
+        settled.append(u)
+        if remaining is not None:
+            remaining.discard(labels[u])
+            if not remaining:
+                break
+
+    if stats is not None:
+        stats['settled'] = len(settled)
+
+    if max_distance is None and targets is None:
+        settled = range(len(labels))
+    return ({labels[u]: distance[u] for u in settled},
+            {labels[u]: None if parents[u] == -1 else labels[parents[u]] for u in settled})
+
+
+def _bidirectional_dijkstra(graph: AnyGraph, start_vertex: Hashable, end_vertex: Hashable,
+                            weight: Callable[[dict], int], stats: dict = None):
+    """Searches forward from the start vertex and backward from the end vertex, always
+    advancing the search with the closest frontier, and stops once the sum of both frontiers
+    reaches the shortest path seen so far.
+    """
+    successors = (_weighted_successors(graph, weight), _weighted_predecessors(graph, weight))
+    distance = ({start_vertex: 0}, {end_vertex: 0})
+    parents = ({start_vertex: None}, {end_vertex: None})
+    settled = (set(), set())
+    counter = count()  # tie-breaker, the vertices don't need to be comparable
+    heaps = ([(0, next(counter), start_vertex)], [(0, next(counter), end_vertex)])
+
+    best, meeting_vertex = (0, start_vertex) if start_vertex == end_vertex else (inf, None)
+
+    while heaps[0] and heaps[1] and heaps[0][0][0] + heaps[1][0][0] < best:
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, _, u = heappop(heaps[side])
+        if u in settled[side]:
+            continue
+
+        settled[side].add(u)
+        this_distance, other_distance = distance[side], distance[1 - side]
+        for v, w in successors[side](u):
+            temp_distance = d + w
+            if temp_distance < this_distance.get(v, inf):
+                this_distance[v] = temp_distance
+                parents[side][v] = u
+                heappush(heaps[side], (temp_distance, next(counter), v))
+
+                if v in other_distance and temp_distance + other_distance[v] < best:
+                    best, meeting_vertex = temp_distance + other_distance[v], v
+
+    if stats is not None:
+        stats['settled'] = len(settled[0]) + len(settled[1])
+
+    if meeting_vertex is None:
+        return None
+
+    cost, path = {start_vertex: 0, end_vertex: best}, [u := meeting_vertex]
+    while u != start_vertex:
+        cost[u] = distance[0][u]
+        path.append(u := parents[0][u])
+    path.reverse()
+
+    u = meeting_vertex
+    while u != end_vertex:
+        path.append(u := parents[1][u])
+        cost[u] = best - distance[1][u]
+    return cost, path
+
+
+def dijkstra_to(graph: AnyGraph, start_vertex: Hashable, end_vertex: Hashable,
+                weight: Callable[[dict], int], stats: dict = None, bidirectional: bool = False):
+    if bidirectional:
+        return _bidirectional_dijkstra(graph, start_vertex, end_vertex, weight, stats)
+
+    return _search_to(graph, start_vertex, end_vertex, weight, stats)
+
+
+def _search_to(graph: AnyGraph, start_vertex: Hashable, end_vertex: Hashable,
+               weight: Callable[[dict], int], stats: Optional[dict],
+               potential: Callable[[Hashable], float] = None):
+    if isinstance(graph, CSRGraph):
+        return _search_to_snapshot(graph, start_vertex, end_vertex, weight, stats, potential)
+
+    distance = {start_vertex: 0}
+    parents = {start_vertex: None}
+
+    settled = 0
+    result = None
+    for u in _settle(_weighted_successors(graph, weight), distance, parents, [start_vertex],
+                     potential):
+        settled += 1
 
         if u == end_vertex:
             cost, path = {start_vertex: 0, u: distance[u]}, [u]
@@ -84,41 +332,614 @@ def dijkstra_to(graph: BaseGraph, start_vertex: Hashable, end_vertex: Hashable,
                 path.append(u := parents[u])
 
             path.reverse()
-            return cost, path
+            result = cost, path
+            break
 
-        for v in graph.neighbours(u):
-            temp_distance = distance[u] + weight(graph.edges[u][v])
-            if temp_distance < distance[v]:
-                distance[v] = temp_distance
-                parents[v] = u
+    if stats is not None:
+        stats['settled'] = settled
+
+    return result
+
+
+def _search_to_snapshot(graph: CSRGraph, start_vertex: Hashable, end_vertex: Hashable,
+                        weight: Callable[[dict], float], stats: Optional[dict],
+                        potential: Optional[Callable[[Hashable], float]]):
+    """Runs ``_search_to`` over the vertex ids of the snapshot, translating them back to the
+    vertices only for the result."""
+    labels = graph.labels
+    source = graph.index(start_vertex)
+    target = graph.index(end_vertex) if end_vertex in graph else -1
+    distance, parents = [inf] * graph.order(), [-1] * graph.order()
+    distance[source] = 0
+    if potential is not None:
+        label_potential = potential
+
+        def potential(i: int) -> float:
+            return label_potential(labels[i])
+
+    settled = 0
+    result = None
+    for u in _settle_ids(graph, weight, distance, parents, [source], potential):
+        settled += 1
+
+        if u == target:
+            cost, path = {start_vertex: 0, labels[u]: distance[u]}, [u]
+
+            while u != source:
+                cost[labels[u]] = distance[u]
+                path.append(u := parents[u])
+
+            path.reverse()
+            result = cost, [labels[u] for u in path]
+            break
+
+    if stats is not None:
+        stats['settled'] = settled
+
+    return result
+
+
+def a_star(graph: AnyGraph, start_vertex: Hashable, end_vertex: Hashable,
+           weight: Callable[[dict], int], heuristic: Callable[[dict, dict], float],
+           stats: dict = None):
+    """Finds the shortest path between two vertices with the A* search.
+
+    Args:
+        graph: The graph.
+        start_vertex: The vertex where the path starts.
+        end_vertex: The vertex where the path ends.
+        weight: The function that will extract the weight value of the edge's data.
+        heuristic: The function that estimates the distance between two vertices from their
+            data (the data of a vertex and the data of the end vertex), e.g.
+            ``euclidean_heuristic()``. It must never overestimate the distance.
+        stats: A dictionary that will receive the number of settled vertices.
+
+    Returns:
+        The same as ``dijkstra_to``.
+
+    Raises:
+        VertexError: Raises when the end vertex isn't in the graph.
+    """
+    end_data = graph.get_vertex_data(end_vertex)
+    estimates = {}
+
+    def potential(v: Hashable) -> float:
+        if v not in estimates:
+            estimates[v] = heuristic(graph.get_vertex_data(v), end_data)
+        return estimates[v]
+
+    return _search_to(graph, start_vertex, end_vertex, weight, stats, potential)
+
+
+def _is_edge_position(graph: AnyGraph, endpoint: Endpoint) -> bool:
+    """Checks if the endpoint is a position along an edge, vertices take precedence."""
+    return not graph.has_vertex(endpoint) and isinstance(endpoint, tuple) and len(endpoint) == 3
+
+
+def _endpoint_seeds(graph: AnyGraph, endpoint: Endpoint, weight: Callable[[dict], float],
+                    forward: bool) -> List[Tuple[Hashable, float]]:
+    """Returns the vertices where the paths from (or, if not forward, to) the endpoint start
+    (end) and their distances to the endpoint.
+
+    A vertex is its own seed, a position along an edge is seeded with the part of the edge
+    between it and each endpoint of the edge it can travel to (or from).
+    """
+    if not _is_edge_position(graph, endpoint):
+        if not graph.has_vertex(endpoint):
+            raise VertexError(f"vertex '{endpoint}' isn't in the graph '{graph}'")
+        return [(endpoint, 0)]
+
+    vertex_u, vertex_v, percentage = endpoint
+    if not 0 <= percentage <= 1:
+        raise ValueError(f"percentage of the position '{endpoint}' isn't between 0 and 1")
+    if not graph.has_edge(vertex_u, vertex_v):
+        raise EdgeError(f"edge '{{{vertex_u}, {vertex_v}}}' isn't in the graph '{graph}'")
+
+    edge_weight = weight(graph.get_edge_data(vertex_u, vertex_v))
+    to_u, to_v = edge_weight * percentage, edge_weight * (1 - percentage)
+    if graph.is_directed():
+        return [(vertex_v, to_v)] if forward else [(vertex_u, to_u)]
+    return [(vertex_u, to_u), (vertex_v, to_v)]
+
+
+def _direct_distance(graph: AnyGraph, source: Endpoint, target: Endpoint,
+                     weight: Callable[[dict], float]) -> Optional[float]:
+    """Returns the distance between two positions along the same edge without leaving it, or
+    None if they aren't along the same edge or the target is behind a directed edge's source.
+    """
+    if not _is_edge_position(graph, source) or not _is_edge_position(graph, target):
+        return None
+
+    (vertex_u, vertex_v, p), (vertex_x, vertex_y, q) = source, target
+    if (vertex_x, vertex_y) != (vertex_u, vertex_v):
+        if graph.is_directed() or (vertex_x, vertex_y) != (vertex_v, vertex_u):
+            return None
+        q = 1 - q
+    if graph.is_directed() and q < p:
+        return None
+
+    return abs(q - p) * weight(graph.get_edge_data(vertex_u, vertex_v))
+
+
+def _iter_nearest(graph: AnyGraph, source: Endpoint,
+                  candidates: Iterable[Tuple[Hashable, Endpoint]],
+                  weight: Callable[[dict], float], stats: Optional[dict],
+                  reverse: bool = False, paths: bool = True
+                  ) -> Iterator[Tuple[Hashable, Union[Dict[Endpoint, float], float],
+                                      Optional[List[Endpoint]]]]:
+    """Yields the candidates (pairs of a name and an endpoint) reachable from the source,
+    closest first, each with the cost and the path like ``dijkstra_to``, or only with the
+    distance (and None) if not paths.
+
+    A single search seeded with the source is settled incrementally. A candidate is yielded as
+    soon as no vertex left to settle can reach it through a shorter path, so the search only
+    goes as far as the candidates consumed by the caller, and stops once all are yielded. If
+    reverse, the paths from the candidates to the source are searched, backwards.
+    """
+    successors = (_weighted_predecessors if reverse else _weighted_successors)(graph, weight)
+
+    distance, parents = {}, {}
+    for v, offset in _endpoint_seeds(graph, source, weight, forward=not reverse):
+        if offset < distance.get(v, inf):
+            distance[v], parents[v] = offset, None
+
+    # the vertices where each candidate is reached and the rest of the way to it
+    entries = {}
+    best = {}  # candidate -> (distance, last vertex of the path, None if along the same edge)
+    counter = count()  # tie-breaker, the candidates don't need to be comparable
+    heap = []
+    endpoints = {}
+    for c, endpoint in candidates:
+        endpoints[c] = endpoint
+        for v, offset in _endpoint_seeds(graph, endpoint, weight, forward=reverse):
+            entries.setdefault(v, []).append((c, offset))
+        tail, head = (endpoint, source) if reverse else (source, endpoint)
+        if (direct := _direct_distance(graph, tail, head, weight)) is not None:
+            best[c] = direct, None
+            heappush(heap, (direct, next(counter), c))
+
+    def found(c: Hashable) -> Tuple[Hashable, Union[Dict[Endpoint, float], float],
+                                    Optional[List[Endpoint]]]:
+        (d, u), endpoint = best[c], endpoints[c]
+        if not paths:
+            return c, d, None
+
+        cost, path = {source: 0}, []
+        while u is not None:
+            cost[u] = distance[u]
+            path.append(u)
+            u = parents[u]
+        if not path or path[-1] != source:
+            path.append(source)
+        path.reverse()
+
+        if path[-1] != endpoint:
+            path.append(endpoint)
+        cost[endpoint] = d
+        return c, cost, path
+
+    yielded = set()
+    settled = 0
+    for u in _settle(successors, distance, parents, list(distance)):
+        if len(yielded) == len(endpoints):
+            break
+
+        settled += 1
+        if stats is not None:
+            stats['settled'] = settled
+
+        for c, offset in entries.get(u, ()):
+            if c not in yielded and distance[u] + offset < best.get(c, (inf,))[0]:
+                best[c] = distance[u] + offset, u
+                heappush(heap, (distance[u] + offset, next(counter), c))
+
+        # no candidate found so far can get closer than the vertex just settled
+        while heap and heap[0][0] <= distance[u]:
+            _, _, c = heappop(heap)
+            if c not in yielded:
+                yielded.add(c)
+                yield found(c)
+
+    if stats is not None:
+        stats['settled'] = settled
+
+    while heap:
+        _, _, c = heappop(heap)
+        if c not in yielded:
+            yielded.add(c)
+            yield found(c)
+
+
+def shortest_path(graph: AnyGraph, source: Endpoint, target: Endpoint,
+                  weight: Callable[[dict], float], stats: dict = None):
+    """Finds the shortest path between two endpoints, each a vertex or a position along an edge.
+
+    A position is a tuple of vertex u, vertex v and the percentage (0-1) of the edge from u to v
+    travelled from u, e.g. ``(u, v, .3)``. The search starts from both parts of the source's edge
+    and ends in either part of the target's edge, so the graph isn't changed and many queries
+    can share it.
+
+    Args:
+        graph: The graph.
+        source: The vertex or position where the path starts.
+        target: The vertex or position where the path ends.
+        weight: The function that will extract the weight value of the edge's data.
+        stats: A dictionary that will receive the number of settled vertices.
+
+    Returns:
+        The same as ``dijkstra_to``, with the positions as the first and last steps of the path.
+
+    Raises:
+        VertexError: Raises when an endpoint is neither a vertex of the graph nor a position.
+        EdgeError: Raises when the edge of a position isn't in the graph.
+        ValueError: Raises when the percentage of a position isn't between 0 and 1.
+    """
+    for _, cost, path in _iter_nearest(graph, source, [(target, target)], weight, stats):
+        return cost, path
 
     return None
 
 
-def bellman_ford(graph: BaseGraph, start_vertex: Hashable, weight: Callable[[dict], int]):
-    distance = {}
-    parents = {}
-    for v in graph.vertices:
-        distance[v] = inf
-        parents[v] = None
+def iter_nearest(graph: AnyGraph, source: Endpoint,
+                 candidates: Union[Iterable[Endpoint], Mapping[Hashable, Endpoint]],
+                 weight: Callable[[dict], float], stats: dict = None
+                 ) -> Iterator[Tuple[Hashable, Dict[Endpoint, float], List[Endpoint]]]:
+    """Yields the candidates reachable from the source, closest first, with their shortest paths.
 
-    distance[start_vertex] = 0
+    A single search is run incrementally and only goes as far as the candidates taken from the
+    iterator, so the next closest candidate (e.g. after the first one is rejected) continues
+    the same search instead of starting a new one. The graph must not be changed meanwhile.
 
-    for _ in range(graph.order() - 1):
-        for u, v, d in graph.edges_list():
-            temp_distance = distance[u] + weight(d)
-            if temp_distance < distance[v]:
-                distance[v] = temp_distance
-                parents[v] = u
+    Args:
+        graph: The graph.
+        source: The vertex or position (like in ``shortest_path``) where the paths start.
+        candidates: The vertices or positions searched, or a dictionary of names (e.g. of
+            facilities) and their vertices or positions.
+        weight: The function that will extract the weight value of the edge's data.
+        stats: A dictionary that will receive the number of settled vertices so far.
 
-    for u, v, d in graph.edges_list():
-        if distance[u] + weight(d) < distance[v]:
-            raise ValueError(f"graph {graph} contains negative-weight cycle")
+    Returns:
+        An iterator of triples of a candidate (or its name), the cost and the path like
+        ``shortest_path``. The unreachable candidates are left out.
 
-    return distance, parents
+    Raises:
+        VertexError: Raises when an endpoint is neither a vertex of the graph nor a position.
+        EdgeError: Raises when the edge of a position isn't in the graph.
+        ValueError: Raises when the percentage of a position isn't between 0 and 1.
+    """
+    if isinstance(candidates, Mapping):
+        candidates = candidates.items()
+    else:
+        candidates = ((c, c) for c in candidates)
+
+    return _iter_nearest(graph, source, candidates, weight, stats)
+
+
+def nearest_k(graph: AnyGraph, source: Endpoint,
+              candidates: Union[Iterable[Endpoint], Mapping[Hashable, Endpoint]], k: int,
+              weight: Callable[[dict], float], stats: dict = None
+              ) -> List[Tuple[Hashable, Dict[Endpoint, float], List[Endpoint]]]:
+    """Finds the k candidates closest to the source, the search stops once they're found.
+
+    Args:
+        graph: The graph.
+        source: The vertex or position where the paths start.
+        candidates: The same as ``iter_nearest``.
+        k: The number of candidates.
+        weight: The function that will extract the weight value of the edge's data.
+        stats: A dictionary that will receive the number of settled vertices.
+
+    Returns:
+        A list of up to k triples like the ones of ``iter_nearest``, closest first.
+
+    Raises:
+        VertexError: Raises when an endpoint is neither a vertex of the graph nor a position.
+        EdgeError: Raises when the edge of a position isn't in the graph.
+        ValueError: Raises when the percentage of a position isn't between 0 and 1.
+    """
+    return list(islice(iter_nearest(graph, source, candidates, weight, stats), k))
+
+
+def _distance_row(graph: AnyGraph, weight: Callable[[dict], float], source: Endpoint,
+                  targets: Sequence[Endpoint], reverse: bool) -> List[float]:
+    """Returns the distances from the source to the targets (or, if reverse, from the targets
+    to the source) with a single search that stops once they're all found."""
+    row = [inf] * len(targets)
+    for j, d, _ in _iter_nearest(graph, source, enumerate(targets), weight, None, reverse,
+                                 paths=False):
+        row[j] = d
+    return row
+
+
+def distance_table(graph: AnyGraph, sources: Iterable[Endpoint], targets: Iterable[Endpoint],
+                   weight: Callable[[dict], float], workers: int = None
+                   ) -> Tuple[List[List[float]], Dict[Endpoint, int], Dict[Endpoint, int]]:
+    """Computes the shortest distances between many sources and many targets.
+
+    Each row of the smaller side is a single search that serves all the endpoints of the other
+    side and stops as soon as they're all found (the searches from the targets run backwards).
+    The rows can be spread over a pool of processes, to which the graph is shipped once as a
+    compact snapshot of its topology and weights.
+
+    Args:
+        graph: The graph.
+        sources: The vertices or positions (like in ``shortest_path``) where the paths start,
+            repeated ones are listed once.
+        targets: The vertices or positions where the paths end, repeated ones are listed once.
+        weight: The function that will extract the weight value of the edge's data.
+        workers: The number of worker processes, by default the rows are searched in this
+            process.
+
+    Returns:
+        The distance matrix, a list with a row per source and a column per target (inf if the
+        target is unreachable), the row of each source and the column of each target.
+
+    Raises:
+        VertexError: Raises when an endpoint is neither a vertex of the graph nor a position.
+        EdgeError: Raises when the edge of a position isn't in the graph.
+        ValueError: Raises when the percentage of a position isn't between 0 and 1.
+    """
+    source_index = {s: i for i, s in enumerate(dict.fromkeys(sources))}
+    target_index = {t: j for j, t in enumerate(dict.fromkeys(targets))}
+
+    reverse = len(target_index) < len(source_index)
+    rows, columns = (list(target_index), list(source_index)) if reverse else (
+        list(source_index), list(target_index))
+
+    if workers is not None and workers > 1 and len(rows) > 1:
+        matrix = _map(_distance_row, graph, weight, rows, workers, columns, reverse)
+    else:
+        matrix = [_distance_row(graph, weight, r, columns, reverse) for r in rows]
+
+    if reverse:
+        matrix = [list(row) for row in zip(*matrix)] if matrix else [[] for _ in columns]
+    return matrix, source_index, target_index
+
+
+def _flatten(graph: AnyGraph, weight: Callable[[dict], float]
+             ) -> Tuple[CSRGraph, Sequence[float]]:
+    """Returns a snapshot of the graph, whose out-edges are flat arrays (undirected edges are
+    stored both ways), and the weight of each of its stored edges.
+
+    The weights are listed as the weight function returns them, not stored as floats, so the
+    distances keep their type (e.g. int, Fraction or Decimal) and precision.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_graph(graph)
+
+    return graph, list(map(weight, graph.edge_data))
+
+
+def _parent_cycle(parents: Sequence[int], v: int) -> Optional[List[int]]:
+    """Returns the cycle reached by following the parents from the vertex id, in the edges'
+    direction, or None if the parents reach the root first."""
+    seen = set()
+    while v != -1 and v not in seen:
+        seen.add(v)
+        v = parents[v]
+    if v == -1:
+        return None
+
+    cycle, u = [v], parents[v]
+    while u != v:
+        cycle.append(u)
+        u = parents[u]
+    cycle.append(v)
+    cycle.reverse()
+    return cycle
+
+
+def _relax_passes(n: int, sources: Sequence[int], tails: Sequence[int], heads: Sequence[int],
+                  weights: Sequence[float]) -> Tuple[List[float], List[int], Optional[int]]:
+    """Relaxes every edge in passes from the source vertex ids, until a pass changes nothing.
+    Returns the distances, the parents and a vertex id relaxed in the n-th pass, if any, which
+    means a negative cycle."""
+    distance, parents = [inf] * n, [-1] * n
+    for source in sources:
+        distance[source] = 0
+
+    edges = list(zip(tails, heads, weights))
+    for _ in range(n):
+        relaxed = -1
+        for u, v, w in edges:
+            if distance[u] + w < distance[v]:
+                distance[v], parents[v] = distance[u] + w, u
+                relaxed = v
+        if relaxed == -1:
+            return distance, parents, None
+
+    return distance, parents, relaxed
+
+
+def _relax_queue(n: int, sources: Sequence[int], offsets: Sequence[int], heads: Sequence[int],
+                 weights: Sequence[float]) -> Tuple[List[float], List[int], Optional[int]]:
+    """Relaxes the out-edges of the vertices whose distance changed, in queue order (SPFA).
+    Returns the same as ``_relax_passes``, a vertex id whose path has n edges if any."""
+    distance, parents, lengths = [inf] * n, [-1] * n, [0] * n
+    queue = deque(sources)
+    queued = [False] * n
+    for source in sources:
+        distance[source] = 0
+        queued[source] = True
+    while queue:
+        u = queue.popleft()
+        queued[u] = False
+        d = distance[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = heads[k]
+            if d + weights[k] < distance[v]:
+                distance[v], parents[v], lengths[v] = d + weights[k], u, lengths[u] + 1
+                if lengths[v] >= n:
+                    return distance, parents, v
+                if not queued[v]:
+                    queued[v] = True
+                    queue.append(v)
+
+    return distance, parents, None
+
+
+def _relax_numpy(n: int, sources: Sequence[int], tails: Sequence[int], heads: Sequence[int],
+                 weights: Sequence[float]) -> Tuple[List[float], List[int], Optional[int]]:
+    """Relaxes every edge in vectorized passes, each from the distances of the previous one.
+    Returns the same as ``_relax_passes``."""
+    tails, heads = np.asarray(tails, dtype=np.intp), np.asarray(heads, dtype=np.intp)
+    weights = np.asarray(weights, dtype=float)
+    distance, parents = np.full(n, inf), np.full(n, -1, dtype=np.intp)
+    distance[list(sources)] = 0
+
+    for _ in range(n):
+        candidates = distance[tails] + weights
+        best = distance.copy()
+        np.minimum.at(best, heads, candidates)
+        improved = best < distance
+        if not improved.any():
+            return distance.tolist(), parents.tolist(), None
+
+        edges = np.flatnonzero(improved[heads] & (candidates == best[heads]))
+        parents[heads[edges]] = tails[edges]
+        distance = best
+
+    return distance.tolist(), parents.tolist(), int(np.flatnonzero(improved)[0])
+
+
+def _raise_negative_cycle(graph: AnyGraph, labels: Sequence[Hashable], sources: Sequence[int],
+                          tails: Sequence[int], heads: Sequence[int], weights: Sequence[float],
+                          parents: Sequence[int], relaxed: int):
+    """Raises the negative cycle found by a relaxation method."""
+    cycle = _parent_cycle(parents, relaxed)
+    if cycle is None:  # the parents of the faster methods may not show it, unlike passes
+        _, parents, relaxed = _relax_passes(len(labels), sources, tails, heads, weights)
+        cycle = _parent_cycle(parents, relaxed)
+    raise NegativeCycleError(f"graph {graph} contains negative-weight cycle",
+                             [labels[v] for v in cycle])
+
+
+def _single_source(graph: CSRGraph, weight: Callable[[dict], float], source: Hashable
+                   ) -> Tuple[array, array]:
+    """Returns the distances and parents from the source, as arrays by vertex id. The graph is
+    a snapshot shipped by ``_snapshot``, which stores the weights."""
+    # noinspection PyProtectedMember
+    distance, parents = _dijkstra_ids(graph.order(), graph.index(source), graph.offsets,
+                                      graph.targets, graph._stored_weights(weight))
+    return array('d', distance), array('q', parents)
+
+
+def parallel_single_source(graph: AnyGraph, sources: Iterable[Hashable],
+                           weight: Callable[[dict], float], workers: int = None
+                           ) -> Tuple[List[Tuple[array, array]], Tuple[Hashable, ...]]:
+    """Finds the shortest paths from each of many sources with Dijkstra's algorithm, spread
+    over a pool of processes (e.g. for all-pairs tables, with every vertex as source).
+
+    The graph is shipped once to each process as a compact snapshot of its topology and
+    weights, and each result comes back as two flat arrays by vertex id, which are cheap to
+    transfer, so the parent process doesn't become the bottleneck as workers are added.
+
+    Args:
+        graph: The graph, which must not have negative weights.
+        sources: The vertices where the paths start.
+        weight: The function that will extract the weight value of the edge's data.
+        workers: The number of worker processes, by default (or if 1) the searches run in the
+            calling process.
+
+    Returns:
+        A tuple composed of the results, in the order of the sources, and the vertex of each
+        vertex id. Each result is composed of the distance (inf if unreachable) and the
+        parent's vertex id (-1 if none) of each vertex id.
+
+    Raises:
+        VertexError: Raises when a source isn't in the graph.
+    """
+    sources = list(sources)
+    for s in sources:
+        if s not in graph:
+            raise VertexError(f"vertex '{s}' isn't in the graph '{graph}'")
+
+    snapshot = _snapshot(graph, weight)
+    if workers is not None and workers > 1 and len(sources) > 1:
+        results = _map(_single_source, snapshot, _WEIGHT, sources, workers)
+    else:
+        results = [_single_source(snapshot, _WEIGHT, s) for s in sources]
+    return results, snapshot.labels
 
 
-def floyd_warshall(graph: BaseGraph, weight: Callable[[dict], int]):
+def bellman_ford(graph: AnyGraph, start_vertex: Hashable, weight: Callable[[dict], int],
+                 method: str = 'passes'):
+    """Finds the shortest paths from a vertex to every other vertex with the Bellman-Ford
+    algorithm, which allows negative weights.
+
+    The edges are flattened into arrays once and the search stops as soon as nothing changes.
+    The edges of undirected graphs are relaxed both ways, so a negative one is a cycle.
+
+    Args:
+        graph: The graph.
+        start_vertex: The vertex where the paths start.
+        weight: The function that will extract the weight value of the edge's data.
+        method: How the edges are relaxed, ``'passes'`` relaxes every edge in each pass,
+            ``'queue'`` only the out-edges of the vertices whose distance changed (SPFA), which
+            is usually much faster on sparse graphs, and ``'numpy'`` relaxes every edge at once
+            with NumPy, over float64 weights (the distances are floats).
+
+    Returns:
+        A tuple composed of the distance and the parent of each vertex (inf and None if
+        unreachable).
+
+    Raises:
+        VertexError: Raises when the start vertex isn't in the graph.
+        ValueError: Raises when the method isn't known.
+        ImportError: Raises when the method is ``'numpy'`` and NumPy isn't installed.
+        NegativeCycleError: Raises when a negative-weight cycle is reachable from the start
+            vertex, the cycle is in its ``cycle`` attribute.
+    """
+    if method not in ('passes', 'queue', 'numpy'):
+        raise ValueError(f"method '{method}' isn't 'passes', 'queue' nor 'numpy'")
+    if method == 'numpy' and np is None:
+        raise ImportError("the 'numpy' method requires NumPy")
+    if start_vertex not in graph:
+        raise VertexError(f"vertex '{start_vertex}' isn't in the graph '{graph}'")
+
+    snapshot, weights = _flatten(graph, weight)
+    labels, offsets, heads = snapshot.labels, snapshot.offsets, snapshot.targets
+    n, source = len(labels), snapshot.index(start_vertex)
+    tails = array('q', (u for u in range(n) for _ in range(offsets[u], offsets[u + 1])))
+
+    if method == 'queue':
+        distance, parents, relaxed = _relax_queue(n, [source], offsets, heads, weights)
+    elif method == 'numpy':
+        distance, parents, relaxed = _relax_numpy(n, [source], tails, heads, weights)
+    else:
+        distance, parents, relaxed = _relax_passes(n, [source], tails, heads, weights)
+
+    if relaxed is not None:
+        _raise_negative_cycle(graph, labels, [source], tails, heads, weights, parents, relaxed)
+
+    return (dict(zip(labels, distance)),
+            {v: None if p == -1 else labels[p] for v, p in zip(labels, parents)})
+
+
+def floyd_warshall(graph: AnyGraph, weight: Callable[[dict], int], method: str = 'python'):
+    """Finds the shortest paths between every pair of vertices with the Floyd-Warshall
+    algorithm.
+
+    Args:
+        graph: The graph.
+        weight: The function that will extract the weight value of the edge's data.
+        method: ``'python'`` runs over dictionaries, ``'numpy'`` runs over dense matrices with
+            NumPy (see ``floyd_warshall_matrix``), which is orders of magnitude faster for
+            hundreds of vertices or more.
+
+    Returns:
+        A tuple composed of the distance and the vertex after the first in the shortest path
+        (None if none) between each pair of vertices, by start vertex and then end vertex.
+
+    Raises:
+        ValueError: Raises when the method isn't known.
+        ImportError: Raises when the method is ``'numpy'`` and NumPy isn't installed.
+    """
+    if method not in ('python', 'numpy'):
+        raise ValueError(f"method '{method}' isn't 'python' nor 'numpy'")
+    if method == 'numpy':
+        return floyd_warshall_matrix(graph, weight).to_dicts()
+
     distance = {}
     children = {}
 
@@ -129,9 +950,12 @@ def floyd_warshall(graph: BaseGraph, weight: Callable[[dict], int]):
             distance[u][v] = inf
             children[u][v] = None
 
-    for u, v, d in graph.edges_list():
+    for u, v, d in graph.iter_edges():
         distance[u][v] = weight(d)
         children[u][v] = v
+        if not graph.is_directed():
+            distance[v][u] = weight(d)
+            children[v][u] = u
 
     for w in graph.vertices:
         distance[w][w] = 0
@@ -147,42 +971,213 @@ def floyd_warshall(graph: BaseGraph, weight: Callable[[dict], int]):
     return distance, children
 
 
-def kruskal(graph: BaseGraph, weight: Callable[[dict], int]):
+def floyd_warshall_matrix(graph: AnyGraph, weight: Callable[[dict], float],
+                          block_size: int = 64) -> PathMatrix:
+    """Finds the shortest paths between every pair of vertices with the Floyd-Warshall
+    algorithm, over dense NumPy matrices.
+
+    Each intermediate vertex relaxes the matrices with NumPy a strip of rows at a time, which
+    bounds the temporary arrays of each step to a strip instead of a whole matrix. The vertices
+    are only translated back from their ids on demand, through the result.
+
+    Args:
+        graph: The graph.
+        weight: The function that will extract the weight value of the edge's data.
+        block_size: The number of rows of a strip, which sets the size of the temporary
+            arrays (``block_size`` times the order of the graph).
+
+    Returns:
+        The distances (float64) and successors (int32) matrices.
+
+    Raises:
+        ImportError: Raises when NumPy isn't installed.
+        ValueError: Raises when the block size isn't positive.
+    """
+    if np is None:
+        raise ImportError("the Floyd-Warshall matrices require NumPy")
+    if block_size < 1:
+        raise ValueError(f"block size '{block_size}' isn't positive")
+
+    snapshot, weights = _flatten(graph, weight)
+    n = snapshot.order()
+    tails = np.repeat(np.arange(n), np.diff(np.asarray(snapshot.offsets)))
+    heads = np.asarray(snapshot.targets, dtype=np.intp)
+
+    distances = np.full((n, n), inf)
+    successors = np.full((n, n), -1, dtype=np.int32)
+    distances[tails, heads] = weights
+    successors[tails, heads] = heads
+    np.fill_diagonal(distances, 0)
+
+    _floyd_warshall_strips(distances, successors, block_size)
+    return PathMatrix(snapshot.labels, distances, successors)
+
+
+def _dijkstra_ids(n: int, source: int, offsets: Sequence[int], heads: Sequence[int],
+                  weights: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Returns the distances and parents (-1 if none) from the source vertex id, by vertex id,
+    with Dijkstra's algorithm over the flat arrays of the out-edges."""
+    distance, parents = [inf] * n, [-1] * n
+    distance[source] = 0
+    settled = [False] * n
+    heap = [(0, source)]
+    while heap:
+        d, u = heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = True
+        for k in range(offsets[u], offsets[u + 1]):
+            v = heads[k]
+            if d + weights[k] < distance[v]:
+                distance[v], parents[v] = d + weights[k], u
+                heappush(heap, (distance[v], v))
+
+    return distance, parents
+
+
+def johnson(graph: AnyGraph, weight: Callable[[dict], float]
+            ) -> Iterator[Tuple[Hashable, Dict[Hashable, float], Dict[Hashable, Hashable]]]:
+    """Finds the shortest paths between every pair of vertices with Johnson's algorithm, which
+    suits sparse graphs better than ``floyd_warshall`` and allows negative weights.
+
+    The weights are made non-negative once, by a Bellman-Ford search (queue based) from every
+    vertex at once, and then Dijkstra's algorithm runs from each vertex. The results are
+    yielded one source at a time, so they can be written out without holding V² entries.
+
+    Args:
+        graph: The graph.
+        weight: The function that will extract the weight value of the edge's data.
+
+    Returns:
+        A generator of tuples composed of a source vertex, the distance and the parent of each
+        vertex from it (inf and None if unreachable), like ``dijkstra``.
+
+    Raises:
+        NegativeCycleError: Raises when the graph has a negative-weight cycle, before yielding
+            anything.
+    """
+    snapshot, weights = _flatten(graph, weight)
+    labels, offsets, heads = snapshot.labels, snapshot.offsets, snapshot.targets
+    n = len(labels)
+    tails = array('q', (u for u in range(n) for _ in range(offsets[u], offsets[u + 1])))
+
+    # the potentials are the distances from a virtual vertex with edges to every vertex
+    if any(w < 0 for w in weights):
+        potentials, parents, relaxed = _relax_queue(n, range(n), offsets, heads, weights)
+        if relaxed is not None:
+            _raise_negative_cycle(graph, labels, range(n), tails, heads, weights, parents,
+                                  relaxed)
+        weights = [w + potentials[u] - potentials[v] for u, v, w in zip(tails, heads, weights)]
+    else:
+        potentials = [0] * n
+
+    return _johnson(labels, offsets, heads, weights, potentials)
+
+
+def _johnson(labels: Sequence[Hashable], offsets: Sequence[int], heads: Sequence[int],
+             weights: Sequence[float], potentials: Sequence[float]
+             ) -> Iterator[Tuple[Hashable, Dict[Hashable, float], Dict[Hashable, Hashable]]]:
+    """Yields the shortest paths from each vertex id over the reweighted edges."""
+    for source in range(len(labels)):
+        distance, parents = _dijkstra_ids(len(labels), source, offsets, heads, weights)
+        shift = potentials[source]
+        yield (labels[source],
+               {v: d - shift + potentials[i] if d < inf else inf
+                for i, (v, d) in enumerate(zip(labels, distance))},
+               {v: None if p == -1 else labels[p] for v, p in zip(labels, parents)})
+
+
+def kruskal(graph: AnyGraph, weight: Callable[[dict], int],
+            sorted_edges: Iterable[Tuple[Hashable, Hashable, dict]] = None):
     edges = []
     cost = 0
 
-    subsets = {frozenset([v]) for v in graph.vertices}
+    subsets = DisjointSet(graph.vertices)
 
-    for u, v, d in sorted(graph.edges_list(), key=lambda e: weight(e[2])):
-        subset_u = next((s for s in subsets if u in s))
-        subset_v = next((s for s in subsets if v in s))
-        if subset_u != subset_v:
-            edges.append((u, v))
-            cost += weight(d)
-            subsets.remove(subset_u)
-            subsets.remove(subset_v)
-            subsets.add(subset_u | subset_v)
+    # the edges may be given already sorted by weight, skipping the sort
+    if sorted_edges is None:
+        sorted_edges = sorted(graph.iter_edges(), key=lambda e: weight(e[2]))
 
-        if len(subsets) == 1:
+    for u, v, d in sorted_edges:
+        if subsets.subsets == 1:
             break
 
+        if subsets.union(u, v):
+            edges.append((u, v))
+            cost += weight(d)
+
     return cost, edges
 
 
-def prim_jarnik(graph: BaseGraph, weight: Callable[[dict], int], start_vertex: Hashable = None):
-    vertices = set(graph.vertices)
-    costs = {v: inf for v in vertices}
+def prim_jarnik(graph: AnyGraph, weight: Callable[[dict], int], start_vertex: Hashable = None,
+                stats: dict = None):
+    if isinstance(graph, CSRGraph):
+        return _prim_jarnik_snapshot(graph, weight, start_vertex, stats)
+
+    costs = dict.fromkeys(graph.vertices, inf)
     parents = {}
 
-    costs[start_vertex or choice(tuple(vertices))] = 0
+    root = start_vertex or choice(tuple(costs))
+    costs[root] = 0
+    successors = _weighted_successors(graph, weight)
 
-    while vertices:
-        u = min(vertices, key=lambda x: costs[x])
-        vertices.remove(u)
-        for v in graph.neighbours(u):
-            temp_cost = weight(graph.edges[u][v])
-            if v in vertices and temp_cost < costs[v]:
+    counter = count()  # tie-breaker, the vertices don't need to be comparable
+    heap = [(0, next(counter), root)]
+    tree = set()
+
+    while heap:
+        _, _, u = heappop(heap)
+        if u in tree:
+            continue
+
+        tree.add(u)
+        for v, temp_cost in successors(u):
+            if v not in tree and temp_cost < costs[v]:
                 costs[v] = temp_cost
                 parents[v] = u
+                heappush(heap, (temp_cost, next(counter), v))
+
+    if stats is not None:
+        stats['settled'] = len(tree)
 
     return sum(costs.values()), [(u, parents[u]) for u in parents]
+
+
+def _prim_jarnik_snapshot(graph: CSRGraph, weight: Callable[[dict], float],
+                          start_vertex: Optional[Hashable], stats: Optional[dict]):
+    """Runs ``prim_jarnik`` over the vertex ids of the snapshot, translating them back to the
+    vertices only for the result."""
+    labels, offsets, targets, edge_data = (graph.labels, graph.offsets, graph.targets,
+                                           graph.edge_data)
+    # noinspection PyProtectedMember
+    weights = graph._stored_weights(weight)
+    costs = [inf] * len(labels)
+    parents = {}
+
+    root = graph.index(start_vertex or choice(labels))
+    costs[root] = 0
+
+    counter = count()  # tie-breaker, like in prim_jarnik, so both build the same tree
+    heap = [(0, next(counter), root)]
+    tree = [False] * len(labels)
+    size = 0
+
+    while heap:
+        _, _, u = heappop(heap)
+        if tree[u]:
+            continue
+
+        tree[u] = True
+        size += 1
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            temp_cost = weight(edge_data[k]) if weights is None else weights[k]
+            if not tree[v] and temp_cost < costs[v]:
+                costs[v] = temp_cost
+                parents[v] = u
+                heappush(heap, (temp_cost, next(counter), v))
+
+    if stats is not None:
+        stats['settled'] = size
+
+    return sum(costs), [(labels[u], labels[parents[u]]) for u in parents]
@@ -0,0 +1,206 @@
+from typing import Callable, Dict, Hashable, Iterable, List, Mapping, Sequence, Tuple, Union
+
+from math import inf
+
+from .algorithms import AnyGraph, Endpoint, distance_table
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it's only needed to solve assignments
+    np = None
+
+
+def solve_assignment(costs: Sequence[Sequence[float]]) -> List[Tuple[int, int]]:
+    """Finds the pairs of rows and columns of a cost matrix with the minimum total cost.
+
+    Each row is paired with at most one column and vice versa, as many pairs as possible are
+    made (the smaller side is fully paired, unless forbidden pairs prevent it).
+
+    Args:
+        costs: The cost of each row for each column, inf forbids the pair.
+
+    Returns:
+        A list of pairs of a row and a column, by row.
+
+    Raises:
+        ImportError: Raises when NumPy isn't installed.
+    """
+    return sorted(Assignment(costs).pairs.items())
+
+
+class Assignment:
+    def __init__(self, costs: Sequence[Sequence[float]], drivers: Sequence[Hashable] = None,
+                 clients: Sequence[Hashable] = None):
+        """Solves the minimum-cost assignment of drivers (rows) to clients (columns).
+
+        The Hungarian algorithm (shortest augmenting paths with potentials) is used, vectorized
+        with NumPy, so a 500x500 batch is solved in a fraction of a second. The matrix is padded
+        to a square one with zero-cost dummies, which pair the drivers or clients left out, and
+        the forbidden pairs cost more than any assignment without them.
+
+        The potentials are kept after solving, so when a driver declines its client only that
+        driver is re-paired, with a single augmenting path instead of a new solve.
+
+        Args:
+            costs: The cost of each driver for each client, inf forbids the pair.
+            drivers: The name of each row, by default its index.
+            clients: The name of each column, by default its index.
+
+        Raises:
+            ImportError: Raises when NumPy isn't installed.
+            ValueError: Raises when the matrix isn't rectangular or the names don't match it.
+        """
+        if np is None:
+            raise ImportError("the assignment solver requires NumPy")
+
+        costs = np.array(costs, dtype=float)
+        if costs.size == 0:
+            costs = costs.reshape(len(costs), 0)
+        if costs.ndim != 2:
+            raise ValueError("the cost matrix isn't rectangular")
+
+        n, m = costs.shape
+        self._drivers = list(range(n)) if drivers is None else list(drivers)
+        self._clients = list(range(m)) if clients is None else list(clients)
+        if len(self._drivers) != n or len(self._clients) != m:
+            raise ValueError("the names of the drivers or clients don't match the cost matrix")
+        self._driver_index = {d: i for i, d in enumerate(self._drivers)}
+        self._client_index = {c: j for j, c in enumerate(self._clients)}
+
+        # 1-indexed and square, the row and column 0 are the algorithm's sentinels
+        size = max(n, m)
+        finite = np.isfinite(costs)
+        self._forbidden = 2 * size * np.abs(costs[finite]).max(initial=0) + 1
+        self._costs = np.zeros((size + 1, size + 1))
+        self._costs[1:n + 1, 1:m + 1] = np.where(finite, costs, self._forbidden)
+        self._row_potentials = np.zeros(size + 1)
+        self._column_potentials = np.zeros(size + 1)
+        self._rows = np.zeros(size + 1, dtype=np.intp)  # the row paired with each column
+        self._way = np.zeros(size + 1, dtype=np.intp)
+
+        # the rows whose cheapest column is still free are paired with it right away
+        self._row_potentials[1:] = self._costs[1:, 1:].min(axis=1, initial=inf)
+        for i in range(1, size + 1):
+            j = int(np.argmin(self._costs[i, 1:])) + 1
+            if not self._rows[j] and self._costs[i, j] == self._row_potentials[i]:
+                self._rows[j] = i
+
+        paired = set(self._rows.tolist())
+        for i in range(1, size + 1):
+            if i not in paired:
+                self._augment(i)
+
+    @staticmethod
+    def from_graph(graph: AnyGraph,
+                   drivers: Union[Iterable[Endpoint], Mapping[Hashable, Endpoint]],
+                   clients: Union[Iterable[Endpoint], Mapping[Hashable, Endpoint]],
+                   weight: Callable[[dict], float], workers: int = None) -> 'Assignment':
+        """Solves the assignment of drivers to clients by their shortest distances.
+
+        Args:
+            graph: The graph.
+            drivers: The vertices or positions (like in ``shortest_path``) of the drivers, or a
+                dictionary of the drivers' names and their vertices or positions.
+            clients: The same for the clients.
+            weight: The function that will extract the weight value of the edge's data.
+            workers: The number of worker processes computing the distances, as in
+                ``distance_table``.
+
+        Returns:
+            The assignment, with the distance from each driver to each client as cost.
+
+        Raises:
+            ImportError: Raises when NumPy isn't installed.
+            VertexError: Raises when an endpoint is neither a vertex of the graph nor a position.
+            EdgeError: Raises when the edge of a position isn't in the graph.
+        """
+        if not isinstance(drivers, Mapping):
+            drivers = {d: d for d in drivers}
+        if not isinstance(clients, Mapping):
+            clients = {c: c for c in clients}
+
+        matrix, driver_index, client_index = distance_table(graph, drivers.values(),
+                                                            clients.values(), weight, workers)
+        costs = [[matrix[driver_index[d]][client_index[c]] for c in clients.values()]
+                 for d in drivers.values()]
+        return Assignment(costs, list(drivers), list(clients))
+
+    def _augment(self, row: int):
+        """Pairs the free row through the shortest augmenting path in the reduced costs.
+
+        The columns at the same distance are settled together, so ties (e.g. integer costs)
+        don't cost a step each.
+        """
+        costs, u, v, rows, way = (self._costs, self._row_potentials, self._column_potentials,
+                                  self._rows, self._way)
+        columns = np.arange(len(rows))
+        distance = np.full(len(rows), inf)
+        used = np.zeros(len(rows), dtype=bool)
+
+        rows[0] = row
+        settled = columns[:1]
+        while True:
+            used[settled] = True
+            tails = rows[settled]
+            reduced = costs[tails] - u[tails, None] - v
+            k = np.argmin(reduced, axis=0)
+            closest = reduced[k, columns]
+
+            improved = ~used & (closest < distance)
+            distance[improved] = closest[improved]
+            way[improved] = settled[k[improved]]
+
+            delta = np.where(used, inf, distance).min()
+            u[rows[used]] += delta
+            v[used] -= delta
+            distance[~used] -= delta
+
+            settled = np.flatnonzero(~used & (distance == 0))
+            free = settled[rows[settled] == 0]
+            if free.size:
+                break
+
+        j = free[0]
+        while j:
+            rows[j] = rows[way[j]]
+            j = way[j]
+
+    @property
+    def pairs(self) -> Dict[Hashable, Hashable]:
+        """The client assigned to each driver, the drivers left out aren't listed."""
+        n, m = len(self._drivers), len(self._clients)
+        pairs = {}
+        for j in range(1, m + 1):
+            i = self._rows[j]
+            if 0 < i <= n and self._costs[i, j] < self._forbidden:
+                pairs[self._drivers[i - 1]] = self._clients[j - 1]
+        return dict(sorted(pairs.items(), key=lambda p: self._driver_index[p[0]]))
+
+    @property
+    def cost(self) -> float:
+        """The total cost of the assigned pairs."""
+        return float(sum(self._costs[self._driver_index[d] + 1, self._client_index[c] + 1]
+                         for d, c in self.pairs.items()))
+
+    def decline(self, driver: Hashable, client: Hashable) -> Dict[Hashable, Hashable]:
+        """Forbids a pair, e.g. because the driver declined the client, and re-solves.
+
+        If the pair was assigned, only the driver is re-paired, with a single augmenting path
+        over the kept potentials, which is as optimal as solving again from scratch.
+
+        Args:
+            driver: The driver.
+            client: The client.
+
+        Returns:
+            The new pairs, like ``pairs``.
+
+        Raises:
+            KeyError: Raises when the driver or the client isn't in the assignment.
+        """
+        i, j = self._driver_index[driver] + 1, self._client_index[client] + 1
+        self._costs[i, j] = self._forbidden
+        if self._rows[j] == i:
+            self._rows[j] = 0
+            self._augment(i)
+        return self.pairs
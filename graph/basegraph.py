@@ -1,7 +1,26 @@
-from typing import Callable, Dict, Hashable, List, Set, Tuple
+from typing import (Any, Callable, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional,
+                    Set, Tuple, Union)
 from abc import abstractmethod
 
+from contextlib import contextmanager
 from copy import deepcopy
+from os import PathLike
+
+from .csr import CSRGraph
+
+
+class JournalEntry(NamedTuple):
+    """A change made to a graph while it was journaled.
+
+    Attributes:
+        operation: The name of the method that made the change, e.g. ``'add_edge'``.
+        args: The vertex or the vertices of the edge changed.
+        previous: The data the vertex or edge had before the change, or None if it wasn't in the
+            graph. For ``'clear'`` it's the vertices' data and the list of edges removed.
+    """
+    operation: str
+    args: Tuple[Hashable, ...]
+    previous: Any
 
 
 class BaseGraph:
@@ -16,6 +35,8 @@ class BaseGraph:
         self._description = description
         self._vertices = {}
         self._edges = {}
+        self._journal = None
+        self._version = 0
 
     def __contains__(self, vertex: Hashable):
         return vertex in self._vertices
@@ -28,7 +49,7 @@ class BaseGraph:
 
     def __repr__(self):
         return (f'G({{{", ".join(map(str, self.vertices))}}}, '
-                f'[{", ".join(map(lambda e: f"({e[0]}, {e[1]})", self.edges_list()))}])')
+                f'[{", ".join(map(lambda e: f"({e[0]}, {e[1]})", self.iter_edges(data=False)))}])')
 
     def __copy__(self):
         cls = self.__class__
@@ -47,10 +68,9 @@ class BaseGraph:
         result = cls.__new__(cls)
         memodict[id(self)] = result
 
-        result._name = self._name
-        result._description = self._description
-        result._vertices = deepcopy(self._vertices, memodict)
-        result._edges = deepcopy(self._edges, memodict)
+        # the data dictionaries shared between the internal indexes stay shared in the copy
+        for attribute, value in self.__dict__.items():
+            setattr(result, attribute, deepcopy(value, memodict))
 
         return result
 
@@ -84,9 +104,152 @@ class BaseGraph:
 
     def clear(self):
         """Clears the graph, removing all vertices and edges from it."""
+        self._version += 1
+        if self._journal is not None:
+            self._record('clear', (), (dict(self._vertices), self.edges_list()))
         self._vertices.clear()
         self._edges.clear()
 
+    @property
+    def version(self) -> int:
+        """The number of changes made to the graph, which grows with every change made through
+        its methods (changes made directly to the data dictionaries aren't counted)."""
+        return self._version
+
+    # JOURNAL
+
+    @property
+    def journal(self) -> Tuple[JournalEntry, ...]:
+        """The changes made since journaling started, oldest first."""
+        return tuple(self._journal or ())
+
+    def _record(self, operation: str, args: Tuple[Hashable, ...], previous: Any):
+        """Counts a change and appends it to the journal, if the graph is journaled."""
+        self._version += 1
+        if self._journal is not None:
+            self._journal.append(JournalEntry(operation, args, previous))
+
+    def checkpoint(self) -> int:
+        """Starts journaling the changes made to the graph, if not started yet, and returns a
+        checkpoint that the graph can be rolled back to.
+
+        Returns:
+            The checkpoint, the number of changes journaled so far.
+        """
+        if self._journal is None:
+            self._journal = []
+        return len(self._journal)
+
+    def rollback(self, checkpoint: int = 0):
+        """Undoes the changes journaled after the checkpoint, newest first.
+
+        The restored vertices and edges get their previous data back, though not the same
+        dictionaries. Journaling continues afterwards.
+
+        Args:
+            checkpoint: The checkpoint returned by ``checkpoint``, by default the start of the
+                journal.
+
+        Raises:
+            ValueError: Raises when the graph isn't journaled or the checkpoint isn't in the
+                journal.
+        """
+        journal = self._journal
+        if journal is None or not 0 <= checkpoint <= len(journal):
+            raise ValueError(f"checkpoint '{checkpoint}' isn't in the journal of the graph "
+                             f"'{self}'")
+
+        self._journal = None  # undoing isn't journaled
+        try:
+            while len(journal) > checkpoint:
+                operation, args, previous = journal.pop()
+                if operation == 'clear':
+                    vertices, edges = previous
+                    for v, data in vertices.items():
+                        self.add_vertex(v, **data)
+                    self.add_edges_from(edges, validate=False)
+                elif operation.endswith('_vertex') or operation == 'set_vertex_data':
+                    if previous is None:
+                        self.remove_vertex(*args)
+                    else:
+                        self.add_vertex(*args, **previous)
+                elif previous is None:
+                    self.remove_edge(*args)
+                else:
+                    self.add_edge(*args, **previous)
+        finally:
+            self._journal = journal
+
+    def commit(self):
+        """Stops journaling and forgets the journaled changes, which can't be undone anymore."""
+        self._journal = None
+
+    @contextmanager
+    def transaction(self, revert: bool = False) -> Iterator['BaseGraph']:
+        """Journals the changes made to the graph within the context and undoes them if an
+        exception is raised.
+
+        Useful for temporary changes to a shared graph, e.g. ``with graph.transaction(True):``
+        reverts the changes once the context exits, without copying the graph.
+
+        Args:
+            revert: Whether to also undo the changes when the context exits without errors.
+
+        Returns:
+            A context manager that gives the graph itself.
+        """
+        started = self._journal is None
+        checkpoint = self.checkpoint()
+        try:
+            yield self
+        except BaseException:
+            self.rollback(checkpoint)
+            raise
+        else:
+            if revert:
+                self.rollback(checkpoint)
+        finally:
+            if started:
+                self.commit()
+
+    @abstractmethod
+    def is_directed(self) -> bool:
+        """Checks if the edges of the graph are directed.
+
+        Returns:
+            True if the graph is directed, False otherwise.
+        """
+        pass
+
+    def freeze(self, weight: Callable[[dict], float] = None) -> CSRGraph:
+        """Returns an immutable compressed-sparse-row snapshot of the graph.
+
+        The snapshot is accepted by every algorithm and is faster to traverse, since the
+        searches run over its vertex ids, but later changes to the graph aren't reflected on it.
+
+        Args:
+            weight: The function that will extract the weight value of the edge's data, if given
+                the weights are computed once and reused by the algorithms called with it.
+
+        Returns:
+            A snapshot of the graph.
+
+        Raises:
+            KeyError: Raises when the weight key don't exists in one of the edges' data.
+        """
+        return CSRGraph.from_graph(self, weight)
+
+    def save(self, path: Union[str, PathLike]):
+        """Saves a snapshot of the graph in a compact binary file.
+
+        The file can be memory-mapped by ``CSRGraph.load``, which returns a read-only snapshot
+        accepted by every algorithm.
+
+        Args:
+            path: The path of the file.
+        """
+        self.freeze().save(path)
+
     # VERTICES
 
     @abstractmethod
@@ -112,6 +275,17 @@ class BaseGraph:
         """
         pass
 
+    @abstractmethod
+    def add_vertices_from(self, vertices: Iterable[Hashable], /, **data):
+        """Adds many vertices to the graph at once.
+
+        Args:
+            vertices: The vertices.
+            **data: The data of the vertices. Each vertex receives its own copy of the pairs of
+                key=value passed as parameter.
+        """
+        pass
+
     @abstractmethod
     def remove_vertex(self, vertex_v: Hashable):
         """Removes a vertex from the graph.
@@ -209,6 +383,26 @@ class BaseGraph:
         """
         pass
 
+    @abstractmethod
+    def add_edges_from(self, edges: Iterable[Tuple[Hashable, Hashable, Optional[dict]]],
+                       validate: bool = True):
+        """Adds many edges to the graph at once.
+
+        The vertices of the whole batch are checked once, before anything is inserted, instead
+        of once per edge.
+
+        Args:
+            edges: The edges. Each edge is composed of vertex u, vertex v and optionally the
+                edge's data, which is copied.
+            validate: Whether to check that the vertices are in the graph. Only skip the check
+                for trusted input, an edge to a missing vertex leaves the graph inconsistent.
+
+        Raises:
+            VertexError: Raises when a vertex from the edges isn't in the graph, in which case
+                no edge is added.
+        """
+        pass
+
     @abstractmethod
     def remove_edge(self, vertex_u: Hashable, vertex_v: Hashable):
         """Removes an edge from the graph.
@@ -329,6 +523,33 @@ class BaseGraph:
 
     # REPRESENTATIONS
 
+    @abstractmethod
+    def iter_edges(self, data: bool = True) -> Iterator[Tuple]:
+        """Returns an iterator over the unique edges, without building a list.
+
+        The graph must not be changed while it's iterated.
+
+        Args:
+            data: Whether each edge comes with its data.
+
+        Returns:
+            An iterator of edges composed of vertex u, vertex v and, if data is True, the
+            edge's data.
+        """
+        pass
+
+    @abstractmethod
+    def iter_adjacency(self) -> Iterator[Tuple[Hashable, Iterable[Hashable]]]:
+        """Returns an iterator over the adjacency of the vertices, without building a dictionary.
+
+        Only the vertices with adjacent vertices are listed and the graph must not be changed
+        while it's iterated.
+
+        Returns:
+            An iterator of pairs of a vertex and an iterable of its adjacent vertices.
+        """
+        pass
+
     @abstractmethod
     def edges_list(self) -> List[Tuple[Hashable, Hashable, dict]]:
         """Returns a list of unique edges.
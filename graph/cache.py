@@ -0,0 +1,125 @@
+from typing import Any, Callable, Hashable, Iterable, NamedTuple, Tuple
+
+from collections import OrderedDict
+from types import MappingProxyType
+
+from .algorithms import AnyGraph, dijkstra, dijkstra_to
+
+
+class CacheInfo(NamedTuple):
+    """The statistics of a ``PathCache``.
+
+    Attributes:
+        hits: The number of queries answered from the cache.
+        misses: The number of queries computed.
+        evictions: The number of results dropped because the cache was full.
+        size: The number of results cached.
+        max_size: The maximum number of results cached.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class PathCache:
+    def __init__(self, max_size: int = 128):
+        """Creates a cache of shortest path results, for graphs queried repeatedly from the
+        same vertices (e.g. the airport or the bus terminal of a map).
+
+        The results are keyed on the graph, its version, the algorithm, the vertices and the
+        weight, so a change made to the graph through its methods makes its cached results
+        stale, and they're evicted as the least recently used ones. Changes made directly to
+        the data dictionaries aren't noticed. The graphs are kept alive while they have cached
+        results.
+
+        The weight functions should be reused, or an equal key given for them, since two
+        equivalent lambdas are different keys (``EdgeAttribute`` instances with the same key
+        are equal).
+
+        Args:
+            max_size: The maximum number of results cached.
+
+        Raises:
+            ValueError: Raises when the maximum size isn't positive.
+        """
+        if max_size < 1:
+            raise ValueError(f"max size '{max_size}' isn't positive")
+
+        self._max_size = max_size
+        self._results = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    @property
+    def info(self) -> CacheInfo:
+        """The hits, misses and evictions so far and the size of the cache."""
+        return CacheInfo(self._hits, self._misses, self._evictions, len(self._results),
+                         self._max_size)
+
+    def clear(self):
+        """Clears the cached results, keeping the statistics."""
+        self._results.clear()
+
+    def _get(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """Returns the cached result of the key, computing and caching it if missing."""
+        if key in self._results:
+            self._hits += 1
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        self._misses += 1
+        result = self._results[key] = compute()
+        if len(self._results) > self._max_size:
+            self._results.popitem(last=False)
+            self._evictions += 1
+        return result
+
+    def dijkstra(self, graph: AnyGraph, start_vertex: Hashable, weight: Callable[[dict], float],
+                 weight_key: Hashable = None, max_distance: float = None,
+                 targets: Iterable[Hashable] = None):
+        """Runs ``dijkstra``, or returns its cached result.
+
+        Args:
+            graph: The graph.
+            start_vertex: The vertex where the paths start.
+            weight: The function that will extract the weight value of the edge's data.
+            weight_key: The key of the weight in the cache, by default the weight itself.
+            max_distance: The same as in ``dijkstra``.
+            targets: The same as in ``dijkstra``.
+
+        Returns:
+            The result of ``dijkstra``, as read-only views of the cached dictionaries, so a hit
+            doesn't copy an entry per vertex (copy them with ``dict`` to change them).
+        """
+        targets = None if targets is None else frozenset(targets)
+        key = (graph, graph.version, 'dijkstra', start_vertex, None,
+               weight if weight_key is None else weight_key, max_distance, targets)
+        return self._get(key, lambda: tuple(map(MappingProxyType,
+                                                dijkstra(graph, start_vertex, weight,
+                                                         max_distance=max_distance,
+                                                         targets=targets))))
+
+    def dijkstra_to(self, graph: AnyGraph, start_vertex: Hashable, end_vertex: Hashable,
+                    weight: Callable[[dict], float], weight_key: Hashable = None):
+        """Runs ``dijkstra_to``, or returns its cached result.
+
+        Args:
+            graph: The graph.
+            start_vertex: The vertex where the path starts.
+            end_vertex: The vertex where the path ends.
+            weight: The function that will extract the weight value of the edge's data.
+            weight_key: The key of the weight in the cache, by default the weight itself.
+
+        Returns:
+            A copy of the result of ``dijkstra_to``.
+        """
+        key = (graph, graph.version, 'dijkstra_to', start_vertex, end_vertex,
+               weight if weight_key is None else weight_key)
+        result = self._get(key, lambda: dijkstra_to(graph, start_vertex, end_vertex, weight))
+        return None if result is None else (dict(result[0]), list(result[1]))
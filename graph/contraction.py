@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from array import array
+from heapq import heapify, heappop, heappush
+from itertools import count
+from math import inf
+from os import PathLike
+import pickle
+
+from .exceptions import VertexError
+
+_MAGIC = b'CHGRAPH1'
+
+# an arc from a vertex id, its weight and the id of the vertex it shortcuts (-1 if none)
+_Arc = Tuple[int, float, int]
+
+
+def _witness_search(out_arcs: List[Dict[int, Tuple[float, int]]], source: int, excluded: int,
+                    limit: float, targets: set, max_settled: int) -> Dict[int, float]:
+    """Returns the distances from the source to the vertices reached without the excluded
+    vertex, searching up to the limit distance or until the targets are settled."""
+    distance = {source: 0}
+    heap = [(0, source)]
+    settled = 0
+    targets = set(targets)
+
+    while heap and targets and settled < max_settled:
+        d, u = heappop(heap)
+        if d > distance[u]:
+            continue
+
+        settled += 1
+        targets.discard(u)
+        for v, (w, _) in out_arcs[u].items():
+            # the paths longer than the limit can't replace a shortcut
+            if v != excluded and (temp_distance := d + w) <= limit \
+                    and temp_distance < distance.get(v, inf):
+                distance[v] = temp_distance
+                heappush(heap, (temp_distance, v))
+
+    return distance
+
+
+class ContractionHierarchy:
+    """A contraction hierarchy of a static graph, for fast point-to-point shortest paths.
+
+    The vertices are contracted one by one, least important first, and shortcut edges are
+    added between their neighbours where needed to keep the distances. A query then only
+    searches upwards in the hierarchy from both ends, which settles a few hundred vertices even
+    on big road maps. The shortcuts remember the vertex they skip, so full paths are unpacked.
+
+    The arcs to higher ranked vertices are stored, by vertex id, in compressed-sparse-row
+    arrays: ``up`` arcs for the forward search and ``down`` arcs (the arcs from higher ranked
+    vertices) for the backward search.
+    """
+
+    __slots__ = ('_labels', '_index', '_ranks', '_up', '_down')
+
+    def __init__(self, labels: Sequence[Hashable], ranks: Sequence[int],
+                 up: Tuple[Sequence[int], Sequence[int], Sequence[float], Sequence[int]],
+                 down: Tuple[Sequence[int], Sequence[int], Sequence[float], Sequence[int]]):
+        """Creates a hierarchy from its raw arrays.
+
+        Args:
+            labels: The vertex of each vertex id.
+            ranks: The contraction order of each vertex id.
+            up: The offsets, heads, weights and skipped vertex ids (-1 for original edges) of
+                the arcs from each vertex id to higher ranked ones.
+            down: The same for the arcs to each vertex id from higher ranked ones, with their
+                tails instead of heads.
+        """
+        self._labels = tuple(labels)
+        self._index = {v: i for i, v in enumerate(self._labels)}
+        self._ranks = ranks
+        self._up = up
+        self._down = down
+
+    @staticmethod
+    def from_graph(graph, weight: Callable[[dict], float],
+                   max_settled: int = 500) -> ContractionHierarchy:
+        """Preprocesses the graph into a contraction hierarchy.
+
+        The vertices are ordered by edge difference (the shortcuts added minus the edges
+        removed) plus the number of contracted neighbours, updated lazily.
+
+        Args:
+            graph: The graph (or a snapshot of it), which must not have negative weights.
+            weight: The function that will extract the weight value of the edge's data.
+            max_settled: The number of vertices settled by each search for a path that makes a
+                shortcut unneeded, a lower limit preprocesses faster but adds more shortcuts.
+
+        Returns:
+            The hierarchy.
+
+        Raises:
+            ValueError: Raises when an edge has a negative weight.
+        """
+        labels = tuple(graph.vertices)
+        index = {v: i for i, v in enumerate(labels)}
+        n = len(labels)
+
+        out_arcs = [{} for _ in range(n)]
+        in_arcs = [{} for _ in range(n)]
+
+        def add_arc(i: int, j: int, w: float, middle: int):
+            if i != j and (j not in out_arcs[i] or w < out_arcs[i][j][0]):
+                out_arcs[i][j] = in_arcs[j][i] = (w, middle)
+
+        directed = graph.is_directed()
+        for u, v, d in graph.iter_edges():
+            if (w := weight(d)) < 0:
+                raise ValueError(f"edge '{{{u}, {v}}}' of the graph '{graph}' has a negative "
+                                 f"weight")
+            add_arc(index[u], index[v], w, -1)
+            if not directed:
+                add_arc(index[v], index[u], w, -1)
+
+        def shortcuts(v: int) -> List[Tuple[int, int, float]]:
+            heads = out_arcs[v]
+            if not heads:
+                return []
+
+            needed = []
+            longest = max(w for w, _ in heads.values())
+            for u, (w_in, _) in in_arcs[v].items():
+                targets = {x for x in heads if x != u}
+                if not targets:
+                    continue
+                distance = _witness_search(out_arcs, u, v, w_in + longest, targets, max_settled)
+                for x in targets:
+                    w = w_in + heads[x][0]
+                    if distance.get(x, inf) > w:
+                        needed.append((u, x, w))
+            return needed
+
+        contracted_neighbours = [0] * n
+
+        def priority(v: int) -> Tuple[int, List[Tuple[int, int, float]]]:
+            needed = shortcuts(v)
+            return (len(needed) - len(in_arcs[v]) - len(out_arcs[v]) + contracted_neighbours[v],
+                    needed)
+
+        heap = [(priority(v)[0], v) for v in range(n)]
+        heapify(heap)
+
+        ranks = array('q', bytes(8 * n))
+        up, down = [None] * n, [None] * n
+        rank = 0
+        while heap:
+            _, v = heappop(heap)
+            current, needed = priority(v)
+            if heap and current > heap[0][0]:  # lazy update, another vertex may be less important
+                heappush(heap, (current, v))
+                continue
+
+            for u, x, w in needed:
+                add_arc(u, x, w, v)
+
+            ranks[v] = rank
+            rank += 1
+            up[v] = [(x, w, middle) for x, (w, middle) in out_arcs[v].items()]
+            down[v] = [(u, w, middle) for u, (w, middle) in in_arcs[v].items()]
+
+            for x in out_arcs[v]:
+                del in_arcs[x][v]
+                contracted_neighbours[x] += 1
+            for u in in_arcs[v]:
+                del out_arcs[u][v]
+                contracted_neighbours[u] += 1
+            out_arcs[v], in_arcs[v] = {}, {}
+
+        def compress(arcs: List[List[_Arc]]):
+            offsets, ends, weights, middles = array('q', [0]), array('q'), array('d'), array('q')
+            for vertex_arcs in arcs:
+                for end, w, middle in vertex_arcs:
+                    ends.append(end)
+                    weights.append(w)
+                    middles.append(middle)
+                offsets.append(len(ends))
+            return offsets, ends, weights, middles
+
+        return ContractionHierarchy(labels, ranks, compress(up), compress(down))
+
+    def __contains__(self, vertex: Hashable):
+        return vertex in self._index
+
+    def __len__(self):
+        return len(self._labels)
+
+    @property
+    def labels(self) -> Tuple[Hashable, ...]:
+        """The vertex of each vertex id."""
+        return self._labels
+
+    @property
+    def ranks(self) -> Sequence[int]:
+        """The contraction order of each vertex id."""
+        return self._ranks
+
+    def shortcuts(self) -> int:
+        """Returns the number of shortcut arcs in the hierarchy."""
+        return sum(1 for m in self._up[3] if m != -1) + sum(1 for m in self._down[3] if m != -1)
+
+    def _arcs(self, arcs: tuple, i: int) -> Iterator[_Arc]:
+        offsets, ends, weights, middles = arcs
+        for k in range(offsets[i], offsets[i + 1]):
+            yield ends[k], weights[k], middles[k]
+
+    def _arc(self, i: int, j: int) -> Tuple[float, int]:
+        """Returns the weight and skipped vertex id of the arc from the vertex id i to j."""
+        if self._ranks[i] < self._ranks[j]:
+            arcs, start, end = self._up, i, j
+        else:
+            arcs, start, end = self._down, j, i
+        for k, w, middle in self._arcs(arcs, start):
+            if k == end:
+                return w, middle
+        raise KeyError((i, j))
+
+    def _unpack(self, i: int, j: int, w: float, middle: int) -> Iterator[Tuple[int, float]]:
+        """Yields the heads and weights of the original edges of the arc from i to j."""
+        stack = [(i, j, w, middle)]
+        while stack:
+            i, j, w, middle = stack.pop()
+            if middle == -1:
+                yield j, w
+            else:
+                stack.append((middle, j, *self._arc(middle, j)))
+                stack.append((i, middle, *self._arc(i, middle)))
+
+    def _search(self, source: Hashable, target: Hashable, stats: Optional[dict]):
+        """Searches upwards from both vertices, returns the distance, the meeting vertex id and
+        the parent arcs of each side."""
+        if source not in self._index:
+            raise VertexError(f"vertex '{source}' isn't in the hierarchy")
+        if target not in self._index:
+            raise VertexError(f"vertex '{target}' isn't in the hierarchy")
+
+        s, t = self._index[source], self._index[target]
+        arcs = (self._up, self._down)
+        distance = ({s: 0}, {t: 0})
+        parents = ({s: None}, {t: None})
+        counter = count()  # tie-breaker
+        heaps = ([(0, next(counter), s)], [(0, next(counter), t)])
+        best, meeting = (0, s) if s == t else (inf, None)
+        settled = 0
+
+        while True:
+            tops = (heaps[0][0][0] if heaps[0] else inf, heaps[1][0][0] if heaps[1] else inf)
+            if min(tops) >= best:
+                break
+
+            side = 0 if tops[0] <= tops[1] else 1
+            d, _, u = heappop(heaps[side])
+            if d > distance[side][u]:
+                continue
+
+            settled += 1
+            this_distance, other_distance = distance[side], distance[1 - side]
+
+            # stall-on-demand, a higher ranked vertex already reached gives a shorter path to u,
+            # so the search doesn't continue from it
+            offsets, ends, weights, _ = arcs[1 - side]
+            if any(this_distance.get(ends[k], inf) + weights[k] < d
+                   for k in range(offsets[u], offsets[u + 1])):
+                continue
+
+            offsets, ends, weights, middles = arcs[side]
+            for k in range(offsets[u], offsets[u + 1]):
+                v, temp_distance = ends[k], d + weights[k]
+                if temp_distance < this_distance.get(v, inf):
+                    this_distance[v] = temp_distance
+                    parents[side][v] = u, weights[k], middles[k]
+                    heappush(heaps[side], (temp_distance, next(counter), v))
+                    if v in other_distance and temp_distance + other_distance[v] < best:
+                        best, meeting = temp_distance + other_distance[v], v
+
+        if stats is not None:
+            stats['settled'] = settled
+
+        return best, meeting, parents
+
+    def distance(self, source: Hashable, target: Hashable, stats: dict = None) -> float:
+        """Returns the shortest distance between two vertices.
+
+        Args:
+            source: The vertex where the path starts.
+            target: The vertex where the path ends.
+            stats: A dictionary that will receive the number of settled vertices.
+
+        Returns:
+            The distance, inf if the target isn't reachable.
+
+        Raises:
+            VertexError: Raises when a vertex isn't in the hierarchy.
+        """
+        return self._search(source, target, stats)[0]
+
+    def shortest_path(self, source: Hashable, target: Hashable, stats: dict = None):
+        """Finds the shortest path between two vertices, with its shortcuts unpacked.
+
+        Args:
+            source: The vertex where the path starts.
+            target: The vertex where the path ends.
+            stats: A dictionary that will receive the number of settled vertices.
+
+        Returns:
+            The same as ``dijkstra_to``.
+
+        Raises:
+            VertexError: Raises when a vertex isn't in the hierarchy.
+        """
+        best, meeting, (forward, backward) = self._search(source, target, stats)
+        if meeting is None:
+            return None
+
+        arcs = []  # the arcs of the path in the hierarchy, from the source to the target
+        v = meeting
+        while forward[v] is not None:
+            u, w, middle = forward[v]
+            arcs.append((u, v, w, middle))
+            v = u
+        arcs.reverse()
+
+        u = meeting
+        while backward[u] is not None:
+            v, w, middle = backward[u]
+            arcs.append((u, v, w, middle))
+            u = v
+
+        labels = self._labels
+        cost, path = {source: 0}, [source]
+        d = 0
+        for arc in arcs:
+            for j, w in self._unpack(*arc):
+                d += w
+                cost[labels[j]] = d
+                path.append(labels[j])
+        cost[target] = best
+        return cost, path
+
+    # FILES
+
+    def save(self, path: Union[str, PathLike]):
+        """Saves the hierarchy in a binary file that ``load`` reads back.
+
+        Args:
+            path: The path of the file.
+
+        Raises:
+            pickle.PicklingError: Raises when a vertex can't be pickled.
+        """
+        with open(path, 'wb') as file:
+            file.write(_MAGIC)
+            pickle.dump((self._labels, array('q', self._ranks),
+                         tuple(array(a.typecode, a) for a in self._up),
+                         tuple(array(a.typecode, a) for a in self._down)),
+                        file, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(path: Union[str, PathLike]) -> ContractionHierarchy:
+        """Loads a hierarchy saved by ``save``.
+
+        Only load trusted files, the file is pickled.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            The hierarchy.
+
+        Raises:
+            ValueError: Raises when the file isn't a saved hierarchy.
+        """
+        with open(path, 'rb') as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"the file '{path}' isn't a saved contraction hierarchy")
+            labels, ranks, up, down = pickle.load(file)
+
+        return ContractionHierarchy(labels, ranks, up, down)
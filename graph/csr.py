@@ -0,0 +1,623 @@
+from __future__ import annotations
+
+from typing import (Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set,
+                    Tuple, Union)
+from array import array
+from bisect import bisect_right
+from math import inf
+from mmap import mmap as memory_map, ACCESS_READ
+from os import PathLike
+from struct import Struct
+from sys import byteorder
+import pickle
+
+from .exceptions import VertexError, EdgeError
+
+
+_MAGIC = b'CSRGRAPH'
+_VERSION = 1
+_HEADER = Struct('<8sIQQ')  # magic, version, offset and length of the metadata
+
+
+class EdgeAttribute:
+    def __init__(self, key: Hashable):
+        """Creates a weight function that returns the value of a key of the edge's data.
+
+        Unlike an equivalent lambda, two instances with the same key are equal, which lets a
+        snapshot reuse its stored weights or typed columns for it.
+
+        Args:
+            key: The key of the weight in the edges' data.
+        """
+        self._key = key
+
+    def __call__(self, data: dict):
+        return data[self._key]
+
+    def __eq__(self, other):
+        return isinstance(other, EdgeAttribute) and other._key == self._key
+
+    def __hash__(self):
+        return hash((EdgeAttribute, self._key))
+
+    def __repr__(self):
+        return f'EdgeAttribute({self._key!r})'
+
+    @property
+    def key(self) -> Hashable:
+        """The key of the weight in the edges' data."""
+        return self._key
+
+
+def _weight_sequence(weights: Iterable[float]) -> Sequence[float]:
+    """Returns the weights as an array of floats if they're all floats, otherwise as a list, so
+    the integer and exact (e.g. ``Fraction``) weights keep their types."""
+    weights = list(weights)
+    return array('d', weights) if all(type(w) is float for w in weights) else weights
+
+
+class _Side:
+    """The side section of a saved snapshot, decoded on the first access."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._value = None
+
+    @property
+    def value(self) -> tuple:
+        if self._value is None:
+            self._value = pickle.loads(self._buffer)
+            self._buffer = None
+        return self._value
+
+
+class _LazyData(Sequence):
+    """The data dictionaries of a saved snapshot, the typed columns merged with the part of the
+    side section that is decoded on the first access."""
+
+    def __init__(self, side: _Side, part: int, length: int,
+                 columns: Dict[Hashable, Sequence] = None):
+        self._side = side
+        self._part = part
+        self._length = length
+        self._columns = columns or {}
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        residual = self._side.value[self._part]
+        if not self._columns:
+            return residual[index] if residual is not None else {}
+
+        data = {key: column[index] for key, column in self._columns.items()}
+        if residual is not None:
+            data.update(residual[index])
+        return data
+
+
+class CSRGraph:
+    """An immutable compressed-sparse-row snapshot of a graph.
+
+    The vertices are mapped to dense integer ids (their position in ``labels``), the out-edges
+    of the vertex ``i`` are the positions ``offsets[i]`` to ``offsets[i + 1]`` of the
+    ``targets`` array and the data of each of those edges is at the same position of the
+    ``edge_data`` sequence (and of the ``weights`` sequence, when the snapshot was frozen with a
+    weight function). Numeric edge attributes may also be kept in typed ``columns``, as in the
+    snapshots read by ``load``.
+
+    Undirected graphs store each edge in both directions (a loop is stored once), like the
+    ``edges`` dictionary of ``Graph`` does.
+    """
+
+    __slots__ = ('_name', '_description', '_directed', '_labels', '_index', '_vertex_data',
+                 '_offsets', '_targets', '_edge_data', '_size', '_weight', '_weights',
+                 '_columns', '_in_offsets', '_in_positions')
+
+    def __init__(self, name: str, description: Optional[str], directed: bool,
+                 labels: Sequence[Hashable], vertex_data: Sequence[dict],
+                 offsets: Sequence[int], targets: Sequence[int], edge_data: Sequence[dict],
+                 weight: Callable[[dict], float] = None, weights: Sequence[float] = None,
+                 columns: Dict[Hashable, Sequence[float]] = None):
+        """Creates a snapshot from its raw arrays.
+
+        Args:
+            name: The name of the graph.
+            description: The description of the graph.
+            directed: Whether the edges are directed.
+            labels: The vertex of each vertex id.
+            vertex_data: The data of each vertex id.
+            offsets: The position in ``targets`` where the out-edges of each vertex id start,
+                followed by the total number of stored edges.
+            targets: The vertex id of the head of each stored edge.
+            edge_data: The data of each stored edge.
+            weight: The function used to compute ``weights``.
+            weights: The weight of each stored edge.
+            columns: The value of numeric edge attributes for each stored edge.
+        """
+        self._name = name
+        self._description = description
+        self._directed = directed
+        self._labels = tuple(labels)
+        self._index = {v: i for i, v in enumerate(self._labels)}
+        self._vertex_data = vertex_data
+        self._offsets = offsets
+        self._targets = targets
+        self._edge_data = edge_data
+        self._weight = weight
+        self._weights = weights
+        self._columns = columns or {}
+        self._in_offsets = None
+        self._in_positions = None
+
+        if directed:
+            self._size = len(targets)
+        else:
+            loops = sum(1 for i in range(len(self._labels))
+                        for j in targets[offsets[i]:offsets[i + 1]] if i == j)
+            self._size = (len(targets) + loops) // 2
+
+    @staticmethod
+    def from_graph(graph, weight: Callable[[dict], float] = None) -> CSRGraph:
+        """Creates a snapshot of the graph.
+
+        The edge and vertex data dictionaries are shared with the graph, not copied.
+
+        Args:
+            graph: The graph.
+            weight: The function that will extract the weight value of the edge's data, if
+                given the weights are computed once and stored in ``weights`` (an array if
+                they're all floats, otherwise a list that keeps their types).
+
+        Returns:
+            A snapshot of the graph.
+
+        Raises:
+            KeyError: Raises when the weight key don't exists in one of the edges' data.
+        """
+        labels = tuple(graph.vertices)
+        index = {v: i for i, v in enumerate(labels)}
+        edges = graph.edges
+
+        offsets = array('q', [0])
+        targets = array('q')
+        edge_data = []
+        for u in labels:
+            if u in edges:
+                for v, d in edges[u].items():
+                    targets.append(index[v])
+                    edge_data.append(d)
+            offsets.append(len(targets))
+
+        weights = _weight_sequence(map(weight, edge_data)) if weight is not None else None
+
+        return CSRGraph(graph.name, graph.description, graph.is_directed(),
+                        labels, tuple(graph.vertices.values()),
+                        offsets, targets, tuple(edge_data), weight, weights)
+
+    def __contains__(self, vertex: Hashable):
+        return vertex in self._index
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __str__(self):
+        return self._name
+
+    def __repr__(self):
+        return (f'G({{{", ".join(map(str, self._labels))}}}, '
+                f'[{", ".join(map(lambda e: f"({e[0]}, {e[1]})", self.iter_edges(data=False)))}])')
+
+    @property
+    def name(self):
+        """The name of the graph."""
+        return self._name
+
+    @property
+    def description(self):
+        """The description of the graph."""
+        return self._description
+
+    @property
+    def vertices(self) -> Dict[Hashable, dict]:
+        """A new dictionary of the vertices of the graph and their data."""
+        return dict(zip(self._labels, self._vertex_data))
+
+    @property
+    def labels(self) -> Tuple[Hashable, ...]:
+        """The vertex of each vertex id."""
+        return self._labels
+
+    @property
+    def offsets(self) -> Sequence[int]:
+        """The position in ``targets`` where the out-edges of each vertex id start."""
+        return self._offsets
+
+    @property
+    def targets(self) -> Sequence[int]:
+        """The vertex id of the head of each stored edge."""
+        return self._targets
+
+    @property
+    def edge_data(self) -> Sequence[dict]:
+        """The data of each stored edge."""
+        return self._edge_data
+
+    @property
+    def weight(self) -> Optional[Callable[[dict], float]]:
+        """The function used to compute ``weights``."""
+        return self._weight
+
+    @property
+    def weights(self) -> Optional[Sequence[float]]:
+        """The weight of each stored edge, if the snapshot was frozen with a weight function."""
+        return self._weights
+
+    @property
+    def columns(self) -> Dict[Hashable, Sequence[float]]:
+        """The value of numeric edge attributes for each stored edge, by attribute key."""
+        return self._columns
+
+    @property
+    def version(self) -> int:
+        """The number of changes made to the graph, always 0 since snapshots are immutable."""
+        return 0
+
+    def is_directed(self) -> bool:
+        """Checks if the edges of the graph are directed.
+
+        Returns:
+            True if the graph is directed, False otherwise.
+        """
+        return self._directed
+
+    def index(self, vertex_v: Hashable) -> int:
+        """Returns the vertex id of the vertex.
+
+        Args:
+            vertex_v: The vertex v.
+
+        Returns:
+            The vertex id.
+
+        Raises:
+            VertexError: Raises when the vertex isn't in the graph.
+        """
+        if vertex_v not in self._index:
+            raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
+
+        return self._index[vertex_v]
+
+    # VERTICES
+
+    def has_vertex(self, vertex_v: Hashable) -> bool:
+        return vertex_v in self._index
+
+    def get_vertex_data(self, vertex_v: Hashable) -> dict:
+        return self._vertex_data[self.index(vertex_v)]
+
+    # EDGES
+
+    def _position(self, vertex_u: Hashable, vertex_v: Hashable) -> int:
+        if vertex_u not in self._index:
+            raise VertexError(f"vertex '{vertex_u}' from the given edge '{{{vertex_u, vertex_v}}}' "
+                              f"isn't in the graph '{self}'")
+        if vertex_v not in self._index:
+            raise VertexError(f"vertex '{vertex_v}' from the given edge '{{{vertex_u, vertex_v}}}' "
+                              f"isn't in the graph '{self}'")
+
+        i, j = self._index[vertex_u], self._index[vertex_v]
+        for k in range(self._offsets[i], self._offsets[i + 1]):
+            if self._targets[k] == j:
+                return k
+        return -1
+
+    def has_edge(self, vertex_u: Hashable, vertex_v: Hashable) -> bool:
+        return self._position(vertex_u, vertex_v) != -1
+
+    def get_edge_data(self, vertex_u: Hashable, vertex_v: Hashable) -> dict:
+        if (k := self._position(vertex_u, vertex_v)) == -1:
+            raise EdgeError(f"edge '{{{vertex_u}, {vertex_v}}}' isn't in the graph '{self}'")
+
+        return self._edge_data[k]
+
+    def dataless_edges(self) -> List[Tuple[Hashable, Hashable]]:
+        return list(self.iter_edges(data=False))
+
+    # PROPERTIES
+
+    def order(self) -> int:
+        return len(self._labels)
+
+    def size(self) -> int:
+        return self._size
+
+    # NEIGHBOURS
+
+    def neighbours(self, vertex_v: Hashable) -> Set[Hashable]:
+        i = self.index(vertex_v)
+        labels = self._labels
+        return {labels[j] for j in self._targets[self._offsets[i]:self._offsets[i + 1]]}
+
+    def is_neighbour(self, vertex_u: Hashable, vertex_v: Hashable) -> bool:
+        return self.has_edge(vertex_u, vertex_v)
+
+    def successors(self, vertex_v: Hashable) -> Iterator[Tuple[Hashable, dict]]:
+        """Returns an iterator over the out-edges of the vertex.
+
+        Args:
+            vertex_v: The vertex v.
+
+        Returns:
+            An iterator of pairs of the head vertex and the edge's data.
+
+        Raises:
+            VertexError: Raises when the vertex isn't in the graph.
+        """
+        i = self.index(vertex_v)
+        lo, hi = self._offsets[i], self._offsets[i + 1]
+        return zip(map(self._labels.__getitem__, self._targets[lo:hi]), self._edge_data[lo:hi])
+
+    def weighted_successors(self, vertex_v: Hashable,
+                            weight: Callable[[dict], float]) -> Iterator[Tuple[Hashable, float]]:
+        """Returns an iterator over the out-edges of the vertex and their weights.
+
+        The stored ``weights`` are used when the weight function is the one the snapshot was
+        frozen with, as is the typed column of an ``EdgeAttribute`` weight function.
+
+        Args:
+            vertex_v: The vertex v.
+            weight: The function that will extract the weight value of the edge's data.
+
+        Returns:
+            An iterator of pairs of the head vertex and the edge's weight.
+
+        Raises:
+            VertexError: Raises when the vertex isn't in the graph.
+        """
+        i = self.index(vertex_v)
+        lo, hi = self._offsets[i], self._offsets[i + 1]
+        heads = map(self._labels.__getitem__, self._targets[lo:hi])
+        if (weights := self._stored_weights(weight)) is not None:
+            return zip(heads, weights[lo:hi])
+        return zip(heads, map(weight, self._edge_data[lo:hi]))
+
+    def _stored_weights(self, weight: Callable[[dict], float]) -> Optional[Sequence[float]]:
+        """Returns the stored weights or column computed by the weight function, if any."""
+        if self._weights is not None and weight == self._weight:
+            return self._weights
+        if isinstance(weight, EdgeAttribute) and weight.key in self._columns:
+            return self._columns[weight.key]
+        return None
+
+    def _incoming(self, vertex_v: Hashable) -> Sequence[int]:
+        """Returns the positions of the stored edges whose head is the vertex."""
+        i = self.index(vertex_v)
+        if not self._directed:
+            return range(self._offsets[i], self._offsets[i + 1])
+
+        if self._in_offsets is None:  # the reverse index is built on the first use
+            n, offsets, targets = len(self._labels), self._offsets, self._targets
+            in_offsets = array('q', bytes(8 * (n + 1)))
+            for j in targets:
+                in_offsets[j + 1] += 1
+            for j in range(n):
+                in_offsets[j + 1] += in_offsets[j]
+
+            in_positions = array('q', bytes(8 * len(targets)))
+            fill = array('q', in_offsets[:n])
+            for u in range(n):
+                for k in range(offsets[u], offsets[u + 1]):
+                    in_positions[fill[targets[k]]] = k
+                    fill[targets[k]] += 1
+
+            self._in_offsets, self._in_positions = in_offsets, in_positions
+
+        return self._in_positions[self._in_offsets[i]:self._in_offsets[i + 1]]
+
+    def _tail(self, position: int) -> int:
+        """Returns the vertex id of the tail of the stored edge."""
+        return bisect_right(self._offsets, position) - 1
+
+    def predecessors(self, vertex_v: Hashable) -> Set[Hashable]:
+        """Returns a set of vertices with an edge to the vertex v.
+
+        For directed graphs the reverse index is built on the first call.
+
+        Args:
+            vertex_v: The vertex v.
+
+        Returns:
+            A set of vertices with an edge to the vertex v.
+
+        Raises:
+            VertexError: Raises when the vertex isn't in the graph.
+        """
+        if not self._directed:
+            return self.neighbours(vertex_v)
+
+        labels = self._labels
+        return {labels[self._tail(k)] for k in self._incoming(vertex_v)}
+
+    def weighted_predecessors(self, vertex_v: Hashable, weight: Callable[[dict], float]
+                              ) -> Iterator[Tuple[Hashable, float]]:
+        """Returns an iterator over the in-edges of the vertex and their weights.
+
+        For directed graphs the reverse index is built on the first call.
+
+        Args:
+            vertex_v: The vertex v.
+            weight: The function that will extract the weight value of the edge's data.
+
+        Returns:
+            An iterator of pairs of the tail vertex and the edge's weight.
+
+        Raises:
+            VertexError: Raises when the vertex isn't in the graph.
+        """
+        if not self._directed:
+            return self.weighted_successors(vertex_v, weight)
+
+        positions = self._incoming(vertex_v)
+        tails = (self._labels[self._tail(k)] for k in positions)
+        if (weights := self._stored_weights(weight)) is not None:
+            return zip(tails, map(weights.__getitem__, positions))
+        return zip(tails, (weight(self._edge_data[k]) for k in positions))
+
+    # REPRESENTATIONS
+
+    def iter_edges(self, data: bool = True) -> Iterator[Tuple]:
+        labels, offsets, targets, edge_data = (self._labels, self._offsets, self._targets,
+                                               self._edge_data)
+        for i, u in enumerate(labels):
+            for k in range(offsets[i], offsets[i + 1]):
+                j = targets[k]
+                if self._directed or i <= j:  # undirected edges are listed from the lowest id
+                    yield (u, labels[j], edge_data[k]) if data else (u, labels[j])
+
+    def iter_adjacency(self) -> Iterator[Tuple[Hashable, Iterable[Hashable]]]:
+        labels, offsets, targets = self._labels, self._offsets, self._targets
+        for i, u in enumerate(labels):
+            if offsets[i] != offsets[i + 1]:
+                yield u, map(labels.__getitem__, targets[offsets[i]:offsets[i + 1]])
+
+    def edges_list(self) -> List[Tuple[Hashable, Hashable, dict]]:
+        return list(self.iter_edges())
+
+    def adjacency_list(self) -> Dict[Hashable, Set[Hashable]]:
+        return {u: set(heads) for u, heads in self.iter_adjacency()}
+
+    def adjacency_matrix(self,
+                         weight: Callable[[dict], int]) -> Dict[Hashable, Dict[Hashable, int]]:
+        adjacency_matrix = {u: dict.fromkeys(self._labels, inf) for u in self._labels}
+        for u, v, d in self.iter_edges():
+            adjacency_matrix[u][v] = weight(d)
+            if not self._directed:
+                adjacency_matrix[v][u] = adjacency_matrix[u][v]
+        return adjacency_matrix
+
+    # FILES
+
+    def save(self, path: Union[str, PathLike]):
+        """Saves the snapshot in a compact binary file that ``load`` can memory-map.
+
+        The file holds the vertex table, the CSR topology, a typed column for each edge
+        attribute that is an int64 integer in every edge or a float in every edge and a side
+        section with the remaining vertex and edge data, so the values keep their types.
+
+        Args:
+            path: The path of the file.
+
+        Raises:
+            pickle.PicklingError: Raises when a vertex or some data can't be pickled.
+        """
+        # the loaded snapshots build their data dictionaries on each access, so they're read
+        # once and kept alive while they're identified by id below
+        edge_data = list(self._edge_data)
+        columns = {}
+        if edge_data:
+            candidates = [key for key, value in edge_data[0].items()
+                          if type(value) in (int, float)]
+            for key in candidates:
+                values = [d.get(key) for d in edge_data]
+                if all(type(value) is int and -2 ** 63 <= value < 2 ** 63 for value in values):
+                    columns[key] = array('q', values)
+                elif all(type(value) is float for value in values):
+                    columns[key] = array('d', values)
+
+        residuals = {}  # the data shared by both directions of an edge is pickled once
+        for d in edge_data:
+            if id(d) not in residuals:
+                residuals[id(d)] = {key: value for key, value in d.items() if key not in columns}
+        residual = ([residuals[id(d)] for d in edge_data]
+                    if any(residuals.values()) else None)
+
+        sections = {}
+        with open(path, 'wb') as file:
+            file.write(bytes(_HEADER.size))
+
+            def write(name: Hashable, data):
+                file.write(bytes(-file.tell() % 8))  # the arrays are 8-byte aligned
+                data = memoryview(data).cast('B')
+                sections[name] = file.tell(), data.nbytes
+                file.write(data)
+
+            write('offsets', array('q', self._offsets))
+            write('targets', array('q', self._targets))
+            for key, column in columns.items():
+                write(('column', key), column)
+            write('side', pickle.dumps((list(self._vertex_data), residual),
+                                       pickle.HIGHEST_PROTOCOL))
+
+            metadata = pickle.dumps({
+                'name': self._name,
+                'description': self._description,
+                'directed': self._directed,
+                'byteorder': byteorder,
+                'labels': self._labels,
+                'edges': len(self._targets),
+                'columns': {key: column.typecode for key, column in columns.items()},
+                'sections': sections,
+            }, pickle.HIGHEST_PROTOCOL)
+            metadata_offset = file.tell()
+            file.write(metadata)
+
+            file.seek(0)
+            file.write(_HEADER.pack(_MAGIC, _VERSION, metadata_offset, len(metadata)))
+
+    @staticmethod
+    def load(path: Union[str, PathLike], mmap: bool = True) -> CSRGraph:
+        """Loads a snapshot saved by ``save``.
+
+        The arrays of the snapshot are views of the file's contents, so when it's memory-mapped
+        the loading is near-instant and processes loading the same file share its pages. The
+        vertex and edge data in the side section are only decoded when first accessed, the edge
+        data dictionaries are then built on each access, so changes to them aren't kept.
+
+        Only load trusted files, the vertex table and side section are pickled.
+
+        Args:
+            path: The path of the file.
+            mmap: Whether to memory-map the file instead of reading it.
+
+        Returns:
+            The snapshot.
+
+        Raises:
+            ValueError: Raises when the file isn't a saved snapshot.
+        """
+        with open(path, 'rb') as file:
+            buffer = memory_map(file.fileno(), 0, access=ACCESS_READ) if mmap else file.read()
+
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError(f"the file '{path}' isn't a saved graph")
+        magic, version, metadata_offset, metadata_length = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"the file '{path}' isn't a saved graph")
+
+        metadata = pickle.loads(view[metadata_offset:metadata_offset + metadata_length])
+
+        def section(name: Hashable, typecode: str = None):
+            offset, length = metadata['sections'][name]
+            data = view[offset:offset + length]
+            if typecode is None:
+                return data
+            if metadata['byteorder'] == byteorder:
+                return data.cast(typecode)
+            data = array(typecode, data)  # a file saved in another byte order must be copied
+            data.byteswap()
+            return data
+
+        columns = {key: section(('column', key), typecode)
+                   for key, typecode in metadata['columns'].items()}
+        side = _Side(section('side'))
+
+        labels = metadata['labels']
+        return CSRGraph(metadata['name'], metadata['description'], metadata['directed'],
+                        labels, _LazyData(side, 0, len(labels)),
+                        section('offsets', 'q'), section('targets', 'q'),
+                        _LazyData(side, 1, metadata['edges'], columns), columns=columns)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
 from math import inf
 
 from .exceptions import VertexError, EdgeError
@@ -16,6 +16,19 @@ class Digraph(BaseGraph):
             description: The description of the graph.
         """
         super().__init__(name or 'unnamed digraph', description)
+        self._in_edges = {}
+
+    @property
+    def in_edges(self) -> Dict[Hashable, Dict[Hashable, dict]]:
+        """The edges of the graph indexed by their head vertex."""
+        return self._in_edges
+
+    def clear(self):
+        super().clear()
+        self._in_edges.clear()
+
+    def is_directed(self) -> bool:
+        return True
 
     # VERTICES
 
@@ -23,20 +36,49 @@ class Digraph(BaseGraph):
         return vertex_v in self._vertices
 
     def add_vertex(self, vertex_v: Hashable, /, **data):
+        self._record('add_vertex', (vertex_v,), self._vertices.get(vertex_v))
         self._vertices[vertex_v] = data
 
+    def add_vertices_from(self, vertices: Iterable[Hashable], /, **data):
+        self._version += 1
+        journaling = self._journal is not None
+        for v in vertices:
+            if journaling:
+                self._record('add_vertex', (v,), self._vertices.get(v))
+            self._vertices[v] = dict(data)
+
     def remove_vertex(self, vertex_v: Hashable):
         if vertex_v not in self._vertices:
             raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
 
+        self._remove_incident_edges(vertex_v)
+        self._record('remove_vertex', (vertex_v,), self._vertices[vertex_v])
         del self._vertices[vertex_v]
 
     def pop_vertex(self, vertex_v: Hashable):
         if vertex_v not in self._vertices:
             raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
 
+        self._remove_incident_edges(vertex_v)
+        self._record('pop_vertex', (vertex_v,), self._vertices[vertex_v])
         return self._vertices.pop(vertex_v)
 
+    def _remove_incident_edges(self, vertex_v: Hashable):
+        """Removes the edges from and to the vertex, in O(degree)."""
+        for u, data in self._in_edges.pop(vertex_v, {}).items():
+            if u != vertex_v:
+                self._record('pop_edge', (u, vertex_v), data)
+                del self._edges[u][vertex_v]
+                if not self._edges[u]:
+                    del self._edges[u]
+
+        for v, data in self._edges.pop(vertex_v, {}).items():
+            self._record('pop_edge', (vertex_v, v), data)
+            if v != vertex_v:
+                del self._in_edges[v][vertex_v]
+                if not self._in_edges[v]:
+                    del self._in_edges[v]
+
     def get_vertex_data(self, vertex_v: Hashable) -> dict:
         if vertex_v not in self._vertices:
             raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
@@ -47,12 +89,13 @@ class Digraph(BaseGraph):
         if vertex_v not in self._vertices:
             raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
 
+        self._record('set_vertex_data', (vertex_v,), dict(self._vertices[vertex_v]))
         self._vertices[vertex_v].update(data)
 
     # EDGES
 
     def dataless_edges(self) -> List[Tuple[Hashable, Hashable]]:
-        return [(u, v) for u in self._edges for v in self._edges[u]]
+        return list(self.iter_edges(data=False))
 
     def has_edge(self, vertex_u: Hashable, vertex_v: Hashable) -> bool:
         if vertex_u not in self._vertices:
@@ -72,26 +115,60 @@ class Digraph(BaseGraph):
             raise VertexError(f"vertex '{vertex_v}' from the given edge '{{{vertex_u, vertex_v}}}' "
                               f"isn't in the graph '{self}'")
 
+        self._record('add_edge', (vertex_u, vertex_v), self._edges.get(vertex_u, {}).get(vertex_v))
         self._edges.setdefault(vertex_u, {})[vertex_v] = data
+        self._in_edges.setdefault(vertex_v, {})[vertex_u] = data
+
+    def add_edges_from(self, edges: Iterable[Tuple[Hashable, Hashable, Optional[dict]]],
+                       validate: bool = True):
+        if validate:
+            edges = list(edges)
+            missing = ({e[0] for e in edges} | {e[1] for e in edges}) - self._vertices.keys()
+            if missing:
+                raise VertexError(f"vertices '{{{', '.join(map(str, missing))}}}' from the given "
+                                  f"edges aren't in the graph '{self}'")
+
+        out_edges, in_edges = self._edges, self._in_edges
+        self._version += 1
+        journaling = self._journal is not None
+        for e in edges:
+            u, v = e[0], e[1]
+            data = dict(e[2]) if len(e) == 3 else {}
+
+            if journaling:
+                self._record('add_edge', (u, v), out_edges.get(u, {}).get(v))
+
+            out_edges.setdefault(u, {})[v] = data
+            in_edges.setdefault(v, {})[u] = data
 
     def remove_edge(self, vertex_u: Hashable, vertex_v: Hashable):
         if not self.has_edge(vertex_u, vertex_v):
             raise EdgeError(f"edge '{{{vertex_u}, {vertex_v}}}' isn't in the graph '{self}'")
 
+        self._record('remove_edge', (vertex_u, vertex_v), self._edges[vertex_u][vertex_v])
         del self._edges[vertex_u][vertex_v]
         if not self._edges[vertex_u]:
             del self._edges[vertex_u]
 
+        del self._in_edges[vertex_v][vertex_u]
+        if not self._in_edges[vertex_v]:
+            del self._in_edges[vertex_v]
+
     def pop_edge(self, vertex_u: Hashable, vertex_v: Hashable):
         if not self.has_edge(vertex_u, vertex_v):
             raise EdgeError(f"neither '{{{vertex_u}, {vertex_v}}}' nor '{{{vertex_v}, {vertex_u}}}'"
                             f"edges are in the graph '{self}'")
 
         edge_data = self._edges[vertex_u].pop(vertex_v)
+        self._record('pop_edge', (vertex_u, vertex_v), edge_data)
 
         if not self._edges[vertex_u]:
             del self._edges[vertex_u]
 
+        del self._in_edges[vertex_v][vertex_u]
+        if not self._in_edges[vertex_v]:
+            del self._in_edges[vertex_v]
+
         return edge_data
 
     def get_edge_data(self, vertex_u: Hashable, vertex_v: Hashable):
@@ -104,6 +181,7 @@ class Digraph(BaseGraph):
         if not self.has_edge(vertex_u, vertex_v):
             raise EdgeError(f"edge '{{{vertex_u}, {vertex_v}}}' isn't in the graph '{self}'")
 
+        self._record('set_edge_data', (vertex_u, vertex_v), dict(self._edges[vertex_u][vertex_v]))
         self._edges[vertex_u][vertex_v].update(data)
 
     # PROPERTIES
@@ -125,13 +203,39 @@ class Digraph(BaseGraph):
     def is_neighbour(self, vertex_u: Hashable, vertex_v: Hashable) -> bool:
         return self.has_edge(vertex_u, vertex_v)
 
+    def predecessors(self, vertex_v: Hashable) -> Set[Hashable]:
+        """Returns a set of vertices with an edge to the vertex v.
+
+        Args:
+            vertex_v: The vertex v.
+
+        Returns:
+            A set of vertices with an edge to the vertex v.
+
+        Raises:
+            VertexError: Raises when the vertex isn't in the graph.
+        """
+        if vertex_v not in self._vertices:
+            raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
+
+        return set(self._in_edges[vertex_v]) if vertex_v in self._in_edges else set()
+
     # REPRESENTATIONS
 
+    def iter_edges(self, data: bool = True) -> Iterator[Tuple]:
+        for u, heads in self._edges.items():
+            for v, d in heads.items():
+                yield (u, v, d) if data else (u, v)
+
+    def iter_adjacency(self) -> Iterator[Tuple[Hashable, Iterable[Hashable]]]:
+        for u, heads in self._edges.items():
+            yield u, heads.keys()
+
     def edges_list(self) -> List[Tuple[Hashable, Hashable, dict]]:
-        return [(u, v, self._edges[u][v]) for u in self._edges for v in self._edges[u]]
+        return list(self.iter_edges())
 
     def adjacency_list(self) -> Dict[Hashable, Set[Hashable]]:
-        return {u: set(self._edges[u]) for u in self._edges}
+        return {u: set(heads) for u, heads in self.iter_adjacency()}
 
     def adjacency_matrix(self,
                          weight: Callable[[dict], int]) -> Dict[Hashable, Dict[Hashable, int]]:
@@ -179,7 +283,7 @@ class Digraph(BaseGraph):
         if vertex_v not in self._vertices:
             raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
 
-        return sum(1 for u in self._edges if vertex_v in self._edges[u])
+        return len(self._in_edges[vertex_v]) if vertex_v in self._in_edges else 0
 
     def out_degree(self, vertex_v: Hashable) -> int:
         """Returns the out-degree of the vertex.
@@ -318,13 +422,8 @@ class Digraph(BaseGraph):
             VertexError: Raises when a vertex from the set of edges isn't in set of vertices.
         """
         graph = Digraph(name, desc)
-        for v in vertices:
-            graph.add_vertex(v)
-        for e in edges:
-            if len(e) == 3:
-                graph.add_edge(e[0], e[1], **e[2])
-            else:
-                graph.add_edge(e[0], e[1])
+        graph.add_vertices_from(vertices)
+        graph.add_edges_from(edges)
         return graph
 
     @staticmethod
@@ -342,10 +441,7 @@ class Digraph(BaseGraph):
             A directed graph.
         """
         graph = Digraph(name, desc)
-        for e in edges:
-            u, v = e[0], e[1]
-            graph.add_vertex(u)
-            graph.add_vertex(v)
-
-            graph._edges.setdefault(u, {})[v] = e[2] if len(e) == 3 else {}
+        edges = list(edges)
+        graph.add_vertices_from(dict.fromkeys(v for e in edges for v in e[:2]))
+        graph.add_edges_from(edges, validate=False)
         return graph
@@ -0,0 +1,111 @@
+from typing import Hashable, Iterable
+
+
+class DisjointSet:
+    def __init__(self, elements: Iterable[Hashable] = ()):
+        """Creates a disjoint-set (union-find) structure, with each element in its own subset.
+
+        Args:
+            elements: The elements.
+        """
+        self._parents = {}
+        self._sizes = {}
+        self._subsets = 0
+        for x in elements:
+            self.add(x)
+
+    def __contains__(self, element: Hashable):
+        return element in self._parents
+
+    def __len__(self):
+        return len(self._parents)
+
+    @property
+    def subsets(self) -> int:
+        """The number of disjoint subsets."""
+        return self._subsets
+
+    def add(self, element_x: Hashable):
+        """Adds an element in its own subset, if it isn't in the structure yet.
+
+        Args:
+            element_x: The element x.
+        """
+        if element_x not in self._parents:
+            self._parents[element_x] = element_x
+            self._sizes[element_x] = 1
+            self._subsets += 1
+
+    def find(self, element_x: Hashable) -> Hashable:
+        """Returns the representative element of the subset of the element.
+
+        The path to the representative is compressed along the way (path halving).
+
+        Args:
+            element_x: The element x.
+
+        Returns:
+            The representative element.
+
+        Raises:
+            KeyError: Raises when the element isn't in the structure.
+        """
+        parents = self._parents
+        while (parent := parents[element_x]) != element_x:
+            parents[element_x] = element_x = parents[parent]
+        return element_x
+
+    def union(self, element_x: Hashable, element_y: Hashable) -> bool:
+        """Merges the subsets of both elements, the smaller subset goes under the bigger.
+
+        Args:
+            element_x: The element x.
+            element_y: The element y.
+
+        Returns:
+            True if the subsets were merged, False if both elements were already in the same
+            subset.
+
+        Raises:
+            KeyError: Raises when an element isn't in the structure.
+        """
+        root_x, root_y = self.find(element_x), self.find(element_y)
+        if root_x == root_y:
+            return False
+
+        if self._sizes[root_x] < self._sizes[root_y]:
+            root_x, root_y = root_y, root_x
+
+        self._parents[root_y] = root_x
+        self._sizes[root_x] += self._sizes.pop(root_y)
+        self._subsets -= 1
+        return True
+
+    def connected(self, element_x: Hashable, element_y: Hashable) -> bool:
+        """Checks if both elements are in the same subset.
+
+        Args:
+            element_x: The element x.
+            element_y: The element y.
+
+        Returns:
+            True if both elements are in the same subset, False otherwise.
+
+        Raises:
+            KeyError: Raises when an element isn't in the structure.
+        """
+        return self.find(element_x) == self.find(element_y)
+
+    def size(self, element_x: Hashable) -> int:
+        """Returns the number of elements in the subset of the element.
+
+        Args:
+            element_x: The element x.
+
+        Returns:
+            The size of the subset.
+
+        Raises:
+            KeyError: Raises when the element isn't in the structure.
+        """
+        return self._sizes[self.find(element_x)]
@@ -6,3 +6,12 @@ class VertexError(Exception):
 
 class EdgeError(Exception):
     """Raise when the edge isn't in the graph."""
+
+
+class NegativeCycleError(ValueError):
+    """Raise when the graph has a negative-weight cycle, which is in the ``cycle`` attribute as
+    the list of its vertices, starting and ending with the same vertex."""
+
+    def __init__(self, message: str, cycle: list):
+        super().__init__(message)
+        self.cycle = cycle
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
 from math import inf
 
 from .exceptions import VertexError, EdgeError
@@ -16,6 +16,14 @@ class Graph(BaseGraph):
             description: The description of the graph.
         """
         super().__init__(name or 'unnamed graph', description)
+        self._size = 0
+
+    def clear(self):
+        super().clear()
+        self._size = 0
+
+    def is_directed(self) -> bool:
+        return False
 
     # VERTICES
 
@@ -23,20 +31,43 @@ class Graph(BaseGraph):
         return vertex_v in self._vertices
 
     def add_vertex(self, vertex_v: Hashable, /, **data):
+        self._record('add_vertex', (vertex_v,), self._vertices.get(vertex_v))
         self._vertices[vertex_v] = data
 
+    def add_vertices_from(self, vertices: Iterable[Hashable], /, **data):
+        self._version += 1
+        journaling = self._journal is not None
+        for v in vertices:
+            if journaling:
+                self._record('add_vertex', (v,), self._vertices.get(v))
+            self._vertices[v] = dict(data)
+
     def remove_vertex(self, vertex_v: Hashable):
         if vertex_v not in self._vertices:
             raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
 
+        self._remove_incident_edges(vertex_v)
+        self._record('remove_vertex', (vertex_v,), self._vertices[vertex_v])
         del self._vertices[vertex_v]
 
     def pop_vertex(self, vertex_v: Hashable):
         if vertex_v not in self._vertices:
             raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
 
+        self._remove_incident_edges(vertex_v)
+        self._record('pop_vertex', (vertex_v,), self._vertices[vertex_v])
         return self._vertices.pop(vertex_v)
 
+    def _remove_incident_edges(self, vertex_v: Hashable):
+        """Removes the edges incident to the vertex, in O(degree)."""
+        for u, data in self._edges.pop(vertex_v, {}).items():
+            self._size -= 1
+            self._record('pop_edge', (vertex_v, u), data)
+            if u != vertex_v:
+                del self._edges[u][vertex_v]
+                if not self._edges[u]:
+                    del self._edges[u]
+
     def get_vertex_data(self, vertex_v: Hashable) -> dict:
         if vertex_v not in self._vertices:
             raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
@@ -47,17 +78,13 @@ class Graph(BaseGraph):
         if vertex_v not in self._vertices:
             raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
 
+        self._record('set_vertex_data', (vertex_v,), dict(self._vertices[vertex_v]))
         self._vertices[vertex_v].update(data)
 
     # EDGES
 
     def dataless_edges(self) -> List[Tuple[Hashable, Hashable]]:
-        unique_edges = []
-        for u in self._edges:
-            for v in self._edges[u]:
-                if (v, u) not in unique_edges:  # ignore duplicates
-                    unique_edges.append((u, v))
-        return unique_edges
+        return list(self.iter_edges(data=False))
 
     def has_edge(self, vertex_u: Hashable, vertex_v: Hashable) -> bool:
         if vertex_u not in self._vertices:
@@ -77,17 +104,48 @@ class Graph(BaseGraph):
             raise VertexError(f"vertex '{vertex_v}' from the given edge '{{{vertex_u, vertex_v}}}' "
                               f"isn't in the graph '{self}'")
 
+        if vertex_u not in self._edges or vertex_v not in self._edges[vertex_u]:
+            self._size += 1
+            self._record('add_edge', (vertex_u, vertex_v), None)
+        else:
+            self._record('add_edge', (vertex_u, vertex_v), self._edges[vertex_u][vertex_v])
+
         self._edges.setdefault(vertex_u, {})[vertex_v] = data
         self._edges.setdefault(vertex_v, {})[vertex_u] = data
 
+    def add_edges_from(self, edges: Iterable[Tuple[Hashable, Hashable, Optional[dict]]],
+                       validate: bool = True):
+        if validate:
+            edges = list(edges)
+            missing = ({e[0] for e in edges} | {e[1] for e in edges}) - self._vertices.keys()
+            if missing:
+                raise VertexError(f"vertices '{{{', '.join(map(str, missing))}}}' from the given "
+                                  f"edges aren't in the graph '{self}'")
+
+        graph_edges = self._edges
+        self._version += 1
+        journaling = self._journal is not None
+        for e in edges:
+            u, v = e[0], e[1]
+            data = dict(e[2]) if len(e) == 3 else {}
+
+            if journaling:
+                self._record('add_edge', (u, v), graph_edges.get(u, {}).get(v))
+            if u not in graph_edges or v not in graph_edges[u]:
+                self._size += 1
+            graph_edges.setdefault(u, {})[v] = data
+            graph_edges.setdefault(v, {})[u] = data
+
     def remove_edge(self, vertex_u: Hashable, vertex_v: Hashable):
         if not self.has_edge(vertex_u, vertex_v):
             raise EdgeError(f"neither '{{{vertex_u}, {vertex_v}}}' nor '{{{vertex_v}, {vertex_u}}}'"
                             f"edges are in the graph '{self}'")
 
+        self._record('remove_edge', (vertex_u, vertex_v), self._edges[vertex_u][vertex_v])
         del self._edges[vertex_u][vertex_v]
         if not self._edges[vertex_u]:
             del self._edges[vertex_u]
+        self._size -= 1
 
         if vertex_v != vertex_u:
             del self._edges[vertex_v][vertex_u]
@@ -100,9 +158,11 @@ class Graph(BaseGraph):
                             f"edges are in the graph '{self}'")
 
         edge_data = self._edges[vertex_u].pop(vertex_v)
+        self._record('pop_edge', (vertex_u, vertex_v), edge_data)
 
         if not self._edges[vertex_u]:
             del self._edges[vertex_u]
+        self._size -= 1
 
         if vertex_v != vertex_u:
             del self._edges[vertex_v][vertex_u]
@@ -123,6 +183,7 @@ class Graph(BaseGraph):
             raise EdgeError(f"neither '{{{vertex_u}, {vertex_v}}}' nor '{{{vertex_v}, {vertex_u}}}'"
                             f"edges are in the graph '{self}'")
 
+        self._record('set_edge_data', (vertex_u, vertex_v), dict(self._edges[vertex_u][vertex_v]))
         self._edges[vertex_u][vertex_v].update(data)
         self._edges[vertex_v][vertex_u].update(data)
 
@@ -132,7 +193,7 @@ class Graph(BaseGraph):
         return len(self._vertices)
 
     def size(self) -> int:
-        return len(self.dataless_edges())
+        return self._size
 
     # NEIGHBOURS
 
@@ -147,11 +208,23 @@ class Graph(BaseGraph):
 
     # REPRESENTATIONS
 
+    def iter_edges(self, data: bool = True) -> Iterator[Tuple]:
+        visited = set()
+        for u, heads in self._edges.items():
+            visited.add(u)
+            for v, d in heads.items():
+                if v == u or v not in visited:  # each edge is listed from its first endpoint
+                    yield (u, v, d) if data else (u, v)
+
+    def iter_adjacency(self) -> Iterator[Tuple[Hashable, Iterable[Hashable]]]:
+        for u, heads in self._edges.items():
+            yield u, heads.keys()
+
     def edges_list(self) -> List[Tuple[Hashable, Hashable, dict]]:
-        return [(u, v, self._edges[u][v]) for u, v in self.dataless_edges()]
+        return list(self.iter_edges())
 
     def adjacency_list(self) -> Dict[Hashable, Set[Hashable]]:
-        return {u: set(self._edges[u]) for u in self._edges}
+        return {u: set(heads) for u, heads in self.iter_adjacency()}
 
     def adjacency_matrix(self,
                          weight: Callable[[dict], int]) -> Dict[Hashable, Dict[Hashable, int]]:
@@ -245,13 +318,8 @@ class Graph(BaseGraph):
             VertexError: Raises when a vertex from the set of edges isn't in set of vertices.
         """
         graph = Graph(name, desc)
-        for v in vertices:
-            graph.add_vertex(v)
-        for e in edges:
-            if len(e) == 3:
-                graph.add_edge(e[0], e[1], **e[2])
-            else:
-                graph.add_edge(e[0], e[1])
+        graph.add_vertices_from(vertices)
+        graph.add_edges_from(edges)
         return graph
 
     @staticmethod
@@ -269,12 +337,7 @@ class Graph(BaseGraph):
             A undirected graph.
         """
         graph = Graph(name, desc)
-        for e in edges:
-            u, v = e[0], e[1]
-            graph.add_vertex(u)
-            graph.add_vertex(v)
-
-            data = e[2] if len(e) == 3 else {}
-            graph._edges.setdefault(u, {})[v] = data
-            graph._edges.setdefault(v, {})[u] = data
+        edges = list(edges)
+        graph.add_vertices_from(dict.fromkeys(v for e in edges for v in e[:2]))
+        graph.add_edges_from(edges, validate=False)
         return graph
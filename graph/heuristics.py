@@ -0,0 +1,48 @@
+from typing import Callable, Hashable
+
+from math import asin, cos, hypot, radians, sin, sqrt
+
+
+def euclidean_heuristic(x_key: Hashable = 'x', y_key: Hashable = 'y',
+                        scale: float = 1.0) -> Callable[[dict, dict], float]:
+    """Returns a heuristic that estimates the distance between two vertices as the straight
+    line between their planar coordinates.
+
+    Args:
+        x_key: The key of the x coordinate in the vertices' data.
+        y_key: The key of the y coordinate in the vertices' data.
+        scale: The factor that converts a coordinate distance to the unit of the edges' weights,
+            it must not make the estimate bigger than the real distance.
+
+    Returns:
+        A heuristic that receives the data of two vertices.
+    """
+    def heuristic(data_u: dict, data_v: dict) -> float:
+        return scale * hypot(data_u[x_key] - data_v[x_key], data_u[y_key] - data_v[y_key])
+
+    return heuristic
+
+
+def haversine_heuristic(latitude_key: Hashable = 'lat', longitude_key: Hashable = 'lon',
+                        radius: float = 6371.0088) -> Callable[[dict, dict], float]:
+    """Returns a heuristic that estimates the distance between two vertices as the great-circle
+    distance between their geographic coordinates.
+
+    Args:
+        latitude_key: The key of the latitude, in degrees, in the vertices' data.
+        longitude_key: The key of the longitude, in degrees, in the vertices' data.
+        radius: The radius of the sphere in the unit of the edges' weights, by default the mean
+            radius of the Earth in kilometers.
+
+    Returns:
+        A heuristic that receives the data of two vertices.
+    """
+    def heuristic(data_u: dict, data_v: dict) -> float:
+        latitude_u, latitude_v = radians(data_u[latitude_key]), radians(data_v[latitude_key])
+        delta_longitude = radians(data_v[longitude_key] - data_u[longitude_key])
+
+        h = (sin((latitude_v - latitude_u) / 2) ** 2
+             + cos(latitude_u) * cos(latitude_v) * sin(delta_longitude / 2) ** 2)
+        return 2 * radius * asin(min(1.0, sqrt(h)))
+
+    return heuristic
@@ -0,0 +1,95 @@
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Sequence, Union
+
+from csv import reader as csv_reader
+from os import PathLike
+
+from .basegraph import BaseGraph
+from .graph import Graph
+
+
+def _rows(file, delimiter: str = None) -> Iterator[List[str]]:
+    """Yields the fields of each line of the file, one line at a time."""
+    if delimiter is None:
+        return map(str.split, file)
+    return csv_reader(file, delimiter=delimiter, skipinitialspace=True)
+
+
+def read_edgelist(path: Union[str, PathLike],
+                  graph: BaseGraph = None,
+                  delimiter: str = None,
+                  columns: Sequence[str] = ('weight',),
+                  converters: Dict[str, Callable[[str], Any]] = None,
+                  vertex_type: Callable[[str], Hashable] = str,
+                  comments: str = '#',
+                  chunk_size: int = 65536,
+                  progress: Callable[[int, int], None] = None,
+                  encoding: str = 'utf-8') -> BaseGraph:
+    """Reads a graph from an edge-list file, e.g. ``u,v,weight`` lines.
+
+    The file is read incrementally and its edges are inserted in chunks with the bulk API, so
+    the memory used is bounded by the graph itself and not by the size of the file.
+
+    Args:
+        path: The path of the file.
+        graph: The graph where the edges are inserted, by default a new undirected graph. Pass a
+            ``Digraph`` to read directed edges.
+        delimiter: The delimiter between the fields, e.g. ``','`` for CSV or ``'\\t'`` for TSV,
+            by default any whitespace.
+        columns: The data keys of the fields after vertex u and vertex v, the extra fields of a
+            line are ignored and missing ones are left out of the edge's data.
+        converters: The function that converts the field of each data key, e.g.
+            ``{'weight': float}``, the fields without one are kept as strings.
+        vertex_type: The function that converts the vertices' fields.
+        comments: The prefix of the lines to skip.
+        chunk_size: The number of edges inserted at once.
+        progress: The function called after each chunk with the number of lines read and the
+            number of edges inserted so far.
+        encoding: The encoding of the file.
+
+    Returns:
+        The graph.
+
+    Raises:
+        ValueError: Raises when a line has less than two fields or a converter fails.
+    """
+    if graph is None:
+        graph = Graph()
+
+    converters = [(i + 2, key, (converters or {}).get(key)) for i, key in enumerate(columns)]
+    vertices = graph.vertices
+
+    lines = edges = 0
+    chunk = []
+
+    def insert_chunk():
+        # the vertices are inserted in the order they're first seen, not in a hash order
+        graph.add_vertices_from(dict.fromkeys(v for e in chunk for v in e[:2]
+                                              if v not in vertices))
+        graph.add_edges_from(chunk, validate=False)
+        chunk.clear()
+        if progress is not None:
+            progress(lines, edges)
+
+    with open(path, newline='' if delimiter is not None else None, encoding=encoding) as file:
+        for fields in _rows(file, delimiter):
+            lines += 1
+            if not fields or not fields[0] or comments and fields[0].startswith(comments):
+                continue
+            if len(fields) < 2:
+                raise ValueError(f"line {lines} of the file '{path}' doesn't have an edge")
+
+            data = {}
+            try:
+                for i, key, converter in converters:
+                    if i < len(fields):
+                        data[key] = converter(fields[i]) if converter else fields[i]
+                chunk.append((vertex_type(fields[0]), vertex_type(fields[1]), data))
+            except ValueError as e:
+                raise ValueError(f"line {lines} of the file '{path}': {e}") from e
+
+            edges += 1
+            if len(chunk) >= chunk_size:
+                insert_chunk()
+
+    insert_chunk()
+    return graph
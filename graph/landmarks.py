@@ -0,0 +1,291 @@
+from typing import Callable, Hashable, Iterable, List, Optional, Tuple
+
+from array import array
+from heapq import heappop, heappush
+from math import inf
+from random import Random
+
+from .algorithms import (AnyGraph, _search_to, _settle, _weighted_predecessors,
+                         _weighted_successors, dijkstra)
+from .exceptions import VertexError
+
+
+class Landmarks:
+    def __init__(self, graph: AnyGraph, weight: Callable[[dict], float], count: int = 8,
+                 strategy: str = 'farthest', seed: int = None):
+        """Selects landmarks of the graph and computes their distance tables, for goal-directed
+        searches (A*, landmarks and triangle inequality, known as ALT).
+
+        The distances from (and, in directed graphs, to) each landmark are stored in arrays of
+        floats indexed by vertex id, with the shortest path trees used to update them.
+
+        Args:
+            graph: The graph, which must not have negative weights.
+            weight: The function that will extract the weight value of the edge's data.
+            count: The number of landmarks, at most the order of the graph.
+            strategy: How the landmarks are selected, ``'farthest'`` picks the vertex farthest
+                from the landmarks already selected, ``'avoid'`` picks a vertex in the region
+                where the current landmarks give the worst bounds, which costs more to select
+                but gives better bounds.
+            seed: The seed of the random start vertex.
+
+        Raises:
+            ValueError: Raises when the strategy isn't known.
+        """
+        if strategy not in ('farthest', 'avoid'):
+            raise ValueError(f"strategy '{strategy}' isn't 'farthest' nor 'avoid'")
+
+        self._graph = graph
+        self._weight = weight
+        self._labels = tuple(graph.vertices)
+        self._index = {v: i for i, v in enumerate(self._labels)}
+        self._directed = graph.is_directed()
+        self._landmarks = []
+        # the distances and shortest path tree parents (-1 if none) of each landmark, by vertex id
+        self._distances_from, self._parents_from = [], []
+        self._distances_to, self._parents_to = [], []
+
+        n = len(self._labels)
+        random = Random(seed)
+        start = random.randrange(n) if n else None
+        while len(self._landmarks) < min(count, n):
+            if strategy == 'farthest':
+                landmark = self._farthest(start)
+            else:
+                landmark = self._avoid(random.randrange(n))
+            self._add(landmark)
+
+    @property
+    def graph(self) -> AnyGraph:
+        """The graph."""
+        return self._graph
+
+    @property
+    def landmarks(self) -> Tuple[Hashable, ...]:
+        """The landmarks, in selection order."""
+        return tuple(self._labels[i] for i in self._landmarks)
+
+    def _tree(self, root: int, reverse: bool) -> Tuple[array, array]:
+        """Returns the distances and parents of the shortest path tree from (or, if reverse,
+        to) the vertex id, by vertex id."""
+        if reverse:
+            distance, parents = {self._labels[root]: 0}, {self._labels[root]: None}
+            for _ in _settle(_weighted_predecessors(self._graph, self._weight), distance, parents,
+                             [self._labels[root]]):
+                pass
+        else:
+            distance, parents = dijkstra(self._graph, self._labels[root], self._weight)
+
+        index = self._index
+        return (array('d', (distance.get(v, inf) for v in self._labels)),
+                array('q', (-1 if parents.get(v) is None else index[parents[v]]
+                            for v in self._labels)))
+
+    def _add(self, landmark: int):
+        distances, parents = self._tree(landmark, False)
+        self._landmarks.append(landmark)
+        self._distances_from.append(distances)
+        self._parents_from.append(parents)
+        if self._directed:
+            distances, parents = self._tree(landmark, True)
+        self._distances_to.append(distances)
+        self._parents_to.append(parents)
+
+    def _farthest(self, start: int) -> int:
+        """Returns the vertex id farthest from the landmarks, or from the start vertex id if
+        there are none yet. Unreachable vertices are the farthest."""
+        if not self._landmarks:
+            tables = [self._tree(start, False)[0]]
+        else:
+            tables = self._distances_from
+
+        chosen = set(self._landmarks)
+        return max((i for i in range(len(self._labels)) if i not in chosen),
+                   key=lambda i: min(table[i] for table in tables))
+
+    def _avoid(self, root: int) -> int:
+        """Returns a leaf of the shortest path tree from the root vertex id whose subtree has
+        the largest sum of lower bound errors, skipping the subtrees with landmarks."""
+        distances, parents = self._tree(root, False)
+        reached = sorted((i for i, d in enumerate(distances) if d < inf),
+                         key=distances.__getitem__, reverse=True)
+
+        children = {}
+        sizes = [0.0] * len(self._labels)
+        covered = set(self._landmarks)
+        for i in reached:  # the children come before their parents
+            if i in covered:
+                sizes[i] = 0
+            else:
+                sizes[i] += distances[i] - self._bound(root, i)
+            if parents[i] != -1:
+                children.setdefault(parents[i], []).append(i)
+                if i in covered:
+                    covered.add(parents[i])
+                else:
+                    sizes[parents[i]] += sizes[i]
+
+        v = root
+        while v in children:
+            best = max(children[v], key=sizes.__getitem__)
+            if sizes[best] <= 0:
+                break
+            v = best
+
+        if v in self._landmarks:  # every vertex reached is already covered
+            chosen = set(self._landmarks)
+            return next(i for i in range(len(self._labels)) if i not in chosen)
+        return v
+
+    def _bound(self, source: int, target: int) -> float:
+        """Returns the lower bound of the distance between the vertex ids."""
+        bound = 0
+        for distances_from, distances_to in zip(self._distances_from, self._distances_to):
+            if distances_from[target] < inf and distances_from[source] < inf:
+                bound = max(bound, distances_from[target] - distances_from[source])
+            if distances_to[source] < inf and distances_to[target] < inf:
+                bound = max(bound, distances_to[source] - distances_to[target])
+        return bound
+
+    def lower_bound(self, source: Hashable, target: Hashable) -> float:
+        """Returns a lower bound of the distance between two vertices, by the triangle
+        inequality with the landmarks.
+
+        Args:
+            source: The vertex where the path starts.
+            target: The vertex where the path ends.
+
+        Returns:
+            The lower bound.
+
+        Raises:
+            VertexError: Raises when a vertex isn't in the graph.
+        """
+        for v in (source, target):
+            if v not in self._index:
+                raise VertexError(f"vertex '{v}' isn't in the graph '{self._graph}'")
+
+        return self._bound(self._index[source], self._index[target])
+
+    def shortest_path(self, source: Hashable, target: Hashable, stats: dict = None):
+        """Finds the shortest path between two vertices with the A* search, guided by the lower
+        bounds of the landmarks.
+
+        Args:
+            source: The vertex where the path starts.
+            target: The vertex where the path ends.
+            stats: A dictionary that will receive the number of settled vertices.
+
+        Returns:
+            The same as ``dijkstra_to``.
+
+        Raises:
+            VertexError: Raises when the target isn't in the graph.
+        """
+        if target not in self._index:
+            raise VertexError(f"vertex '{target}' isn't in the graph '{self._graph}'")
+
+        index, t = self._index, self._index[target]
+        estimates = {}
+
+        def potential(v: Hashable) -> float:
+            if v not in estimates:
+                estimates[v] = self._bound(index[v], t)
+            return estimates[v]
+
+        return _search_to(self._graph, source, target, self._weight, stats, potential)
+
+    def update(self, edges: Iterable[Tuple[Hashable, Hashable]]):
+        """Updates the distance tables after the edges changed, e.g. their weights.
+
+        Only the vertices whose shortest path tree goes through a changed edge are searched
+        again, so a local change costs a local search instead of rebuilding the tables. Added
+        and removed edges are handled as well, but the vertices must stay the same.
+
+        Args:
+            edges: The changed edges, each composed of vertex u and vertex v.
+
+        Raises:
+            VertexError: Raises when a vertex isn't in the graph.
+        """
+        arcs = []
+        for u, v in edges:
+            for w in (u, v):
+                if w not in self._index:
+                    raise VertexError(f"vertex '{w}' isn't in the graph '{self._graph}'")
+            arcs.append((self._index[u], self._index[v]))
+            if not self._directed:
+                arcs.append((self._index[v], self._index[u]))
+
+        successors = _weighted_successors(self._graph, self._weight)
+        predecessors = _weighted_predecessors(self._graph, self._weight)
+        for k in range(len(self._landmarks)):
+            self._repair(self._distances_from[k], self._parents_from[k], arcs,
+                         successors, predecessors)
+            if self._directed:
+                self._repair(self._distances_to[k], self._parents_to[k],
+                             [(j, i) for i, j in arcs], predecessors, successors)
+
+    def _repair(self, distances: array, parents: array, arcs: List[Tuple[int, int]],
+                successors: Callable, predecessors: Callable):
+        """Repairs a shortest path tree after its arcs (pairs of vertex ids) changed."""
+        labels, index = self._labels, self._index
+
+        # the subtrees below the changed arcs of the tree are searched again
+        children = {}
+        for i, p in enumerate(parents):
+            if p != -1:
+                children.setdefault(p, []).append(i)
+        affected = set()
+        stack = [j for i, j in arcs if parents[j] == i]
+        while stack:
+            if (j := stack.pop()) not in affected:
+                affected.add(j)
+                stack.extend(children.get(j, ()))
+        for j in affected:
+            distances[j], parents[j] = inf, -1
+
+        heap = []
+
+        def relax(i: int, j: int, w: float):
+            if distances[i] + w < distances[j]:
+                distances[j], parents[j] = distances[i] + w, i
+                heappush(heap, (distances[j], j))
+
+        for j in affected:
+            for u, w in predecessors(labels[j]):
+                if index[u] not in affected:
+                    relax(index[u], j, w)
+        for i, j in arcs:
+            for v, w in successors(labels[i]):
+                if index[v] == j:
+                    relax(i, j, w)
+
+        while heap:
+            d, i = heappop(heap)
+            if d > distances[i]:
+                continue
+            for v, w in successors(labels[i]):
+                relax(i, index[v], w)
+
+    def distances(self, landmark: Hashable, reverse: bool = False) -> Optional[array]:
+        """Returns the distances from (or, if reverse, to) a landmark, by vertex id.
+
+        Args:
+            landmark: The landmark.
+            reverse: Whether to return the distances to the landmark.
+
+        Returns:
+            The array of distances, indexed like ``labels`` (inf if unreachable), or None if
+            the vertex isn't a landmark.
+        """
+        if (i := self._index.get(landmark)) is None or i not in self._landmarks:
+            return None
+
+        k = self._landmarks.index(i)
+        return (self._distances_to if reverse else self._distances_from)[k]
+
+    @property
+    def labels(self) -> Tuple[Hashable, ...]:
+        """The vertex of each vertex id."""
+        return self._labels
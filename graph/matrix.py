@@ -0,0 +1,118 @@
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .exceptions import VertexError
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it's only needed by the dense matrices
+    np = None
+
+
+class PathMatrix:
+    def __init__(self, labels: Sequence[Hashable], distances: 'np.ndarray',
+                 successors: 'np.ndarray'):
+        """Creates the all-pairs shortest paths of a graph, as dense matrices by vertex id.
+
+        The vertices are only looked up when a distance or path is asked for, so the matrices
+        can be computed and kept without building V² dictionary entries.
+
+        Args:
+            labels: The vertex of each vertex id.
+            distances: The float64 matrix of the distance between each pair of vertex ids (inf
+                if unreachable).
+            successors: The int32 matrix of the vertex id after the first in the shortest path
+                between each pair of vertex ids (-1 if none).
+        """
+        self._labels = tuple(labels)
+        self._index = {v: i for i, v in enumerate(self._labels)}
+        self._distances = distances
+        self._successors = successors
+
+    @property
+    def labels(self) -> Tuple[Hashable, ...]:
+        """The vertex of each vertex id."""
+        return self._labels
+
+    @property
+    def distances(self) -> 'np.ndarray':
+        """The distance between each pair of vertex ids."""
+        return self._distances
+
+    @property
+    def successors(self) -> 'np.ndarray':
+        """The second vertex id in the shortest path between each pair of vertex ids."""
+        return self._successors
+
+    def index(self, vertex_v: Hashable) -> int:
+        """Returns the vertex id of a vertex.
+
+        Raises:
+            VertexError: Raises when the vertex isn't in the graph.
+        """
+        if vertex_v not in self._index:
+            raise VertexError(f"vertex '{vertex_v}' isn't in the matrix")
+
+        return self._index[vertex_v]
+
+    def distance(self, vertex_u: Hashable, vertex_v: Hashable) -> float:
+        """Returns the distance between two vertices.
+
+        Raises:
+            VertexError: Raises when a vertex isn't in the graph.
+        """
+        return float(self._distances[self.index(vertex_u), self.index(vertex_v)])
+
+    def path(self, vertex_u: Hashable, vertex_v: Hashable) -> Optional[List[Hashable]]:
+        """Returns the shortest path between two vertices.
+
+        Args:
+            vertex_u: The vertex where the path starts.
+            vertex_v: The vertex where the path ends.
+
+        Returns:
+            The list of vertices of the path, or None if the end isn't reachable.
+
+        Raises:
+            VertexError: Raises when a vertex isn't in the graph.
+        """
+        i, j = self.index(vertex_u), self.index(vertex_v)
+        if i == j:
+            return [vertex_u]
+        if self._successors[i, j] == -1:
+            return None
+
+        path = [i]
+        while i != j:
+            i = int(self._successors[i, j])
+            path.append(i)
+        return [self._labels[k] for k in path]
+
+    def to_dicts(self) -> Tuple[Dict[Hashable, Dict[Hashable, float]],
+                                Dict[Hashable, Dict[Hashable, Hashable]]]:
+        """Returns the distances and successors as dictionaries, like ``floyd_warshall``."""
+        labels = self._labels
+        distances = {u: dict(zip(labels, row)) for u, row in zip(labels, self._distances.tolist())}
+        children = {u: {v: None if k == -1 else labels[k] for v, k in zip(labels, row)}
+                    for u, row in zip(labels, self._successors.tolist())}
+        return distances, children
+
+
+def _relax(distances: 'np.ndarray', successors: 'np.ndarray', rows: slice, k: int):
+    """Relaxes the paths from the rows of the matrices through the vertex id k."""
+    candidates = distances[rows, k, None] + distances[k]
+    improved = candidates < distances[rows]
+    np.copyto(distances[rows], candidates, where=improved)
+    np.copyto(successors[rows], successors[rows, k, None], where=improved)
+
+
+def _floyd_warshall_strips(distances: 'np.ndarray', successors: 'np.ndarray', block_size: int):
+    """Runs the Floyd-Warshall algorithm in place over the matrices, by strips of rows.
+
+    Each vertex relaxes the matrices a strip of rows at a time, so the temporary arrays of each
+    step span a strip instead of the whole matrix.
+    """
+    n = len(distances)
+    strips = [slice(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+    for k in range(n):
+        for rows in strips:
+            _relax(distances, successors, rows, k)
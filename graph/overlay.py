@@ -0,0 +1,367 @@
+from typing import (Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Set,
+                    Tuple)
+from math import inf
+
+from .exceptions import VertexError, EdgeError
+from .basegraph import BaseGraph
+
+
+_EMPTY = object()
+_NO_HEADS = {}
+
+
+class _Merged(Mapping):
+    """The items of a base mapping, without the removed keys, and the added items.
+
+    Used for the vertices of the overlay and for the heads of the edges of each vertex. The
+    length is counted on each call, unless a function that returns it is given.
+    """
+
+    def __init__(self, base: Mapping, added: dict, removed: set,
+                 length: Callable[[], int] = None):
+        self._base = base
+        self._added = added
+        self._removed = removed
+        self._length = length
+
+    def __getitem__(self, key: Hashable) -> dict:
+        if key in self._added:
+            return self._added[key]
+        if key in self._removed:
+            raise KeyError(key)
+        return self._base[key]
+
+    def __contains__(self, key: Hashable):
+        return key in self._added or key not in self._removed and key in self._base
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for k in self._base:
+            if k not in self._removed and k not in self._added:
+                yield k
+        yield from self._added
+
+    def __len__(self):
+        if self._length is not None:
+            return self._length()
+        return sum(1 for _ in self)
+
+    def __bool__(self):
+        return next(iter(self), _EMPTY) is not _EMPTY
+
+
+class _MergedAdjacency(Mapping):
+    """The adjacency of the base graph merged with the added and removed edges, only the
+    vertices with edges are listed, like in the ``edges`` dictionary of a graph."""
+
+    def __init__(self, base: Mapping, added: Dict[Hashable, dict],
+                 removed: Dict[Hashable, set]):
+        self._base = base
+        self._added = added
+        self._removed = removed
+
+    def __getitem__(self, vertex: Hashable) -> _Merged:
+        heads = _Merged(self._base.get(vertex, _NO_HEADS), self._added.get(vertex, _NO_HEADS),
+                        self._removed.get(vertex, _NO_HEADS))
+        if not heads:
+            raise KeyError(vertex)
+        return heads
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for v in self._base:
+            if v not in self._added and v in self:
+                yield v
+        for v in self._added:
+            if v in self:
+                yield v
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class GraphOverlay(BaseGraph):
+    def __init__(self, base: BaseGraph, name: str = None, description: str = None):
+        """Creates a graph that records added and removed vertices and edges on top of a base
+        graph, which is never changed.
+
+        Creating an overlay is O(1) and each change costs about the same as in the base graph,
+        so it replaces a deep copy when a few temporary changes are made on a big graph. The
+        base graph must not be changed while the overlay is in use.
+
+        The data of a base vertex or edge is copied into the overlay when set through the
+        overlay, but the dictionaries returned by ``get_vertex_data`` and ``get_edge_data`` may
+        belong to the base graph and must not be changed directly.
+
+        Args:
+            base: The base graph, which may be another overlay.
+            name: The name of the graph, by default the name of the base graph.
+            description: The description of the graph, by default the base graph's.
+        """
+        super().__init__(name or base.name, description or base.description)
+        self._base = base
+        self._added_vertices = {}
+        self._removed_vertices = set()
+        self._added_edges = {}
+        self._removed_edges = {}
+        self._added_in_edges = {}
+        self._removed_in_edges = {}
+        self._order_delta = 0
+        self._size_delta = 0
+
+        self._vertices = _Merged(base.vertices, self._added_vertices, self._removed_vertices,
+                                 self.order)
+        self._edges = _MergedAdjacency(base.edges, self._added_edges, self._removed_edges)
+        if base.is_directed():
+            self._in_edges = _MergedAdjacency(base.in_edges, self._added_in_edges,
+                                              self._removed_in_edges)
+
+    @property
+    def base(self) -> BaseGraph:
+        """The base graph."""
+        return self._base
+
+    @property
+    def version(self) -> int:
+        """The number of changes made to the overlay and to its base graph."""
+        return self._version + self._base.version
+
+    @property
+    def in_edges(self) -> Mapping[Hashable, Mapping[Hashable, dict]]:
+        """The edges of the graph indexed by their head vertex.
+
+        Raises:
+            AttributeError: Raises when the graph is undirected.
+        """
+        if not self.is_directed():
+            raise AttributeError(f"the graph '{self}' is undirected")
+
+        return self._in_edges
+
+    def clear(self):
+        for v in list(self._vertices):
+            self.remove_vertex(v)
+
+    def is_directed(self) -> bool:
+        return self._base.is_directed()
+
+    # VERTICES
+
+    def has_vertex(self, vertex_v: Hashable) -> bool:
+        return vertex_v in self._vertices
+
+    def add_vertex(self, vertex_v: Hashable, /, **data):
+        if vertex_v not in self._vertices:
+            self._order_delta += 1
+
+        self._record('add_vertex', (vertex_v,), self._vertices.get(vertex_v))
+        self._removed_vertices.discard(vertex_v)
+        self._added_vertices[vertex_v] = data
+
+    def add_vertices_from(self, vertices: Iterable[Hashable], /, **data):
+        for v in vertices:
+            self.add_vertex(v, **data)
+
+    def remove_vertex(self, vertex_v: Hashable):
+        self.pop_vertex(vertex_v)
+
+    def pop_vertex(self, vertex_v: Hashable) -> dict:
+        if vertex_v not in self._vertices:
+            raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
+
+        for v in list(self._edges.get(vertex_v, _NO_HEADS)):
+            self._pop_edge(vertex_v, v)
+        if self.is_directed():
+            for u in list(self._in_edges.get(vertex_v, _NO_HEADS)):
+                self._pop_edge(u, vertex_v)
+
+        data = self._vertices[vertex_v]
+        self._record('pop_vertex', (vertex_v,), data)
+        self._order_delta -= 1
+        self._added_vertices.pop(vertex_v, None)
+        if vertex_v in self._base.vertices:
+            self._removed_vertices.add(vertex_v)
+        return data
+
+    def get_vertex_data(self, vertex_v: Hashable) -> dict:
+        if vertex_v not in self._vertices:
+            raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
+
+        return self._vertices[vertex_v]
+
+    def set_vertex_data(self, vertex_v: Hashable, /, **data):
+        if vertex_v not in self._vertices:
+            raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
+
+        self._record('set_vertex_data', (vertex_v,), dict(self._vertices[vertex_v]))
+        if vertex_v not in self._added_vertices:  # copy-on-write, the base is never changed
+            self._added_vertices[vertex_v] = dict(self._vertices[vertex_v])
+        self._added_vertices[vertex_v].update(data)
+
+    # EDGES
+
+    def _put_edge(self, vertex_u: Hashable, vertex_v: Hashable, data: dict):
+        if vertex_v not in self._edges.get(vertex_u, _NO_HEADS):
+            self._size_delta += 1
+
+        self._added_edges.setdefault(vertex_u, {})[vertex_v] = data
+        self._removed_edges.get(vertex_u, set()).discard(vertex_v)
+        if self.is_directed():
+            self._added_in_edges.setdefault(vertex_v, {})[vertex_u] = data
+            self._removed_in_edges.get(vertex_v, set()).discard(vertex_u)
+        else:
+            self._added_edges.setdefault(vertex_v, {})[vertex_u] = data
+            self._removed_edges.get(vertex_v, set()).discard(vertex_u)
+
+    def _pop_edge(self, vertex_u: Hashable, vertex_v: Hashable) -> dict:
+        data = self._edges[vertex_u][vertex_v]
+        self._record('pop_edge', (vertex_u, vertex_v), data)
+        self._size_delta -= 1
+
+        def hide(added: dict, removed: dict, base: Mapping, u: Hashable, v: Hashable):
+            if u in added:
+                added[u].pop(v, None)
+                if not added[u]:
+                    del added[u]
+            if v in base.get(u, _NO_HEADS):
+                removed.setdefault(u, set()).add(v)
+
+        base = self._base
+        hide(self._added_edges, self._removed_edges, base.edges, vertex_u, vertex_v)
+        if self.is_directed():
+            hide(self._added_in_edges, self._removed_in_edges, base.in_edges, vertex_v, vertex_u)
+        else:
+            hide(self._added_edges, self._removed_edges, base.edges, vertex_v, vertex_u)
+        return data
+
+    def dataless_edges(self) -> List[Tuple[Hashable, Hashable]]:
+        return list(self.iter_edges(data=False))
+
+    def has_edge(self, vertex_u: Hashable, vertex_v: Hashable) -> bool:
+        if vertex_u not in self._vertices:
+            raise VertexError(f"vertex '{vertex_u}' from the given edge '{{{vertex_u, vertex_v}}}' "
+                              f"isn't in the graph '{self}'")
+        if vertex_v not in self._vertices:
+            raise VertexError(f"vertex '{vertex_v}' from the given edge '{{{vertex_u, vertex_v}}}' "
+                              f"isn't in the graph '{self}'")
+
+        return vertex_v in self._edges.get(vertex_u, _NO_HEADS)
+
+    def add_edge(self, vertex_u: Hashable, vertex_v: Hashable, /, **data):
+        if vertex_u not in self._vertices:
+            raise VertexError(f"vertex '{vertex_u}' from the given edge '{{{vertex_u, vertex_v}}}' "
+                              f"isn't in the graph '{self}'")
+        if vertex_v not in self._vertices:
+            raise VertexError(f"vertex '{vertex_v}' from the given edge '{{{vertex_u, vertex_v}}}' "
+                              f"isn't in the graph '{self}'")
+
+        self._record('add_edge', (vertex_u, vertex_v),
+                     self._edges.get(vertex_u, _NO_HEADS).get(vertex_v))
+        self._put_edge(vertex_u, vertex_v, data)
+
+    def add_edges_from(self, edges: Iterable[Tuple[Hashable, Hashable, Optional[dict]]],
+                       validate: bool = True):
+        if validate:
+            edges = list(edges)
+            missing = {v for e in edges for v in e[:2] if v not in self._vertices}
+            if missing:
+                raise VertexError(f"vertices '{{{', '.join(map(str, missing))}}}' from the given "
+                                  f"edges aren't in the graph '{self}'")
+
+        self._version += 1
+        journaling = self._journal is not None
+        for e in edges:
+            if journaling:
+                self._record('add_edge', (e[0], e[1]), self._edges.get(e[0], _NO_HEADS).get(e[1]))
+            self._put_edge(e[0], e[1], dict(e[2]) if len(e) == 3 else {})
+
+    def remove_edge(self, vertex_u: Hashable, vertex_v: Hashable):
+        self.pop_edge(vertex_u, vertex_v)
+
+    def pop_edge(self, vertex_u: Hashable, vertex_v: Hashable) -> dict:
+        if not self.has_edge(vertex_u, vertex_v):
+            raise EdgeError(f"edge '{{{vertex_u}, {vertex_v}}}' isn't in the graph '{self}'")
+
+        return self._pop_edge(vertex_u, vertex_v)
+
+    def get_edge_data(self, vertex_u: Hashable, vertex_v: Hashable) -> dict:
+        if not self.has_edge(vertex_u, vertex_v):
+            raise EdgeError(f"edge '{{{vertex_u}, {vertex_v}}}' isn't in the graph '{self}'")
+
+        return self._edges[vertex_u][vertex_v]
+
+    def set_edge_data(self, vertex_u: Hashable, vertex_v: Hashable, /, **data):
+        if not self.has_edge(vertex_u, vertex_v):
+            raise EdgeError(f"edge '{{{vertex_u}, {vertex_v}}}' isn't in the graph '{self}'")
+
+        edge_data = self._edges[vertex_u][vertex_v]
+        self._record('set_edge_data', (vertex_u, vertex_v), dict(edge_data))
+        if vertex_v not in self._added_edges.get(vertex_u, _NO_HEADS):  # copy-on-write
+            edge_data = dict(edge_data)
+            self._put_edge(vertex_u, vertex_v, edge_data)
+        edge_data.update(data)
+
+    # PROPERTIES
+
+    def order(self) -> int:
+        return self._base.order() + self._order_delta
+
+    def size(self) -> int:
+        return self._base.size() + self._size_delta
+
+    # NEIGHBOURS
+
+    def neighbours(self, vertex_v: Hashable) -> Set[Hashable]:
+        if vertex_v not in self._vertices:
+            raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
+
+        return set(self._edges.get(vertex_v, _NO_HEADS))
+
+    def is_neighbour(self, vertex_u: Hashable, vertex_v: Hashable) -> bool:
+        return self.has_edge(vertex_u, vertex_v)
+
+    def predecessors(self, vertex_v: Hashable) -> Set[Hashable]:
+        """Returns a set of vertices with an edge to the vertex v.
+
+        Args:
+            vertex_v: The vertex v.
+
+        Returns:
+            A set of vertices with an edge to the vertex v.
+
+        Raises:
+            VertexError: Raises when the vertex isn't in the graph.
+        """
+        if not self.is_directed():
+            return self.neighbours(vertex_v)
+        if vertex_v not in self._vertices:
+            raise VertexError(f"vertex '{vertex_v}' isn't in the graph '{self}'")
+
+        return set(self._in_edges.get(vertex_v, _NO_HEADS))
+
+    # REPRESENTATIONS
+
+    def iter_edges(self, data: bool = True) -> Iterator[Tuple]:
+        directed = self.is_directed()
+        visited = set()
+        for u, heads in self._edges.items():
+            visited.add(u)
+            for v, d in heads.items():
+                if directed or v == u or v not in visited:
+                    yield (u, v, d) if data else (u, v)
+
+    def iter_adjacency(self) -> Iterator[Tuple[Hashable, Iterable[Hashable]]]:
+        for u, heads in self._edges.items():
+            yield u, heads.keys()
+
+    def edges_list(self) -> List[Tuple[Hashable, Hashable, dict]]:
+        return list(self.iter_edges())
+
+    def adjacency_list(self) -> Dict[Hashable, Set[Hashable]]:
+        return {u: set(heads) for u, heads in self.iter_adjacency()}
+
+    def adjacency_matrix(self,
+                         weight: Callable[[dict], int]) -> Dict[Hashable, Dict[Hashable, int]]:
+        adjacency_matrix = {u: dict.fromkeys(self._vertices, inf) for u in self._vertices}
+        for u, heads in self._edges.items():
+            for v, d in heads.items():
+                adjacency_matrix[u][v] = weight(d)
+        return adjacency_matrix
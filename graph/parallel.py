@@ -0,0 +1,76 @@
+from typing import Any, Callable, Hashable, Iterable, List, Sequence
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import ceil
+
+from .csr import CSRGraph, EdgeAttribute, _weight_sequence
+
+
+_WEIGHT = EdgeAttribute('weight')
+
+# the snapshot and the arguments shared by every task of the worker process
+_graph = None
+_shared = ()
+
+
+class _WeightData(Sequence):
+    """The data of the edges of a shipped snapshot, only their weights."""
+
+    def __init__(self, weights: Sequence[float]):
+        self._weights = weights
+
+    def __len__(self):
+        return len(self._weights)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return {'weight': self._weights[index]}
+
+
+def _snapshot(graph, weight: Callable[[dict], float]) -> CSRGraph:
+    """Returns a compact snapshot of the graph to ship to the worker processes.
+
+    Only the topology and the weights (under the ``'weight'`` key) are kept, so the weight
+    function and the data don't need to be picklable and the snapshot pickles as a few flat
+    sequences.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_graph(graph, weight)
+
+    # noinspection PyProtectedMember
+    weights = graph._stored_weights(weight)
+    if weights is None:
+        weights = _weight_sequence(map(weight, graph.edge_data))
+
+    return CSRGraph(graph.name, graph.description, graph.is_directed(), graph.labels,
+                    ({},) * graph.order(), array('q', graph.offsets), array('q', graph.targets),
+                    _WeightData(weights), _WEIGHT, weights)
+
+
+def _initialize(graph: CSRGraph, shared: tuple):
+    global _graph, _shared
+    _graph, _shared = graph, shared
+
+
+def _run(function: Callable, item: Any) -> Any:
+    return function(_graph, _WEIGHT, item, *_shared)
+
+
+def _map(function: Callable[..., Any], graph, weight: Callable[[dict], float],
+         items: Iterable[Hashable], workers: int, *shared) -> List[Any]:
+    """Calls ``function(graph, weight, item, *shared)`` for each item in a pool of worker
+    processes and returns the results in the items' order.
+
+    The graph and the shared arguments are shipped once to each worker, not with each task, as
+    a compact snapshot (see ``_snapshot``) and the items are sent in chunks. The function must
+    be defined at the top level of a module.
+    """
+    items = list(items)
+    chunk_size = max(1, ceil(len(items) / (4 * workers)))  # a few chunks per worker balance
+    with ProcessPoolExecutor(workers, initializer=_initialize,
+                             initargs=(_snapshot(graph, weight), shared)) as executor:
+        return list(executor.map(partial(_run, function), items, chunksize=chunk_size))
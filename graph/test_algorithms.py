@@ -1,16 +1,35 @@
+from fractions import Fraction
 from math import inf
 
 from graph import (
-    Graph, Digraph,
+    Graph, Digraph, DisjointSet,
     breath_first_search,
     depth_first_search,
     dijkstra,
+    dijkstra_to,
+    a_star,
+    shortest_path,
+    iter_nearest,
+    nearest_k,
+    distance_table,
+    parallel_single_source,
+    euclidean_heuristic,
+    haversine_heuristic,
     bellman_ford,
     floyd_warshall,
+    floyd_warshall_matrix,
+    johnson,
     kruskal,
-    prim_jarnik
+    prim_jarnik,
+    NegativeCycleError,
+    VertexError
 )
 
+try:
+    import numpy
+except ImportError:  # the vectorized methods need NumPy, which is optional
+    numpy = None
+
 
 # method to get the edge's weight
 def weight_fun(data: dict) -> int:
@@ -50,8 +69,109 @@ dijkstra_result = dijkstra(digraph_2, 's', weight_fun)
 assert dijkstra_result == ({'s': 0, 'u': 8, 'x': 5, 'v': 9, 'y': 7},
                            {'s': None, 'u': 'x', 'x': 's', 'v': 'u', 'y': 's'})
 
+dijkstra_stats = {}
+assert dijkstra(digraph_2, 's', weight_fun, dijkstra_stats, max_distance=7) == (
+    {'s': 0, 'x': 5, 'y': 7}, {'s': None, 'x': 's', 'y': 's'})
+assert dijkstra_stats['settled'] == 3
+assert dijkstra(digraph_2, 's', weight_fun, dijkstra_stats, targets={'x', 'u'}) == (
+    {'s': 0, 'x': 5, 'y': 7, 'u': 8}, {'s': None, 'x': 's', 'y': 's', 'u': 'x'})
+assert dijkstra_stats['settled'] == 4
+assert dijkstra(digraph_2, 's', weight_fun, max_distance=8, targets={'v'})[0] == {
+    's': 0, 'x': 5, 'y': 7, 'u': 8}
+
+dijkstra_stats = {}
+dijkstra_to_result = dijkstra_to(digraph_2, 's', 'v', weight_fun, stats=dijkstra_stats)
+assert dijkstra_to_result == ({'s': 0, 'x': 5, 'u': 8, 'v': 9}, ['s', 'x', 'u', 'v'])
+assert dijkstra_stats['settled'] == 5
+assert dijkstra_to(digraph_2, 'v', 's', weight_fun)[1] == ['v', 'y', 's']
+assert dijkstra_to(digraph_2, 's', 'v', weight_fun, bidirectional=True) == dijkstra_to_result
+assert dijkstra_to(digraph_2.freeze(), 's', 'v', weight_fun,
+                   bidirectional=True) == dijkstra_to_result
+
 print('\nDijkstra: ', dijkstra_result, 'Runned on the graph: ', repr(digraph_2), sep='\n')
 
+# a* test
+grid = Graph()
+for i in range(10):
+    for j in range(10):
+        grid.add_vertex((i, j), x=i, y=j)
+for i in range(10):
+    for j in range(10):
+        if i < 9:
+            grid.add_edge((i, j), (i + 1, j), weight=1)
+        if j < 9:
+            grid.add_edge((i, j), (i, j + 1), weight=1)
+
+a_star_stats, dijkstra_to_stats = {}, {}
+a_star_result = a_star(grid, (0, 0), (9, 0), weight_fun, euclidean_heuristic(), a_star_stats)
+dijkstra_to(grid, (0, 0), (9, 0), weight_fun, dijkstra_to_stats)
+assert a_star_result[0][(9, 0)] == 9 and len(a_star_result[1]) == 10
+assert a_star_stats['settled'] < dijkstra_to_stats['settled']
+
+heuristic = haversine_heuristic()
+assert round(heuristic({'lat': 0, 'lon': 0}, {'lat': 0, 'lon': 1}), 1) == 111.2
+
+print('\nA*: ', a_star_result, 'Runned on the graph: ', repr(grid), sep='\n')
+
+# shortest path test
+assert shortest_path(digraph_2, ('s', 'u', .5), ('u', 'v', .5), weight_fun) == (
+    {('s', 'u', .5): 0, 'u': 5, ('u', 'v', .5): 5.5}, [('s', 'u', .5), 'u', ('u', 'v', .5)])
+assert shortest_path(digraph_2, ('x', 'u', .25), ('x', 'u', .75), weight_fun)[0][
+    ('x', 'u', .75)] == 1.5
+assert shortest_path(digraph_2, ('x', 'u', .75), ('x', 'u', .25), weight_fun)[1] == [
+    ('x', 'u', .75), 'u', 'x', ('x', 'u', .25)]
+assert shortest_path(digraph_2, 's', 'v', weight_fun) == dijkstra_to_result
+
+street = Graph.graph_from({1, 2, 3, 4}, [(1, 2, {'weight': 4}), (2, 3, {'weight': 2})])
+assert shortest_path(street, (2, 1, .25), (3, 2, .5), weight_fun) == (
+    {(2, 1, .25): 0, 2: 1, (3, 2, .5): 2}, [(2, 1, .25), 2, (3, 2, .5)])
+assert shortest_path(street.freeze(), 1, (2, 3, .5), weight_fun)[0][(2, 3, .5)] == 5
+assert shortest_path(street, (1, 2, .5), 4, weight_fun) is None
+assert street.size() == 2
+
+# nearest test
+facilities = {'a': (1, 2, .5), 'b': 3, 'c': (3, 2, .25), 'd': 4}
+nearest_stats = {}
+assert nearest_k(street, (2, 3, .25), facilities, 2, weight_fun, nearest_stats) == [
+    ('c', {(2, 3, .25): 0, (3, 2, .25): 1}, [(2, 3, .25), (3, 2, .25)]),
+    ('b', {(2, 3, .25): 0, 3: 1.5}, [(2, 3, .25), 3])]
+assert nearest_stats['settled'] == 2
+nearest = iter_nearest(street, 2, facilities.values(), weight_fun)
+assert next(nearest)[1] == {2: 0, (3, 2, .25): 1.5}
+assert [path[-1] for _, _, path in nearest] == [(1, 2, .5), 3]
+assert [c for c, _, _ in iter_nearest(digraph_2, 'v', ['u', 'x', 's'], weight_fun)] == [
+    's', 'x', 'u']
+
+print('\nShortest path: ', shortest_path(street, (1, 2, .5), (2, 3, .5), weight_fun),
+      'Runned on the graph: ', repr(street), sep='\n')
+
+# distance table test
+table = distance_table(digraph_2, ['s', ('u', 'v', .5), 's'], ['v', 'y'], weight_fun)
+assert table == ([[9, 7], [.5, 4.5]], {'s': 0, ('u', 'v', .5): 1}, {'v': 0, 'y': 1})
+assert distance_table(digraph_2, ['v', 'y', 'x'], ['s'], weight_fun)[0] == [[10], [6], [8]]
+assert distance_table(digraph_2, ['v', 'y', 'x'], ['s'], weight_fun, workers=2) == \
+    distance_table(digraph_2.freeze(), ['v', 'y', 'x'], ['s'], weight_fun)
+assert distance_table(street, [1, 4], [(2, 3, .5)], weight_fun)[0] == [[5], [inf]]
+
+print('\nDistance table: ', table, 'Runned on the graph: ', repr(digraph_2), sep='\n')
+
+# parallel single source test
+results, labels = parallel_single_source(digraph_2, ['s', 'v', 's'], weight_fun)
+assert len(results) == 3 and results[0] == results[2]
+assert dict(zip(labels, results[0][0])) == dijkstra_result[0]
+assert {v: None if p == -1 else labels[p]
+        for v, p in zip(labels, results[0][1])} == dijkstra_result[1]
+assert parallel_single_source(digraph_2, ['s', 'v', 's'], weight_fun, workers=2) == (results,
+                                                                                    labels)
+try:
+    parallel_single_source(digraph_2, ['s', 'w'], weight_fun)
+    assert False
+except VertexError:
+    pass
+
+print('\nParallel single source: ', results[1], 'Runned on the graph: ', repr(digraph_2),
+      sep='\n')
+
 # bellman-ford test
 digraph_3 = Digraph.graph_from({'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H'},
                                [('A', 'B', {'weight': 8}), ('A', 'E', {'weight': 6}),
@@ -65,6 +185,38 @@ bellman_ford_result = bellman_ford(digraph_3, 'A', weight_fun)
 assert bellman_ford_result == ({'A': 0, 'E': 6, 'B': 8, 'C': 7, 'H': 11, 'G': 8, 'D': 9, 'F': 9},
                                {'A': None, 'E': 'A', 'B': 'A', 'C': 'G',
                                 'H': 'C', 'G': 'E', 'D': 'G', 'F': 'E'})
+assert all(type(d) is int for d in bellman_ford_result[0].values())
+assert bellman_ford(digraph_3, 'A', weight_fun, 'queue') == bellman_ford_result
+assert all(type(d) is int for d in bellman_ford(digraph_3, 'A', weight_fun, 'queue')[0].values())
+assert all(type(d) is int for d in bellman_ford(digraph_3.freeze(weight_fun), 'A',
+                                                weight_fun)[0].values())
+if numpy is not None:
+    assert bellman_ford(digraph_3, 'A', weight_fun, 'numpy') == bellman_ford_result
+
+fractions = Digraph.graph_from({1, 2, 3}, [(1, 2, {'weight': Fraction(1, 3)}),
+                                           (2, 3, {'weight': Fraction(-1, 7)})])
+assert bellman_ford(fractions, 1, weight_fun)[0] == {1: 0, 2: Fraction(1, 3), 3: Fraction(4, 21)}
+assert bellman_ford(fractions, 1, weight_fun)[0][3].denominator == 21
+
+digraph_3.add_edge('D', 'C', weight=-5)
+for method in ('passes', 'queue', 'numpy') if numpy is not None else ('passes', 'queue'):
+    try:
+        bellman_ford(digraph_3, 'A', weight_fun, method)
+        assert False
+    except NegativeCycleError as error:
+        assert error.cycle in (['C', 'H', 'G', 'D', 'C'], ['H', 'G', 'D', 'C', 'H'],
+                               ['G', 'D', 'C', 'H', 'G'], ['D', 'C', 'H', 'G', 'D'])
+digraph_3.remove_edge('D', 'C')
+
+assert bellman_ford(street, 3, weight_fun, 'queue') == ({1: 6, 2: 2, 3: 0, 4: inf},
+                                                        {1: 2, 2: 3, 3: None, 4: None})
+street.add_edge(1, 4, weight=-1)
+try:
+    bellman_ford(street, 3, weight_fun)
+    assert False
+except NegativeCycleError as error:  # an undirected negative edge is a cycle
+    assert error.cycle in ([1, 4, 1], [4, 1, 4])
+street.remove_edge(1, 4)
 
 print('\nBellman-Ford: ', bellman_ford_result, 'Runned on the graph: ', repr(digraph_3), sep='\n')
 
@@ -86,9 +238,38 @@ assert floyd_warshall_result == ({1: {1: 0, 2: 4, 3: 4, 4: 3, 5: inf},
                                   4: {1: 2, 2: 2, 3: 3, 4: None, 5: None},
                                   5: {1: 4, 2: 4, 3: 4, 4: 4, 5: None}})
 
+if numpy is not None:
+    assert floyd_warshall(digraph_4, weight_fun, 'numpy') == floyd_warshall_result
+    matrix = floyd_warshall_matrix(digraph_4, weight_fun, block_size=2)
+    assert matrix.distances.dtype == numpy.float64 and matrix.successors.dtype == numpy.int32
+    assert matrix.distance(5, 1) == 6 and matrix.path(5, 1) == [5, 4, 2, 1]
+    assert matrix.path(1, 5) is None and matrix.path(3, 3) == [3]
+    assert matrix.to_dicts() == floyd_warshall_result
+
 print('\nFloyd-Warshall: ', floyd_warshall_result, 'Runned on the graph: ', repr(digraph_4),
       sep='\n')
 
+# johnson test
+johnson_result = dict((source, (distance, parents))
+                      for source, distance, parents in johnson(digraph_3, weight_fun))
+assert johnson_result['A'] == bellman_ford_result and len(johnson_result) == 8
+assert all(type(d) is int for distance, _ in johnson_result.values()
+           for d in distance.values() if d != inf)
+assert next(johnson(fractions, weight_fun))[1][3] == Fraction(4, 21)
+assert johnson_result['H'][0] == bellman_ford(digraph_3, 'H', weight_fun)[0]
+assert all(distance == floyd_warshall_result[0][source]
+           for source, distance, _ in johnson(digraph_4.freeze(), weight_fun))
+
+digraph_3.add_edge('D', 'C', weight=-5)
+try:
+    johnson(digraph_3, weight_fun)
+    assert False
+except NegativeCycleError as error:
+    assert len(error.cycle) == 5
+digraph_3.remove_edge('D', 'C')
+
+print('\nJohnson: ', johnson_result['A'], 'Runned on the graph: ', repr(digraph_3), sep='\n')
+
 # kruskal test
 graph_2 = Graph.graph_from({0, 1, 2, 3, 4, 5, 6, 7, 8},
                            [(0, 1, {'weight': 4}), (1, 7, {'weight': 11}), (0, 7, {'weight': 8}),
@@ -99,6 +280,14 @@ graph_2 = Graph.graph_from({0, 1, 2, 3, 4, 5, 6, 7, 8},
 
 kruskal_result = kruskal(graph_2, weight_fun)
 assert kruskal_result[0] == 37 and len(kruskal_result[1]) == graph_2.order() - 1
+assert kruskal(graph_2, weight_fun, iter(sorted(graph_2.edges_list(),
+                                                key=lambda e: weight_fun(e[2]))))[0] == 37
+
+subsets = DisjointSet(range(5))
+assert subsets.union(0, 1) and subsets.union(3, 4) and subsets.union(1, 4)
+assert not subsets.union(0, 3)
+assert subsets.connected(0, 4) and not subsets.connected(0, 2)
+assert subsets.subsets == 2 and subsets.size(3) == 4
 
 print('\nKruskal: ', kruskal_result, 'Runned on the graph: ', repr(graph_2), sep='\n')
 
@@ -107,3 +296,31 @@ prim_jarnik_result = prim_jarnik(graph_2, weight_fun)
 assert prim_jarnik_result[0] == 37 and len(prim_jarnik_result[1]) == graph_2.order() - 1
 
 print('\nPrim-Jarnik: ', prim_jarnik_result, 'Runned on the graph: ', repr(graph_2), sep='\n')
+
+# frozen (csr) graphs test
+assert breath_first_search(graph_1.freeze(), 1) == bfs_result
+assert dijkstra(digraph_2.freeze(), 's', weight_fun) == dijkstra_result
+assert dijkstra(digraph_2.freeze(weight_fun), 's', weight_fun) == dijkstra_result
+assert dijkstra(digraph_2.freeze(), 's', weight_fun, max_distance=7) == dijkstra(
+    digraph_2, 's', weight_fun, max_distance=7)
+assert dijkstra_to(digraph_2.freeze(), 's', 'v', weight_fun) == dijkstra_to_result
+assert dijkstra_to(digraph_2.freeze(weight_fun), 's', 'z', weight_fun) is None
+assert bellman_ford(digraph_3.freeze(), 'A', weight_fun) == bellman_ford_result
+assert floyd_warshall(digraph_4.freeze(), weight_fun) == floyd_warshall_result
+assert kruskal(graph_2.freeze(), weight_fun)[0] == 37
+assert prim_jarnik(graph_2.freeze(weight_fun), weight_fun)[0] == 37
+assert prim_jarnik(graph_2.freeze(), weight_fun, 1) == prim_jarnik(graph_2, weight_fun, 1)
+# the frozen weights keep their types, 9.0 == 9 would hide it
+assert all(type(d) is int for frozen in (digraph_2.freeze(), digraph_2.freeze(weight_fun))
+           for d in dijkstra(frozen, 's', weight_fun)[0].values() if d != inf)
+assert all(type(d) is int for d in dijkstra_to(digraph_2.freeze(weight_fun), 's', 'v',
+                                               weight_fun)[0].values())
+assert type(prim_jarnik(graph_2.freeze(weight_fun), weight_fun, 1)[0]) is int
+
+
+def thirds(data: dict) -> Fraction:
+    return Fraction(data['weight'], 3)
+
+
+thirds_result = dijkstra_to(digraph_2.freeze(thirds), 's', 'v', thirds)[0]['v']
+assert type(thirds_result) is Fraction and thirds_result == 3
@@ -0,0 +1,40 @@
+from math import inf
+
+from graph import Assignment, Graph, solve_assignment
+
+try:
+    import numpy
+except ImportError:  # the solver needs NumPy, which is optional
+    numpy = None
+
+if numpy is not None:
+    # Test cost matrices
+
+    costs = [[4, 1, 3],
+             [2, 0, 5],
+             [3, 2, 1]]
+    assert solve_assignment(costs) == [(0, 1), (1, 0), (2, 2)]
+    assert solve_assignment([[1, 2, 3], [1, 2, 3]]) == [(0, 0), (1, 1)]
+    assert solve_assignment([[5, 1], [1, 9], [4, 4]]) == [(0, 1), (1, 0)]
+    assert solve_assignment([[inf, 1], [inf, 2]]) == [(0, 1)]
+    assert solve_assignment([]) == []
+
+    # Test declines
+
+    assignment = Assignment(costs, ['a', 'b', 'c'], ['x', 'y', 'z'])
+    assert assignment.pairs == {'a': 'y', 'b': 'x', 'c': 'z'} and assignment.cost == 4
+    assert assignment.decline('a', 'y') == {'a': 'x', 'b': 'y', 'c': 'z'}
+    assert assignment.cost == 5
+    assert assignment.decline('b', 'z') == {'a': 'x', 'b': 'y', 'c': 'z'}
+    assert assignment.decline('a', 'x') == {'a': 'z', 'b': 'y', 'c': 'x'}
+    assert assignment.decline('a', 'z') == {'b': 'y', 'c': 'z'} and assignment.cost == 1
+
+    # Test graphs
+
+    street = Graph.graph_from({1, 2, 3}, [(1, 2, {'distance': 4}), (2, 3, {'distance': 2})])
+    assignment = Assignment.from_graph(street, {'A': (1, 2, .5), 'B': 3},
+                                       {'client': (2, 3, .5), 'other': 1},
+                                       lambda d: d['distance'])
+    assert assignment.pairs == {'A': 'other', 'B': 'client'} and assignment.cost == 3
+
+    print('\nAssignment: ', assignment.pairs, 'Runned on the graph: ', repr(street), sep='\n')
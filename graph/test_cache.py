@@ -0,0 +1,50 @@
+from graph import CacheInfo, EdgeAttribute, Graph, GraphOverlay, PathCache, dijkstra_to
+
+# Test hits
+
+graph = Graph.graph_from({'a', 'b', 'c', 'd'},
+                         [('a', 'b', {'weight': 1}), ('b', 'c', {'weight': 2}),
+                          ('a', 'c', {'weight': 5}), ('c', 'd', {'weight': 1})])
+weight = EdgeAttribute('weight')
+
+cache = PathCache(max_size=2)
+result = cache.dijkstra_to(graph, 'a', 'd', weight)
+assert result == dijkstra_to(graph, 'a', 'd', weight)
+result[1].append('z')  # the cached result is a copy
+assert cache.dijkstra_to(graph, 'a', 'd', EdgeAttribute('weight')) == ({'a': 0, 'b': 1, 'c': 3,
+                                                                        'd': 4},
+                                                                       ['a', 'b', 'c', 'd'])
+assert cache.dijkstra_to(graph, 'a', 'd', lambda d: d['weight'], weight_key=weight)[0]['d'] == 4
+assert cache.info == CacheInfo(hits=2, misses=1, evictions=0, size=1, max_size=2)
+
+# Test versions
+
+graph.set_edge_data('b', 'c', weight=10)
+assert cache.dijkstra_to(graph, 'a', 'd', weight)[1] == ['a', 'c', 'd']
+assert cache.dijkstra(graph, 'a', weight, max_distance=1) == ({'a': 0, 'b': 1},
+                                                              {'a': None, 'b': 'a'})
+assert cache.info == CacheInfo(hits=2, misses=3, evictions=1, size=2, max_size=2)
+distance = cache.dijkstra(graph, 'a', weight, max_distance=1)[0]
+assert distance is cache.dijkstra(graph, 'a', weight, max_distance=1)[0]  # no copy on a hit
+try:
+    distance['b'] = 0
+    assert False
+except TypeError:
+    pass
+
+overlay = GraphOverlay(graph)
+assert cache.dijkstra(overlay, 'a', weight, max_distance=1)[0] == {'a': 0, 'b': 1}
+overlay.remove_edge('a', 'b')
+assert cache.dijkstra(overlay, 'a', weight, max_distance=1)[0] == {'a': 0}
+assert cache.dijkstra(graph.freeze(), 'a', weight)[0]['d'] == 6
+assert cache.info.misses == 6 and cache.info.evictions == 4 and len(cache) == 2
+cache.clear()
+assert len(cache) == 0 and cache.info.hits == 4
+
+try:
+    PathCache(0)
+    assert False
+except ValueError:
+    pass
+
+print('\nPath cache: ', cache.info, 'Runned on the graph: ', repr(graph), sep='\n')
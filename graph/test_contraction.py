@@ -0,0 +1,57 @@
+from tempfile import TemporaryDirectory
+from pathlib import Path
+
+from graph import ContractionHierarchy, Digraph, Graph, VertexError, dijkstra
+
+# Test queries
+
+digraph = Digraph.graph_from({'s', 'x', 'u', 'v', 'y', 'z'},
+                             [('s', 'x', {'weight': 5}), ('s', 'u', {'weight': 10}),
+                              ('x', 'u', {'weight': 3}), ('x', 'y', {'weight': 2}),
+                              ('u', 'x', {'weight': 2}), ('u', 'v', {'weight': 1}),
+                              ('v', 'y', {'weight': 4}), ('y', 's', {'weight': 6}),
+                              ('s', 'y', {'weight': 7}), ('y', 'v', {'weight': 6})])
+weight = lambda d: d['weight']  # noqa: E731
+
+hierarchy = ContractionHierarchy.from_graph(digraph, weight)
+assert len(hierarchy) == 6 and sorted(hierarchy.ranks) == list(range(6))
+for source in digraph.vertices:
+    distance, _ = dijkstra(digraph, source, weight)
+    for target in digraph.vertices:
+        assert hierarchy.distance(source, target) == distance[target]
+
+assert hierarchy.shortest_path('s', 'v') == ({'s': 0, 'x': 5, 'u': 8, 'v': 9}, ['s', 'x', 'u', 'v'])
+assert hierarchy.shortest_path('v', 'x') == ({'v': 0, 'y': 4, 's': 10, 'x': 15},
+                                             ['v', 'y', 's', 'x'])
+assert hierarchy.shortest_path('z', 's') is None and hierarchy.shortest_path('z', 'z')[1] == ['z']
+try:
+    hierarchy.distance('s', 'w')
+    assert False
+except VertexError:
+    pass
+
+# Test shortcuts
+
+path = Graph.graph_from(set(range(10)), [(i, i + 1, {'weight': 1}) for i in range(9)])
+hierarchy = ContractionHierarchy.from_graph(path, weight)
+stats = {}
+assert hierarchy.shortest_path(0, 9, stats)[1] == list(range(10)) and hierarchy.shortcuts() > 0
+assert stats['settled'] < 10
+
+# Test files
+
+with TemporaryDirectory() as directory:
+    hierarchy.save(Path(directory, 'path.ch'))
+    loaded = ContractionHierarchy.load(Path(directory, 'path.ch'))
+    assert loaded.shortest_path(9, 3) == hierarchy.shortest_path(9, 3)
+    assert loaded.labels == hierarchy.labels
+
+    Path(directory, 'bad.ch').write_bytes(b'not a hierarchy')
+    try:
+        ContractionHierarchy.load(Path(directory, 'bad.ch'))
+        assert False
+    except ValueError:
+        pass
+
+print('\nContraction hierarchy: ', hierarchy.shortest_path(0, 9), 'Runned on the graph: ',
+      repr(path), sep='\n')
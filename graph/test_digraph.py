@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 from graph import Digraph
 
 graph = Digraph('Digraph Test')
@@ -57,6 +59,28 @@ assert graph.degree_sequence() == [(0, 1), (1, 1), (3, 2)]
 
 assert graph.neighbours('A') == {'A', 'C'}
 assert graph.is_neighbour('A', 'A') and graph.is_neighbour('A', 'C')
+assert graph.predecessors('A') == {'A', 'B', 'C'} and graph.predecessors('B') == set()
+
+# Test iterators
+
+assert list(graph.iter_edges()) == graph.edges_list() and len(graph.edges_list()) == graph.size()
+assert {u: set(heads) for u, heads in graph.iter_adjacency()} == graph.adjacency_list()
+
+# Test incident edges removal
+
+graph_copy = deepcopy(graph)
+graph_copy.set_edge_data('C', 'A', letters='CA')
+assert graph_copy.in_edges['A']['C'] is graph_copy.edges['C']['A']
+assert graph.get_edge_data('C', 'A')['letters'] == 'ca'
+graph_copy.remove_vertex('A')
+assert graph_copy.size() == 0 and graph_copy.in_edges == {} and graph_copy.edges == {}
+assert graph_copy.in_degree('C') == 0 and graph.in_degree('C') == 1
+
+# Test bulk insertion
+
+bulk = Digraph.graph_from_edges([(0, 1), (1, 2, {'weight': 2}), (2, 1, {'weight': 3})])
+assert list(bulk.vertices) == [0, 1, 2] and bulk.size() == 3
+assert bulk.predecessors(1) == {0, 2} and bulk.get_edge_data(2, 1) == {'weight': 3}
 
 # Test clear
 
@@ -65,3 +89,47 @@ assert graph.size() == 4
 graph.clear()
 assert graph.order() == 0
 assert graph.size() == 0
+
+# Test freeze
+
+graph.add_vertex('A', letter='a')
+graph.add_vertex('B')
+graph.add_vertex('C')
+graph.add_edge('A', 'A', weight=1)
+graph.add_edge('A', 'B', weight=2)
+graph.add_edge('B', 'C', weight=3)
+frozen = graph.freeze()
+assert frozen.order() == 3 and frozen.size() == 3
+assert frozen.is_directed() and frozen.weights is None
+assert frozen.neighbours('B') == {'C'} and frozen.neighbours('C') == set()
+assert frozen.has_edge('B', 'C') and not frozen.has_edge('C', 'B')
+assert frozen.predecessors('A') == {'A'} and frozen.predecessors('C') == {'B'}
+assert sorted(frozen.weighted_predecessors('B', lambda d: d['weight'])) == [('A', 2)]
+assert sorted(frozen.dataless_edges()) == sorted(graph.dataless_edges())
+weight = lambda d: d['weight']  # noqa: E731
+assert frozen.adjacency_matrix(weight) == graph.adjacency_matrix(weight)
+graph.clear()
+
+# Test transaction
+
+graph.add_vertices_from('ABC')
+graph.add_edges_from([('A', 'A'), ('A', 'B', {'weight': 1}), ('C', 'A', {'weight': 2})])
+before = graph.edges_list()
+checkpoint = graph.checkpoint()
+graph.pop_vertex('A')
+graph.add_edges_from([('B', 'C'), ('C', 'B')])
+assert graph.size() == 2 and len(graph.journal) == 6
+graph.rollback(checkpoint)
+assert sorted(graph.edges_list(), key=str) == sorted(before, key=str)
+assert graph.predecessors('A') == {'A', 'C'} and not graph.has_edge('B', 'C')
+graph.commit()
+assert not graph.journal
+graph.clear()
+
+# Test version
+
+version = graph.version
+graph.add_vertices_from('AB')
+graph.add_edge('A', 'B')
+graph.pop_vertex('A')
+assert graph.version == version + 4  # popping a vertex also pops its edges
@@ -1,4 +1,4 @@
-from graph import Graph
+from graph import Graph, VertexError
 
 graph = Graph('Graph Test')
 assert graph.name == 'Graph Test'
@@ -60,6 +60,37 @@ assert graph.degree_sequence() == [1, 1, 4]
 assert graph.neighbours('A') == {'A', 'B', 'C'}
 assert graph.is_neighbour('A', 'A') and graph.is_neighbour('A', 'B')
 
+# Test iterators
+
+assert sorted(graph.iter_edges(data=False), key=str) == sorted(graph.dataless_edges(), key=str)
+assert len(list(graph.iter_edges())) == graph.size()
+assert {u: set(heads) for u, heads in graph.iter_adjacency()} == graph.adjacency_list()
+
+# Test incident edges removal
+
+graph.add_vertex('D')
+graph.add_edge('D', 'A')
+graph.add_edge('D', 'D')
+assert graph.size() == 5 and len(graph.dataless_edges()) == 5
+graph.remove_vertex('D')
+assert graph.size() == 3 and 'D' not in graph.edges and 'D' not in graph.edges['A']
+assert Graph.graph_from_edges([(1, 2), (2, 1), (2, 2), (2, 3, {})]).size() == 3
+
+# Test bulk insertion
+
+bulk = Graph()
+bulk.add_vertices_from(range(4), visited=False)
+bulk.add_edges_from([(0, 1), (1, 2, {'weight': 2}), (2, 1, {'weight': 3}), (3, 3)])
+assert bulk.order() == 4 and bulk.size() == 3
+assert bulk.get_edge_data(1, 2) == {'weight': 3} and bulk.get_vertex_data(0) == {'visited': False}
+bulk.get_vertex_data(0)['visited'] = True
+assert bulk.get_vertex_data(1) == {'visited': False}
+try:
+    bulk.add_edges_from([(0, 2), (0, 4)])
+    assert False
+except VertexError:
+    assert not bulk.has_edge(0, 2)
+
 # Test clear
 
 graph.add_edge('A', 'A')
@@ -67,3 +98,70 @@ assert graph.size() == 3
 graph.clear()
 assert graph.order() == 0
 assert graph.size() == 0
+
+# Test freeze
+
+graph.add_vertex('A', letter='a')
+graph.add_vertex('B')
+graph.add_vertex('C')
+graph.add_edge('A', 'A', weight=1)
+graph.add_edge('A', 'B', weight=2)
+graph.add_edge('B', 'C', weight=3)
+frozen = graph.freeze(lambda d: d['weight'])
+assert frozen.order() == 3 and frozen.size() == 3
+assert not frozen.is_directed()
+assert frozen.neighbours('B') == {'A', 'C'} and frozen.neighbours('A') == {'A', 'B'}
+assert frozen.has_edge('C', 'B') and not frozen.has_edge('A', 'C')
+assert frozen.get_edge_data('B', 'A') is graph.get_edge_data('A', 'B')
+assert frozen.get_vertex_data('A') == {'letter': 'a'}
+assert sorted(frozen.weights) == [1, 2, 2, 3, 3]
+assert frozen.adjacency_list() == graph.adjacency_list()
+graph.add_edge('A', 'C')
+assert frozen.size() == 3  # snapshots aren't affected by later changes
+graph.clear()
+
+# Test transaction
+
+graph.add_vertices_from('ABC')
+graph.add_edge('A', 'B', weight=1)
+graph.add_edge('B', 'C', weight=2)
+weight = lambda d: d['weight']  # noqa: E731
+before = graph.adjacency_matrix(weight)
+with graph.transaction(revert=True):
+    graph.add_vertex('D')
+    graph.add_edge('C', 'D', weight=3)
+    graph.pop_edge('B', 'C')
+    graph.set_edge_data('A', 'B', weight=5)
+    graph.set_vertex_data('A', letter='a')
+    graph.remove_vertex('B')
+    assert [e.operation for e in graph.journal][:3] == ['add_vertex', 'add_edge', 'pop_edge']
+assert graph.adjacency_matrix(weight) == before
+assert graph.size() == 2 and graph.get_edge_data('B', 'A') == {'weight': 1}
+assert graph.get_vertex_data('A') == {} and not graph.journal
+try:
+    with graph.transaction():
+        graph.add_edge('A', 'C')
+        graph.add_edge('A', 'E')
+    assert False
+except VertexError:
+    assert not graph.has_edge('A', 'C')
+checkpoint = graph.checkpoint()
+graph.clear()
+graph.rollback(checkpoint)
+assert graph.size() == 2 and graph.order() == 3
+graph.commit()
+graph.clear()
+
+# Test version
+
+version = graph.version
+graph.add_vertices_from('AB')
+graph.add_edges_from([('A', 'B')])
+graph.set_edge_data('A', 'B', weight=1)
+graph.remove_edge('A', 'B')
+assert graph.version == version + 4
+graph.has_edge('A', 'B')
+graph.get_vertex_data('A')
+assert graph.version == version + 4
+graph.clear()
+assert graph.version == version + 5
@@ -0,0 +1,96 @@
+from tempfile import TemporaryDirectory
+from pathlib import Path
+
+from graph import CSRGraph, Digraph, EdgeAttribute, dijkstra, read_edgelist
+
+with TemporaryDirectory() as directory:
+    # Test whitespace-separated files
+
+    path = Path(directory, 'edges.txt')
+    path.write_text('# u v distance\n1 2 .5\n2 3 1.5 extra\n\n3 1\n')
+
+    progress = []
+    graph = read_edgelist(path, columns=('distance',), converters={'distance': float},
+                          vertex_type=int, chunk_size=2,
+                          progress=lambda lines, edges: progress.append((lines, edges)))
+    assert graph.order() == 3 and graph.size() == 3
+    assert graph.get_edge_data(2, 1) == {'distance': .5}
+    assert graph.get_edge_data(3, 2) == {'distance': 1.5} and graph.get_edge_data(1, 3) == {}
+    assert progress == [(3, 2), (5, 3)]
+
+    # Test csv files
+
+    path = Path(directory, 'edges.csv')
+    path.write_text('a,b,2,red\nb, c,3,"blue, light"\n')
+
+    digraph = read_edgelist(path, Digraph(), ',', ('weight', 'color'), {'weight': int})
+    assert digraph.get_edge_data('b', 'c') == {'weight': 3, 'color': 'blue, light'}
+    assert not digraph.has_edge('b', 'a') and digraph.predecessors('b') == {'a'}
+
+    path.write_text('kiwi fig 1\napple kiwi 2\nplum date 3\nfig cherry 4\n')
+    fruits = read_edgelist(path, chunk_size=2)
+    assert list(fruits.vertices) == ['kiwi', 'fig', 'apple', 'plum', 'date', 'cherry']
+
+    path.write_text('a,b\nc\n')
+    try:
+        read_edgelist(path, delimiter=',')
+        assert False
+    except ValueError as e:
+        assert 'line 2' in str(e)
+
+    # Test binary files
+
+    path = Path(directory, 'graph.bin')
+    graph.set_vertex_data(1, label='one')
+    graph.add_vertex(4)
+    graph.add_edge(3, 4, distance=2, street='main')
+    graph.save(path)
+
+    for mmap in (True, False):
+        loaded = CSRGraph.load(path, mmap=mmap)
+        assert loaded.order() == 4 and loaded.size() == 4 and not loaded.is_directed()
+        assert loaded.get_vertex_data(1) == {'label': 'one'} and loaded.get_vertex_data(4) == {}
+        assert loaded.get_edge_data(4, 3) == {'distance': 2, 'street': 'main'}
+        assert loaded.get_edge_data(1, 3) == {} and 'distance' not in loaded.columns
+        assert loaded.adjacency_list() == graph.adjacency_list()
+
+    digraph.clear()
+    digraph.add_edges_from([('a', 'b', {'weight': 2}), ('b', 'c', {'weight': 3.5})], False)
+    digraph.add_vertices_from(['c', 'a', 'b'])
+    digraph.save(path)
+    loaded = CSRGraph.load(path)
+    assert 'weight' not in loaded.columns  # the ints would come back as floats
+    assert [type(d['weight']) for _, _, d in loaded.edges_list()] == [int, float]
+    assert dijkstra(loaded, 'a', EdgeAttribute('weight')) == dijkstra(digraph, 'a',
+                                                                      lambda d: d['weight'])
+    assert loaded.predecessors('c') == {'b'}
+    del loaded
+
+    digraph.clear()
+    digraph.add_vertices_from(range(6))
+    digraph.add_edges_from([(i, i + 1, {'weight': i, 'name': f'e{i}'}) for i in range(5)])
+    digraph.add_edge(5, 0, weight=2 ** 70, name='e5')
+    digraph.freeze().save(path)
+    copy_path = Path(directory, 'copy.bin')
+    loaded = CSRGraph.load(path)
+    loaded.save(copy_path)  # the loaded snapshots build new data dictionaries on each access
+    assert loaded.edges_list() == digraph.edges_list()
+    del loaded
+    loaded = CSRGraph.load(copy_path)
+    assert loaded.edges_list() == digraph.edges_list() and not loaded.columns
+    assert loaded.get_edge_data(5, 0)['weight'] == 2 ** 70
+    del loaded
+
+    digraph.remove_edge(5, 0)
+    digraph.freeze().save(path)
+    loaded = CSRGraph.load(path)
+    assert loaded.columns['weight'].tolist() == [0, 1, 2, 3, 4]
+    assert all(type(d['weight']) is int for _, _, d in loaded.edges_list())
+    del loaded
+
+    path.write_bytes(b'not a graph')
+    try:
+        CSRGraph.load(path)
+        assert False
+    except ValueError:
+        pass
@@ -0,0 +1,54 @@
+from graph import Digraph, Graph, Landmarks, VertexError, dijkstra, dijkstra_to
+
+# Test tables
+
+digraph = Digraph.graph_from({'s', 'x', 'u', 'v', 'y', 'z'},
+                             [('s', 'x', {'weight': 5}), ('s', 'u', {'weight': 10}),
+                              ('x', 'u', {'weight': 3}), ('x', 'y', {'weight': 2}),
+                              ('u', 'x', {'weight': 2}), ('u', 'v', {'weight': 1}),
+                              ('v', 'y', {'weight': 4}), ('y', 's', {'weight': 6}),
+                              ('s', 'y', {'weight': 7}), ('y', 'v', {'weight': 6})])
+weight = lambda d: d['weight']  # noqa: E731
+
+for strategy in ('farthest', 'avoid'):
+    landmarks = Landmarks(digraph, weight, 3, strategy, seed=0)
+    assert len(landmarks.landmarks) == 3
+    if strategy == 'farthest':
+        assert 'z' in landmarks.landmarks  # the unreachable vertices are the farthest
+    for landmark in landmarks.landmarks:
+        distance, _ = dijkstra(digraph, landmark, weight)
+        assert list(landmarks.distances(landmark)) == [distance[v] for v in landmarks.labels]
+    assert landmarks.distances('none') is None
+
+# Test queries
+
+landmarks = Landmarks(digraph, weight, 2, seed=0)
+for source in digraph.vertices:
+    for target in digraph.vertices:
+        expected = dijkstra_to(digraph, source, target, weight)
+        assert landmarks.shortest_path(source, target) == expected
+        if expected is not None:
+            assert landmarks.lower_bound(source, target) <= expected[0][target]
+try:
+    landmarks.shortest_path('s', 'w')
+    assert False
+except VertexError:
+    pass
+
+path = Graph.graph_from(set(range(10)), [(i, i + 1, {'weight': 1}) for i in range(9)])
+landmarks = Landmarks(path, weight, 1, seed=0)
+stats = {}
+assert landmarks.landmarks in ((0,), (9,)) and landmarks.lower_bound(2, 7) == 5
+assert landmarks.shortest_path(2, 7, stats)[1] == [2, 3, 4, 5, 6, 7] and stats['settled'] == 6
+
+# Test updates
+
+path.add_edge(4, 5, weight=10)
+path.add_edge(0, 9, weight=2)
+landmarks.update([(4, 5), (0, 9)])
+landmark = landmarks.landmarks[0]
+distance, _ = dijkstra(path, landmark, weight)
+assert list(landmarks.distances(landmark)) == [distance[v] for v in landmarks.labels]
+assert landmarks.shortest_path(2, 7) == dijkstra_to(path, 2, 7, weight)
+
+print('\nLandmarks: ', landmarks.landmarks, 'Runned on the graph: ', repr(path), sep='\n')
@@ -0,0 +1,42 @@
+from graph import Graph, Digraph, GraphOverlay, EdgeError, dijkstra_to
+
+graph = Graph.graph_from({1, 2, 3}, [(1, 2, {'distance': 1}), (2, 3, {'distance': 1})])
+overlay = GraphOverlay(graph)
+assert overlay.order() == 3 and overlay.size() == 2 and not overlay.is_directed()
+
+# Test pins
+
+overlay.add_vertex('PIN')
+distance = overlay.pop_edge(1, 2)['distance']
+overlay.add_edge(1, 'PIN', distance=distance * .25)
+overlay.add_edge('PIN', 2, distance=distance * .75)
+assert overlay.order() == 4 and overlay.size() == 3
+assert not overlay.has_edge(2, 1) and overlay.neighbours('PIN') == {1, 2}
+assert dijkstra_to(overlay, 3, 'PIN', lambda d: d['distance'])[1] == [3, 2, 'PIN']
+
+nested = GraphOverlay(overlay)
+nested.remove_vertex('PIN')
+nested.set_edge_data(2, 3, distance=5)
+assert nested.order() == 3 and nested.size() == 1
+nested.add_vertex(1, label='one')  # the vertex is already in the graph
+nested.add_vertex('PIN')
+assert nested.order() == len(nested.vertices) == len(list(nested.vertices)) == 4
+assert nested.get_edge_data(3, 2)['distance'] == 5 and overlay.get_edge_data(3, 2)['distance'] == 1
+
+# the base graphs are never changed
+assert graph.order() == 3 and graph.size() == 2 and graph.has_edge(1, 2)
+assert overlay.has_vertex('PIN')
+
+# Test directed overlays
+
+digraph = Digraph.graph_from({1, 2}, [(1, 2)])
+overlay = GraphOverlay(digraph)
+overlay.add_edge(2, 1)
+overlay.remove_edge(1, 2)
+assert overlay.predecessors(1) == {2} and overlay.predecessors(2) == set()
+assert overlay.edges_list() == [(2, 1, {})] and digraph.edges_list() == [(1, 2, {})]
+try:
+    overlay.remove_edge(1, 2)
+    assert False
+except EdgeError:
+    pass
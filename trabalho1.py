@@ -69,17 +69,16 @@ if __name__ == '__main__':
 
                 Aresta        | Dados/Valor
         """)
-        for u, v, d in graph.edges_list():
+        for u, v, d in graph.iter_edges():
             formated_e = f"{{{u},{v}}}"
             edges_list_str += f"\n{formated_e:^22}| {d}"
         return edges_list_str
 
     def adjacency_list():
-        _adjacency_list = graph.adjacency_list()
         adjacency_list_str = ">> Lista de adjacência\n"
-        for u in _adjacency_list:
+        for u, adjacent_vertices in graph.iter_adjacency():
             adjacency_list_str += f"\n{u} --> " \
-                                  f"{' -> '.join(str(v) for v in _adjacency_list[u])}"
+                                  f"{' -> '.join(str(v) for v in adjacent_vertices)}"
         return adjacency_list_str
 
     def adjacency_matrix():
@@ -100,16 +99,14 @@ if __name__ == '__main__':
         return adjacency_matrix_str
 
     def incidency_matrix():
-        _incidency_matrix = {}
-        _edges_list = graph.edges_list()
         incidency_matrix_str = dedent(f"""
         >> Matriz de incidência
 
-                   {"".join(f'{f"{{{u},{v}}}":^22}' for u, v, _ in _edges_list)}
+                   {"".join(f'{f"{{{u},{v}}}":^22}' for u, v in graph.iter_edges(data=False))}
         """)
         for x in sorted(graph.vertices):
             incidency_matrix_str += f"\n{str(x):^11}"
-            for u, v, d in _edges_list:
+            for u, v in graph.iter_edges(data=False):
                 if directed:
                     incidency_matrix_str += \
                         f"{1 if x == u else -1 if x == v else 0:^22}"
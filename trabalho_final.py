@@ -1,53 +1,12 @@
-from typing import Hashable, Tuple
-
 from textwrap import dedent
-from copy import deepcopy
 from time import sleep
 from ast import literal_eval
 from re import compile as re_compile
 
-from graph import BaseGraph, Graph, dijkstra, dijkstra_to
+from graph import Graph, iter_nearest, shortest_path
 from utils import ask_true_false_br
 
 
-def add_pin_in_map(graph_map: BaseGraph, pin: Hashable,
-                   pin_coords: Tuple[Hashable, Hashable, float]):
-    """Adds a pin (vertex) in the map (graph).
-
-    Args:
-        graph_map: The map (graph) to insert the pin (vertex).
-        pin: The pin (vertex).
-        pin_coords:
-            The coordinates of the pin (vertex) in the map (graph).
-            The coordinates must be composed of a tuple with 3 values:
-            1th interchange (vertex u), 2nd interchange (vertex v)
-            and a percentage indicating where in the street between the
-            1th and 2nd interchange the pin (vertex) must be inserted.
-
-    Raises:
-        VertexError:
-            Raises when a interchange (vertex) isn't in the map (graph).
-        EdgeError:
-            Raises when an street (edge) isn't in the map (graph).
-    """
-    graph_map.add_vertex(pin)
-
-    coord_u, coord_v, coord_percentage = pin_coords
-
-    # normalize percentage
-    coord_percentage = (coord_percentage == 0 and .001
-                        or coord_percentage == 1 and .999
-                        or coord_percentage)
-
-    street_distance = graph_map.pop_edge(coord_u, coord_v)['distance']
-
-    street_distance_u = street_distance * coord_percentage
-    street_distance_v = street_distance - street_distance_u
-
-    graph_map.add_edge(coord_u, pin, distance=street_distance_u)
-    graph_map.add_edge(pin, coord_v, distance=street_distance_v)
-
-
 client_info_re = re_compile(r'([^,]+)(?:,)([^,]+)(?:,)([^,]+)(?:,)([^,]+)(?:,)([^,]+)(?:,)([^,]+)')
 
 if __name__ == '__main__':
@@ -134,8 +93,6 @@ if __name__ == '__main__':
 
     # CLIENTS REQUESTS
     while ask_true_false_br("Alguma solicitação de viagem nova? (s/n) "):
-        client_graph = deepcopy(graph)
-
         client = None
         while client is None:
             # noinspection PyTypeChecker,PyRedeclaration
@@ -150,17 +107,16 @@ if __name__ == '__main__':
                 print("\nFormato inválido.")
 
             # verify if each interchange exists
-            elif (not client_graph.has_vertex(arg := client_info[0])
-                    or not client_graph.has_vertex(arg := client_info[1])
-                    or not client_graph.has_vertex(arg := client_info[3])
-                    or not client_graph.has_vertex(arg := client_info[4])):
+            elif (not graph.has_vertex(arg := client_info[0])
+                    or not graph.has_vertex(arg := client_info[1])
+                    or not graph.has_vertex(arg := client_info[3])
+                    or not graph.has_vertex(arg := client_info[4])):
 
                 print(f"\nO cruzamento {arg} não existe no mapa.")
 
             # verify if each street exists
-            elif (not client_graph.has_edge((edge := (client_info[0], client_info[1]))[0], edge[1])
-                  or not client_graph.has_edge((edge := (client_info[3], client_info[4]))[0],
-                                               edge[1])):
+            elif (not graph.has_edge((edge := (client_info[0], client_info[1]))[0], edge[1])
+                  or not graph.has_edge((edge := (client_info[3], client_info[4]))[0], edge[1])):
 
                 print(f"\nNão existe uma rua entre os cruzamentos {{{edge[0]}, {edge[1]}}}")
 
@@ -172,9 +128,6 @@ if __name__ == '__main__':
 
                 client = {'location': client_info[:3], 'destination': client_info[3:]}
 
-        # insert client's location in the graph
-        add_pin_in_map(client_graph, 'CLIENTE', client['location'])
-
         # available drivers
         drivers = {
             # the driver's location is composed of: vertex u, vertex v and
@@ -185,43 +138,39 @@ if __name__ == '__main__':
             'D': {'location': (37, 38, .9)},
         }
 
+        # the drivers closest to the client, one at a time, the search continues after a refusal
+        # (the streets are two-way, so the paths from the client are the drivers' paths reversed)
+        nearest_drivers = iter_nearest(graph, client['location'],
+                                       {d: data['location'] for d, data in drivers.items()},
+                                       lambda s: s['distance'])
+
         driver = None
-        while driver is None:
-            drivers_graph = deepcopy(client_graph)
-            for driver_v, driver_data in drivers.items():
-                add_pin_in_map(drivers_graph, driver_v, driver_data['location'])
-
-            if drivers:
-                distance, parents = dijkstra(drivers_graph, 'CLIENTE', lambda s: s['distance'])
-                temp_driver = driver_id = min(drivers, key=lambda d: distance[d])
-
-                if ask_true_false_br(f"\nO motorista {driver_id} aceita a viagem do cliente de "
-                                     f"{client['location']} para {client['destination']}\ncom uma "
-                                     f"distância de {distance[temp_driver]:.3f} km ? (s/n) "):
-                    driver = {
-                        'client_distance': distance[temp_driver],
-                        'client_path': [temp_driver]
-                    }
-
-                    # backtracking path from driver to client
-                    while temp_driver != 'CLIENTE':
-                        driver['client_path'].append(temp_driver := parents[temp_driver])
-
-                    print(f"\nO motorista {driver_id} fez o menor trajeto para chegar ao cliente:"
-                          f"\n{' -> '.join(map(str, driver['client_path']))};"
-                          f"\ncom uma distância total percorrida de "
-                          f"{driver['client_distance']:.3f} km.")
-                else:
-                    del drivers[temp_driver]
-            else:
-                print("\nNão há motoristas na àrea do cliente que possam atendê-lo.\n")
+        for driver_id, cost, path in nearest_drivers:
+            client_distance = cost[path[-1]]
+
+            if ask_true_false_br(f"\nO motorista {driver_id} aceita a viagem do cliente de "
+                                 f"{client['location']} para {client['destination']}\ncom uma "
+                                 f"distância de {client_distance:.3f} km ? (s/n) "):
+                path[0], path[-1] = 'CLIENTE', driver_id
+                driver = {
+                    'client_distance': client_distance,
+                    'client_path': path[::-1]
+                }
+
+                print(f"\nO motorista {driver_id} fez o menor trajeto para chegar ao cliente:"
+                      f"\n{' -> '.join(map(str, driver['client_path']))};"
+                      f"\ncom uma distância total percorrida de "
+                      f"{driver['client_distance']:.3f} km.")
                 break
-        else:
-            add_pin_in_map(client_graph, 'DESTINO', client['destination'])
 
+        if driver is None:
+            print("\nNão há motoristas na àrea do cliente que possam atendê-lo.\n")
+        else:
             # calculate the shortest path from the client's location to his destination
-            cost, path = dijkstra_to(client_graph, 'CLIENTE', 'DESTINO', lambda s: s['distance'])
+            cost, path = shortest_path(graph, client['location'], client['destination'],
+                                       lambda s: s['distance'])
+            path[0], path[-1] = 'CLIENTE', 'DESTINO'
 
             print("\nO menor caminho entre a localização atual do cliente e seu destino é:\n"
                   f"{' -> '.join(map(str, path))}\n"
-                  f"com uma distância total de {sum(cost.values()):.3f} km.\n")
+                  f"com uma distância total de {cost[client['destination']]:.3f} km.\n")